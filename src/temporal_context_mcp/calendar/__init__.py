@@ -0,0 +1,9 @@
+from temporal_context_mcp.calendar.domain.calendar import Calendar
+from temporal_context_mcp.calendar.domain.port.calendar_repository import (
+    CalendarRepository,
+)
+from temporal_context_mcp.calendar.infrastructure.calendar_repository_impl import (
+    CalendarRepositoryImpl,
+)
+
+__all__ = ["Calendar", "CalendarRepository", "CalendarRepositoryImpl"]
@@ -0,0 +1,20 @@
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+from temporal_context_mcp.shared import DateOrdinalSet
+
+
+class Calendar(BaseModel):
+    """Reusable set of dates (holidays, vacations, blackout ranges)"""
+
+    id: str = Field(..., description="Calendar ID")
+    name: str = Field(..., description="Calendar name")
+    dates: list[date] = Field(default=[], description="Single dates")
+    ranges: list[tuple[date, date]] = Field(
+        default=[],
+        description="Inclusive date ranges",
+    )
+
+    def to_date_set(self) -> DateOrdinalSet:
+        return DateOrdinalSet(dates=self.dates, ranges=self.ranges)
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+from temporal_context_mcp.calendar.domain.calendar import Calendar
+from temporal_context_mcp.shared import DateOrdinalSet
+
+
+class CalendarRepository(ABC):
+    @abstractmethod
+    def find(self) -> list[Calendar]:
+        """Lists all calendars"""
+
+    @abstractmethod
+    def find_date_sets(self) -> dict[str, DateOrdinalSet]:
+        """Gets the compiled dates of every calendar by ID"""
+
+    @abstractmethod
+    def save(self, calendar: Calendar) -> bool:
+        """Adds or replaces a calendar"""
+
+    @abstractmethod
+    def delete_one_by_id(self, calendar_id: str) -> bool:
+        """Deletes a calendar"""
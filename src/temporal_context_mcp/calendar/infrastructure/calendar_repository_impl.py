@@ -0,0 +1,82 @@
+from pathlib import Path
+from typing import override
+
+from temporal_context_mcp.calendar import Calendar, CalendarRepository
+from temporal_context_mcp.core import Settings
+from temporal_context_mcp.shared import (
+    DateOrdinalSet,
+    JsonFileStore,
+    default_false,
+)
+
+
+class CalendarRepositoryImpl(CalendarRepository):
+    def __init__(self, settings: Settings) -> None:
+        self.data_dir = Path(settings.data_dir)
+        self.data_dir.mkdir(exist_ok=True)
+        self.calendars_file = self.data_dir / settings.calendars_file_name
+        self.__store = JsonFileStore(self.calendars_file)
+        self.calendars: dict[str, Calendar] = {}
+        self.date_sets: dict[str, DateOrdinalSet] = {}
+        self.__refresh()
+
+    @override
+    def find(self) -> list[Calendar]:
+        self.__refresh()
+        return list(self.calendars.values())
+
+    @override
+    def find_date_sets(self) -> dict[str, DateOrdinalSet]:
+        self.__refresh()
+        return self.date_sets
+
+    @override
+    @default_false
+    def save(self, calendar: Calendar) -> bool:
+        with self.__store.lock():
+            self.__refresh()
+            self.calendars[calendar.id] = calendar
+            self.date_sets = {**self.date_sets, calendar.id: calendar.to_date_set()}
+            self.__save_calendars()
+        return True
+
+    @override
+    def delete_one_by_id(self, calendar_id: str) -> bool:
+        with self.__store.lock():
+            self.__refresh()
+            if self.calendars.pop(calendar_id, None) is None:
+                return False
+            self.date_sets = {
+                key: value
+                for key, value in self.date_sets.items()
+                if key != calendar_id
+            }
+            self.__save_calendars()
+        return True
+
+    def __refresh(self) -> None:
+        """Reloads calendars only if another process changed the file"""
+        if self.__store.has_changed() and self.__store.exists():
+            self.__load_calendars()
+
+    def __load_calendars(self) -> None:
+        """Loads calendars from the JSON file"""
+        try:
+            calendars = [Calendar.model_validate(item) for item in self.__store.read()]
+        except Exception as e:
+            print(f"Error loading calendars: {e}")
+            calendars = []
+        self.calendars = {calendar.id: calendar for calendar in calendars}
+        self.date_sets = {calendar.id: calendar.to_date_set() for calendar in calendars}
+
+    def __save_calendars(self) -> None:
+        """Saves calendars to the JSON file"""
+        try:
+            self.__store.write(
+                [
+                    calendar.model_dump(mode="json")
+                    for calendar in self.calendars.values()
+                ],
+            )
+        except Exception as e:
+            print(f"Error saving calendars: {e}")
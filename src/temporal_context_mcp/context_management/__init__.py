@@ -1,9 +1,21 @@
+from temporal_context_mcp.context_management.domain.port.calendar_repository import (
+    CalendarRepository,
+)
 from temporal_context_mcp.context_management.domain.port.recommendation_repository import (
     RecommendationRepository,
 )
 from temporal_context_mcp.context_management.domain.port.temporal_context_repository import (
     TemporalContextRepository,
 )
+from temporal_context_mcp.context_management.domain.port.usage_history_repository import (
+    UsageHistoryRepository,
+)
+from temporal_context_mcp.context_management.infrastructure.calendar_repository import (
+    CalendarRepositoryImpl,
+)
+from temporal_context_mcp.context_management.infrastructure.context_change_scheduler import (
+    ContextChangeScheduler,
+)
 from temporal_context_mcp.context_management.infrastructure.controller import Controller
 from temporal_context_mcp.context_management.infrastructure.recommendation_repository import (
     RecommendationRepositoryImpl,
@@ -11,11 +23,19 @@ from temporal_context_mcp.context_management.infrastructure.recommendation_repos
 from temporal_context_mcp.context_management.infrastructure.temporal_context_repository_impl import (
     TemporalContextRepositoryImpl,
 )
+from temporal_context_mcp.context_management.infrastructure.usage_history_repository_impl import (
+    UsageHistoryRepositoryImpl,
+)
 
 __all__ = [
+    "CalendarRepository",
+    "CalendarRepositoryImpl",
+    "ContextChangeScheduler",
     "Controller",
     "RecommendationRepository",
     "RecommendationRepositoryImpl",
     "TemporalContextRepository",
     "TemporalContextRepositoryImpl",
+    "UsageHistoryRepository",
+    "UsageHistoryRepositoryImpl",
 ]
@@ -1,19 +1,51 @@
 from temporal_context_mcp.context_management.application.delete_temporal_context import (
     DeleteTemporalContext,
 )
+from temporal_context_mcp.context_management.application.find_context_transition import (
+    FindContextTransition,
+)
+from temporal_context_mcp.context_management.application.find_context_usage import (
+    FindContextUsage,
+)
 from temporal_context_mcp.context_management.application.find_current_temporal_context import (
     FindCurrentTemporalContext,
 )
+from temporal_context_mcp.context_management.application.find_schedule_occupancy import (
+    FindScheduleOccupancy,
+)
 from temporal_context_mcp.context_management.application.find_temporal_context import (
     FindTemporalContext,
 )
+from temporal_context_mcp.context_management.application.find_top_temporal_contexts import (
+    FindTopTemporalContexts,
+)
+from temporal_context_mcp.context_management.application.overlay_temporal_context_repository import (
+    OverlayTemporalContextRepository,
+)
 from temporal_context_mcp.context_management.application.save_temporal_context import (
     SaveTemporalContext,
 )
+from temporal_context_mcp.context_management.application.save_temporal_contexts_bulk import (
+    SaveTemporalContextsBulk,
+)
+from temporal_context_mcp.context_management.application.search_temporal_contexts import (
+    SearchTemporalContexts,
+)
+from temporal_context_mcp.context_management.application.simulate_schedule import (
+    SimulateSchedule,
+)
 
 __all__ = [
     "DeleteTemporalContext",
+    "FindContextTransition",
+    "FindContextUsage",
     "FindCurrentTemporalContext",
+    "FindScheduleOccupancy",
     "FindTemporalContext",
+    "FindTopTemporalContexts",
+    "OverlayTemporalContextRepository",
     "SaveTemporalContext",
+    "SaveTemporalContextsBulk",
+    "SearchTemporalContexts",
+    "SimulateSchedule",
 ]
@@ -1,13 +1,22 @@
 from temporal_context_mcp.context_management.domain import (
     TemporalContextRepository,
+    UsageHistoryRepository,
 )
 
 
 class DeleteTemporalContext:
-    def __init__(self, temporal_context_repository: TemporalContextRepository) -> None:
+    def __init__(
+        self,
+        temporal_context_repository: TemporalContextRepository,
+        usage_history_repository: UsageHistoryRepository,
+    ) -> None:
         self.temporal_context_repository = temporal_context_repository
+        self.usage_history_repository = usage_history_repository
 
     def execute(self, *, context_id: str) -> bool:
-        return self.temporal_context_repository.delete_one_by_id(
+        deleted = self.temporal_context_repository.delete_one_by_id(
             context_id=context_id,
         )
+        if deleted:
+            self.usage_history_repository.delete_by_context_id(context_id)
+        return deleted
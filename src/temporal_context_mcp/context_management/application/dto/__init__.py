@@ -1,8 +1,47 @@
+from temporal_context_mcp.context_management.application.dto.context_search_result_dto import (
+    ContextSearchHitDto,
+    ContextSearchResultDto,
+)
+from temporal_context_mcp.context_management.application.dto.context_transition_dto import (
+    ContextTransitionDto,
+)
+from temporal_context_mcp.context_management.application.dto.context_usage_result_dto import (
+    ContextUsageResultDto,
+)
+from temporal_context_mcp.context_management.application.dto.not_modified_result_dto import (
+    NotModifiedResultDto,
+)
 from temporal_context_mcp.context_management.application.dto.save_temporal_context_dto import (
     SaveTemporalContextDto,
 )
+from temporal_context_mcp.context_management.application.dto.save_temporal_contexts_bulk_result_dto import (
+    BulkItemErrorDto,
+    SaveTemporalContextsBulkResultDto,
+)
+from temporal_context_mcp.context_management.application.dto.schedule_occupancy_dto import (
+    ContextOccupancyDto,
+    ScheduleOccupancyDto,
+)
+from temporal_context_mcp.context_management.application.dto.schedule_simulation_dto import (
+    ScheduleSimulationDto,
+    SimulatedMomentDto,
+)
 from temporal_context_mcp.context_management.application.dto.temporal_context_result_dto import (
     TemporalContextResultDto,
 )
 
-__all__ = ["SaveTemporalContextDto", "TemporalContextResultDto"]
+__all__ = [
+    "BulkItemErrorDto",
+    "ContextOccupancyDto",
+    "ContextSearchHitDto",
+    "ContextSearchResultDto",
+    "ContextTransitionDto",
+    "ContextUsageResultDto",
+    "NotModifiedResultDto",
+    "SaveTemporalContextDto",
+    "SaveTemporalContextsBulkResultDto",
+    "ScheduleOccupancyDto",
+    "ScheduleSimulationDto",
+    "SimulatedMomentDto",
+    "TemporalContextResultDto",
+]
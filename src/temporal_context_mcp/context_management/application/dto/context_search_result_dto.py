@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+
+from temporal_context_mcp.shared import ContextType
+
+
+class ContextSearchHitDto(BaseModel):
+    id: str = Field(..., description="Temporal Context ID")
+    name: str = Field(..., description="Temporal context name")
+    context_type: ContextType = Field(..., description="Temporal context type")
+    priority: int = Field(..., description="Priority")
+    active: bool = Field(..., description="Whether the context is enabled")
+    score: float = Field(..., description="Relevance, higher is better")
+
+
+class ContextSearchResultDto(BaseModel):
+    total: int = Field(default=0, description="Contexts matching the query")
+    offset: int = Field(default=0, description="Position of the first hit")
+    hits: list[ContextSearchHitDto] = Field(
+        default=[],
+        description="Matching contexts, best first",
+    )
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ContextTransitionDto(BaseModel):
+    context_id: str | None = Field(
+        default=None,
+        description="ID of the currently active temporal context",
+    )
+    changes_at: datetime | None = Field(
+        default=None,
+        description="Next moment the active contexts change, if within the horizon",
+    )
+    version: int | None = Field(
+        default=None,
+        description="Version of the current context, as in get_current_context",
+    )
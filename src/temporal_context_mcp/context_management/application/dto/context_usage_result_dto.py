@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ContextUsageResultDto(BaseModel):
+    context_id: str = Field(..., description="Temporal Context ID")
+    total_uses: int = Field(default=0, description="Usages kept in the history")
+    first_used: datetime | None = Field(default=None, description="Oldest usage kept")
+    last_used: datetime | None = Field(default=None, description="Newest usage")
+    uses_per_day: dict[str, int] = Field(
+        default={},
+        description="Usages per day (YYYY-MM-DD)",
+    )
+    hour_of_week: list[list[int]] = Field(
+        default=[],
+        description="Usages per weekday (0=Sunday) and hour, 7x24",
+    )
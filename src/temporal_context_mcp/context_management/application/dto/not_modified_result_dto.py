@@ -0,0 +1,11 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class NotModifiedResultDto(BaseModel):
+    not_modified: Literal[True] = Field(
+        default=True,
+        description="The cached result with this version is still current",
+    )
+    version: int = Field(..., description="Current version")
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 from temporal_context_mcp.shared import ContextType, TimePattern
@@ -12,3 +14,11 @@ class SaveTemporalContextDto(BaseModel):
     )
     time_pattern: TimePattern = Field(..., description="Temporal context time_pattern")
     priority: int = Field(default=1, description="Priority")
+    valid_from: datetime | None = Field(
+        default=None,
+        description="The context does not match before this date/time",
+    )
+    expires_at: datetime | None = Field(
+        default=None,
+        description="The context stops matching and is archived at this date/time",
+    )
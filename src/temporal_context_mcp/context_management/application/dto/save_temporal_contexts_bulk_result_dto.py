@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+
+class BulkItemErrorDto(BaseModel):
+    index: int | None = Field(default=None, description="Position in the batch")
+    id: str | None = Field(default=None, description="Temporal Context ID")
+    message: str = Field(..., description="Error description")
+
+
+class SaveTemporalContextsBulkResultDto(BaseModel):
+    saved: list[str] = Field(default=[], description="Upserted context IDs")
+    deleted: list[str] = Field(default=[], description="Deleted context IDs")
+    errors: list[BulkItemErrorDto] = Field(
+        default=[],
+        description="Items that were skipped",
+    )
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from temporal_context_mcp.shared import ContextType
+
+
+class ContextOccupancyDto(BaseModel):
+    context_id: str = Field(..., description="Temporal Context ID")
+    context_type: ContextType = Field(..., description="Context type")
+    priority: int = Field(..., description="Context priority")
+    active_minutes: int = Field(default=0, description="Minutes per week it matches")
+    winning_minutes: int = Field(
+        default=0,
+        description="Minutes per week it wins the resolution",
+    )
+    shadowed_minutes: int = Field(
+        default=0,
+        description="Minutes per week it matches but another context wins",
+    )
+
+
+class ScheduleOccupancyDto(BaseModel):
+    week_start: datetime = Field(..., description="Sunday starting the analyzed week")
+    covered_minutes: int = Field(
+        default=0,
+        description="Minutes per week with at least one active context",
+    )
+    contested_minutes: int = Field(
+        default=0,
+        description="Minutes per week with more than one active context",
+    )
+    tie_break_minutes: int = Field(
+        default=0,
+        description="Contested minutes won by creation date, not by priority",
+    )
+    context_types: dict[ContextType, int] = Field(
+        default={},
+        description="Minutes per week with an active context of each type",
+    )
+    contexts: list[ContextOccupancyDto] = Field(
+        default=[],
+        description="Active contexts in resolution order",
+    )
+    unreachable_context_ids: list[str] = Field(
+        default=[],
+        description="Contexts that match some minute but never win",
+    )
+    winners: list[list[str | None]] = Field(
+        default=[],
+        description="Context winning most minutes per weekday (0=Sunday) and hour",
+    )
+    coverage: list[list[int]] = Field(
+        default=[],
+        description="Covered minutes per weekday (0=Sunday) and hour, 7x24",
+    )
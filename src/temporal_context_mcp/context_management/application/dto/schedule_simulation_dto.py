@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from temporal_context_mcp.context_management.application.dto.save_temporal_contexts_bulk_result_dto import (  # noqa: E501
+    BulkItemErrorDto,
+)
+from temporal_context_mcp.context_management.application.dto.schedule_occupancy_dto import (  # noqa: E501
+    ScheduleOccupancyDto,
+)
+
+
+class SimulatedMomentDto(BaseModel):
+    at: datetime = Field(..., description="Simulated date/time")
+    context_id: str | None = Field(
+        default=None,
+        description="Context that would win the resolution with the changes",
+    )
+    active_context_ids: list[str] = Field(
+        default=[],
+        description="Contexts that would be active, in resolution order",
+    )
+    current_context_id: str | None = Field(
+        default=None,
+        description="Context winning the resolution without the changes",
+    )
+    changed: bool = Field(
+        default=False,
+        description="Whether the changes alter the winning context",
+    )
+
+
+class ScheduleSimulationDto(BaseModel):
+    saved: list[str] = Field(default=[], description="Simulated upserted context IDs")
+    deleted: list[str] = Field(default=[], description="Simulated deleted context IDs")
+    errors: list[BulkItemErrorDto] = Field(
+        default=[],
+        description="Items that were left out of the simulation",
+    )
+    moments: list[SimulatedMomentDto] = Field(
+        default=[],
+        description="Resolution at each requested date/time",
+    )
+    occupancy: ScheduleOccupancyDto | None = Field(
+        default=None,
+        description="Weekly occupancy with the changes, if requested",
+    )
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -14,7 +15,19 @@ class TemporalContextResultDto(BaseModel):
     )
     time_pattern: TimePattern = Field(..., description="Temporal context time_pattern")
     priority: int = Field(default=1, description="Priority")
+    valid_from: datetime | None = Field(
+        default=None,
+        description="Start of the validity of the context",
+    )
+    expires_at: datetime | None = Field(
+        default=None,
+        description="When the context expires",
+    )
     recommendation: dict[str, Any] = Field(
         default={},
         description="Temporal context recommendation",
     )
+    version: int | None = Field(
+        default=None,
+        description="Version of the current context, for conditional requests",
+    )
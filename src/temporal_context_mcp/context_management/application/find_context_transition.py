@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from temporal_context_mcp.context_management.application.dto import (
+    ContextTransitionDto,
+)
+from temporal_context_mcp.context_management.application.find_schedule_occupancy import (  # noqa: E501
+    FindScheduleOccupancy,
+)
+from temporal_context_mcp.shared import get_current_datetime
+from temporal_context_mcp.shared.application.week_mask import (
+    DAYS_IN_WEEK,
+    PROBE_SECOND,
+    get_minute_of_week,
+    get_week_start,
+)
+
+
+class FindContextTransition:
+    """Finds the next minute the active contexts change
+
+    Which contexts are active in every minute of the week comes from the
+    minute-of-week bitmaps of `FindScheduleOccupancy`, so the horizon is scanned
+    with a single comparison per week instead of resolving the contexts minute
+    by minute. Any change counts, not only a different winner, as the current
+    context also merges the recommendations of the others.
+    """
+
+    def __init__(
+        self,
+        find_schedule_occupancy: FindScheduleOccupancy,
+        horizon: timedelta = timedelta(days=1),
+    ) -> None:
+        self.find_schedule_occupancy = find_schedule_occupancy
+        self.horizon = horizon
+
+    def execute(self, *, since: datetime | None = None) -> ContextTransitionDto:
+        """Finds the winning context and the next minute the active ones change"""
+        since = since or get_current_datetime()
+        week_start = get_week_start(since)
+        contexts, active_minutes = self.find_schedule_occupancy.find_active_minutes(
+            week_start=week_start,
+        )
+        # Contexts come in resolution order, so the first active one wins
+        active_ids = [
+            context.id
+            for context, active in zip(
+                contexts,
+                active_minutes[:, get_minute_of_week(since, week_start)],
+                strict=True,
+            )
+            if active
+        ]
+        return ContextTransitionDto(
+            context_id=active_ids[0] if active_ids else None,
+            changes_at=self.find_active_change(active_ids=active_ids, since=since),
+        )
+
+    def find_active_change(
+        self,
+        *,
+        active_ids: list[str],
+        since: datetime | None = None,
+    ) -> datetime | None:
+        """Finds the next minute the active contexts are no longer `active_ids`
+
+        None if they stay the same up to the horizon.
+        """
+        since = since or get_current_datetime()
+        until = since + self.horizon
+        week_start = get_week_start(since)
+        minute = get_minute_of_week(_get_next_probe(since), week_start)
+        while week_start <= until:
+            contexts, active_minutes = self.find_schedule_occupancy.find_active_minutes(
+                week_start=week_start,
+            )
+            expected = np.isin([context.id for context in contexts], active_ids)
+            changes = np.flatnonzero(
+                (active_minutes[:, minute:] != expected[:, None]).any(axis=0),
+            )
+            if changes.size:
+                changes_at = week_start + timedelta(
+                    minutes=minute + int(changes[0]),
+                    seconds=PROBE_SECOND,
+                )
+                return changes_at if changes_at <= until else None
+
+            week_start += timedelta(days=DAYS_IN_WEEK)
+            minute = 0
+        return None
+
+
+def _get_next_probe(since: datetime) -> datetime:
+    """First minute probe after `since`
+
+    Minutes are probed one second in, as cron patterns match the minute before
+    each run.
+    """
+    probe = since.replace(second=PROBE_SECOND, microsecond=0)
+    if probe <= since:
+        probe += timedelta(minutes=1)
+    return probe
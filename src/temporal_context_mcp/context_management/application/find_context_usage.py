@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+
+from dateutil import tz
+
+from temporal_context_mcp.context_management.application.dto import (
+    ContextUsageResultDto,
+)
+from temporal_context_mcp.context_management.domain import UsageHistoryRepository
+from temporal_context_mcp.shared import get_current_datetime
+
+
+class FindContextUsage:
+    def __init__(self, usage_history_repository: UsageHistoryRepository) -> None:
+        self.usage_history_repository = usage_history_repository
+
+    def execute(self, *, context_id: str, days: int = 7) -> ContextUsageResultDto:
+        history = self.usage_history_repository.find_by_context_id(context_id)
+        if history is None or len(history) == 0:
+            return ContextUsageResultDto(context_id=context_id)
+
+        timestamps = list(history)
+        since = get_current_datetime().replace(
+            hour=0,
+            minute=0,
+            second=0,
+            microsecond=0,
+        ) - timedelta(days=days - 1)
+        return ContextUsageResultDto(
+            context_id=context_id,
+            total_uses=len(timestamps),
+            first_used=datetime.fromtimestamp(timestamps[0], tz.tzlocal()),
+            last_used=datetime.fromtimestamp(timestamps[-1], tz.tzlocal()),
+            uses_per_day=history.uses_per_day(since=since),
+            hour_of_week=history.hour_of_week_histogram(),
+        )
@@ -1,13 +1,29 @@
+import threading
+import time
+from datetime import datetime
+from typing import Any
+
 from temporal_context_mcp.context_management import (
     RecommendationRepository,
     TemporalContextRepository,
+    UsageHistoryRepository,
 )
 from temporal_context_mcp.context_management.application.dto import (
+    NotModifiedResultDto,
     TemporalContextResultDto,
 )
+from temporal_context_mcp.context_management.application.find_context_transition import (  # noqa: E501
+    FindContextTransition,
+)
 from temporal_context_mcp.context_management.application.find_temporal_context import (
     FindTemporalContext,
 )
+from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.shared import (
+    ProjectedModel,
+    Projection,
+    get_current_datetime,
+)
 
 
 class FindCurrentTemporalContext:
@@ -16,23 +32,128 @@ class FindCurrentTemporalContext:
         temporal_context_repository: TemporalContextRepository,
         recommendation_repository: RecommendationRepository,
         find_temporal_context: FindTemporalContext,
+        usage_history_repository: UsageHistoryRepository,
+        find_context_transition: FindContextTransition | None = None,
     ) -> None:
         self.__ctx_repository = temporal_context_repository
         self.__recommendation_repository = recommendation_repository
         self.__find_temporal_context = find_temporal_context
+        self.__usage_history_repository = usage_history_repository
+        self.__find_context_transition = find_context_transition
+        # Active contexts of the current schedule segment, for one context version
+        self.__active_contexts: list[TemporalContext] = []
+        self.__active_key: tuple[int, datetime] | None = None
+        # Seeded from the clock so versions keep increasing across restarts
+        self.__version = time.time_ns() // 1000
+        self.__version_key: tuple[int, int, tuple[str, ...]] | None = None
+        self.__version_lock = threading.Lock()
+        # Merged recommendations per active set, for the current versions only
+        self.__merged_recommendations: dict[tuple[str, ...], dict[str, Any]] = {}
+        self.__merged_versions: tuple[int, int] | None = None
+
+    def execute(
+        self,
+        *,
+        if_none_match: int | None = None,
+        projection: Projection | None = None,
+    ) -> TemporalContextResultDto | ProjectedModel | NotModifiedResultDto | None:
+        """Resolves the current context, or only its version if it is unchanged
 
-    def execute(self) -> TemporalContextResultDto | None:
-        active_contexts = self.__find_temporal_context.execute(actives=True)
-        sorted_contexts = sorted(active_contexts, key=lambda x: x.priority)
-        if len(sorted_contexts) == 0:
+        With a projection, the context is projected straight into its fields.
+        """
+        active_contexts = self.__find_active_contexts()
+        signature = tuple(context.id for context in active_contexts)
+        version = self.__resolve_version(signature)
+        if len(active_contexts) == 0:
             return None
+        # Checked before merging, recording usage or serializing anything
+        if version == if_none_match:
+            return NotModifiedResultDto(version=version)
 
-        first_active_context = sorted_contexts[0]
-        recommendation = self.__recommendation_repository.find_by_context_type(
-            first_active_context.context_type,
+        first_active_context = active_contexts[0]
+        recommendation = self.__find_merged_recommendation(signature, active_contexts)
+        # Kept apart from the contexts, so resolving never rewrites their files
+        self.__usage_history_repository.record(
+            first_active_context.id,
+            get_current_datetime(),
         )
-        self.__ctx_repository.mark_one_as_used(first_active_context.id)
+        if projection is not None:
+            return projection.dump(
+                first_active_context,
+                recommendation=recommendation or {},
+                version=version,
+            )
         return TemporalContextResultDto(
-            recommendation=recommendation,
+            recommendation=recommendation or {},
+            version=version,
             **first_active_context.model_dump(),
         )
+
+    def find_version(self) -> int:
+        """Resolves only the version of the current context
+
+        Nothing is merged or recorded, so watching the version for changes does
+        not count as using the context.
+        """
+        active_contexts = self.__find_active_contexts()
+        return self.__resolve_version(tuple(context.id for context in active_contexts))
+
+    def __find_active_contexts(self) -> list[TemporalContext]:
+        """Scans the active contexts once per schedule segment
+
+        Without a transition finder every call scans them. Otherwise the scan is
+        kept until the week bitmaps show a change to the active set, or until
+        the contexts or calendars change.
+        """
+        if self.__find_context_transition is None:
+            return self.__find_temporal_context.execute(actives=True)
+
+        now = get_current_datetime()
+        if self.__active_key is not None:
+            version, active_until = self.__active_key
+            if version == self.__ctx_repository.version and now < active_until:
+                return self.__active_contexts
+
+        active_contexts = self.__find_temporal_context.execute(actives=True, at=now)
+        active_until = self.__find_context_transition.find_active_change(
+            active_ids=[context.id for context in active_contexts],
+            since=now,
+        ) or (now + self.__find_context_transition.horizon)
+        # Read last, as the scans archive expired contexts and load calendars
+        self.__active_key = (self.__ctx_repository.version, active_until)
+        self.__active_contexts = active_contexts
+        return active_contexts
+
+    def __find_merged_recommendation(
+        self,
+        signature: tuple[str, ...],
+        active_contexts: list[TemporalContext],
+    ) -> dict[str, Any] | None:
+        """Merges the recommendations once per active set until anything changes"""
+        versions = (
+            self.__ctx_repository.version,
+            self.__recommendation_repository.version,
+        )
+        if versions != self.__merged_versions:
+            self.__merged_recommendations = {}
+            self.__merged_versions = versions
+
+        merged_recommendations = self.__merged_recommendations
+        if signature not in merged_recommendations:
+            merged_recommendations[signature] = (
+                self.__recommendation_repository.find_merged(active_contexts)
+            )
+        return merged_recommendations[signature]
+
+    def __resolve_version(self, signature: tuple[str, ...]) -> int:
+        """Bumps the version when contexts, recommendations or the active set change"""
+        key = (
+            self.__ctx_repository.version,
+            self.__recommendation_repository.version,
+            signature,
+        )
+        with self.__version_lock:
+            if key != self.__version_key:
+                self.__version_key = key
+                self.__version += 1
+            return self.__version
@@ -0,0 +1,248 @@
+from collections.abc import Mapping
+from datetime import datetime
+from itertools import groupby
+
+import numpy as np
+
+from temporal_context_mcp.context_management.application.dto import (
+    ContextOccupancyDto,
+    ScheduleOccupancyDto,
+)
+from temporal_context_mcp.context_management.domain import (
+    TemporalContext,
+    TemporalContextRepository,
+)
+from temporal_context_mcp.context_management.domain.port.calendar_repository import (
+    CalendarRepository,
+)
+from temporal_context_mcp.shared import (
+    DateOrdinalSet,
+    TimePattern,
+    TimePatternUtils,
+    get_current_datetime,
+)
+from temporal_context_mcp.shared.application.week_mask import (
+    DAYS_IN_WEEK,
+    HOURS_IN_DAY,
+    MINUTES_IN_HOUR,
+    MINUTES_IN_WEEK,
+    compile_week_mask,
+    compile_window_mask,
+    get_week_start,
+)
+
+# The current week and the next one, which transitions reach near the week end
+MAX_CACHED_WEEKS = 2
+
+
+class FindScheduleOccupancy:
+    """Weekly occupancy of the schedule and how priorities resolve overlaps
+
+    Every active context is compiled to a minute-of-week bitmap, and the whole
+    resolution runs as bitwise operations and popcounts over those bitmaps.
+    """
+
+    def __init__(
+        self,
+        temporal_context_repository: TemporalContextRepository,
+        calendar_repository: CalendarRepository | None = None,
+    ) -> None:
+        self.temporal_context_repository = temporal_context_repository
+        self.calendar_repository = calendar_repository
+        self.__calendars: Mapping[str, DateOrdinalSet] | None = None
+        self.__masks: dict[datetime, dict[str, tuple[TimePattern, np.ndarray]]] = {}
+
+    def execute(
+        self,
+        *,
+        at: datetime | None = None,
+        temporal_context_repository: TemporalContextRepository | None = None,
+    ) -> ScheduleOccupancyDto:
+        """Audits the week of `at`, over another repository if one is given"""
+        repository = temporal_context_repository or self.temporal_context_repository
+        week_start = get_week_start(at or get_current_datetime())
+        contexts = [c for c in repository.find() if c.active]
+        if not contexts:
+            return ScheduleOccupancyDto(week_start=week_start)
+
+        masks = self.__compile_masks(contexts, week_start)
+        # Contexts come in resolution order, so a context wins the minutes that
+        # no earlier context covers
+        covered = np.bitwise_or.accumulate(masks, axis=0)
+        covered_before = np.vstack([np.zeros_like(masks[:1]), covered[:-1]])
+        winning = masks & ~covered_before
+
+        context_occupancies = [
+            ContextOccupancyDto(
+                context_id=context.id,
+                context_type=context.context_type,
+                priority=context.priority,
+                active_minutes=active,
+                winning_minutes=won,
+                shadowed_minutes=active - won,
+            )
+            for context, active, won in zip(
+                contexts,
+                _popcount(masks).tolist(),
+                _popcount(winning).tolist(),
+                strict=True,
+            )
+        ]
+        return ScheduleOccupancyDto(
+            week_start=week_start,
+            covered_minutes=int(_popcount(covered[-1])),
+            contested_minutes=int(
+                _popcount(np.bitwise_or.reduce(masks & covered_before, axis=0)),
+            ),
+            tie_break_minutes=int(
+                _popcount(self.__tie_breaks(contexts, masks, covered_before)),
+            ),
+            context_types={
+                context_type: int(
+                    _popcount(
+                        np.bitwise_or.reduce(
+                            masks[[c.context_type == context_type for c in contexts]],
+                            axis=0,
+                        ),
+                    ),
+                )
+                for context_type in dict.fromkeys(c.context_type for c in contexts)
+            },
+            contexts=context_occupancies,
+            unreachable_context_ids=[
+                occupancy.context_id
+                for occupancy in context_occupancies
+                if occupancy.active_minutes and not occupancy.winning_minutes
+            ],
+            winners=self.__hourly_winners(contexts, winning),
+            coverage=_hourly_minutes(covered[-1]).tolist(),
+        )
+
+    def find_active_minutes(
+        self,
+        *,
+        week_start: datetime,
+        temporal_context_repository: TemporalContextRepository | None = None,
+    ) -> tuple[list[TemporalContext], np.ndarray]:
+        """Active contexts and the minutes of a week each one matches, a row each"""
+        repository = temporal_context_repository or self.temporal_context_repository
+        contexts = [c for c in repository.find() if c.active]
+        if not contexts:
+            return contexts, np.zeros((0, MINUTES_IN_WEEK), dtype=bool)
+        return contexts, np.unpackbits(
+            self.__compile_masks(contexts, week_start),
+            axis=-1,
+            count=MINUTES_IN_WEEK,
+        ).view(bool)
+
+    def __compile_masks(
+        self,
+        contexts: list[TemporalContext],
+        week_start: datetime,
+    ) -> np.ndarray:
+        """Packed minute-of-week bitmaps of the contexts, one row per context
+
+        Bitmaps are kept for the latest weeks while the calendars and the
+        pattern object of the context stay the same, and contexts sharing a
+        pattern share one. Validity bounds are applied on top, so they do not
+        split the cache.
+        """
+        calendars = (
+            self.calendar_repository.find_date_sets()
+            if self.calendar_repository is not None
+            else {}
+        )
+        if calendars is not self.__calendars:
+            self.__calendars = calendars
+            self.__masks = {}
+
+        week_masks = self.__masks.pop(week_start, {})
+        masks: dict[str, tuple[TimePattern, np.ndarray]] = {}
+        by_pattern: dict[str, np.ndarray] = {}
+        for context in contexts:
+            cached = week_masks.get(context.id)
+            if cached is None or cached[0] is not context.time_pattern:
+                pattern_key = context.time_pattern.model_dump_json()
+                mask = by_pattern.get(pattern_key)
+                if mask is None:
+                    mask = np.packbits(
+                        compile_week_mask(
+                            TimePatternUtils(context.time_pattern, calendars),
+                            week_start,
+                        ),
+                    )
+                    by_pattern[pattern_key] = mask
+                cached = (context.time_pattern, mask)
+            masks[context.id] = cached
+        # Latest used week last, the oldest ones are dropped
+        self.__masks[week_start] = masks
+        for stale_week in list(self.__masks)[:-MAX_CACHED_WEEKS]:
+            del self.__masks[stale_week]
+        return np.stack(
+            [
+                self.__bound(context, masks[context.id][1], week_start)
+                for context in contexts
+            ],
+        )
+
+    @staticmethod
+    def __bound(
+        context: TemporalContext,
+        mask: np.ndarray,
+        week_start: datetime,
+    ) -> np.ndarray:
+        """Limits a packed bitmap to the validity of its context"""
+        if context.valid_from is None and context.expires_at is None:
+            return mask
+        return mask & np.packbits(
+            compile_window_mask(context.valid_from, context.expires_at, week_start),
+        )
+
+    @staticmethod
+    def __tie_breaks(
+        contexts: list[TemporalContext],
+        masks: np.ndarray,
+        covered_before: np.ndarray,
+    ) -> np.ndarray:
+        """Minutes where the winner only beat a same priority context on creation"""
+        tie_breaks = np.zeros_like(masks[0])
+        start = 0
+        for _, group in groupby(contexts, key=lambda context: context.priority):
+            end = start + len(list(group))
+            # Covered by an earlier context of the group but by no higher one
+            same_priority_before = covered_before[start:end] & ~covered_before[start]
+            tie_breaks |= np.bitwise_or.reduce(
+                masks[start:end] & same_priority_before,
+                axis=0,
+            )
+            start = end
+        return tie_breaks
+
+    @staticmethod
+    def __hourly_winners(
+        contexts: list[TemporalContext],
+        winning: np.ndarray,
+    ) -> list[list[str | None]]:
+        """Context winning most minutes in each hour of the week"""
+        minutes = _hourly_minutes(winning).reshape(len(contexts), -1)
+        best = minutes.argmax(axis=0)
+        ids = [
+            contexts[index].id if minutes[index, hour] else None
+            for hour, index in enumerate(best.tolist())
+        ]
+        return [
+            ids[day * HOURS_IN_DAY : (day + 1) * HOURS_IN_DAY]
+            for day in range(DAYS_IN_WEEK)
+        ]
+
+
+def _popcount(bitmaps: np.ndarray) -> np.ndarray:
+    """Set bits of each packed bitmap along the last axis"""
+    return np.bitwise_count(bitmaps).sum(axis=-1, dtype=np.int64)
+
+
+def _hourly_minutes(bitmaps: np.ndarray) -> np.ndarray:
+    """Set minutes per weekday and hour of packed minute-of-week bitmaps"""
+    bits = np.unpackbits(bitmaps, axis=-1, count=MINUTES_IN_WEEK)
+    shape = (*bits.shape[:-1], DAYS_IN_WEEK, HOURS_IN_DAY, MINUTES_IN_HOUR)
+    return bits.reshape(shape).sum(axis=-1, dtype=np.int64)
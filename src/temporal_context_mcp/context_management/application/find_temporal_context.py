@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from temporal_context_mcp.context_management.domain import (
     TemporalContext,
     TemporalContextRepository,
@@ -15,6 +17,8 @@ class FindTemporalContext:
         context_id: str | None = None,
         context_type: ContextType | None = None,
         actives: bool | None = None,
+        limit: int | None = None,
+        at: datetime | None = None,
     ) -> list[TemporalContext]:
         if context_id is not None:
             context = self.temporal_context_repository.find_one_by_id(context_id)
@@ -22,4 +26,6 @@ class FindTemporalContext:
         return self.temporal_context_repository.find(
             context_type=context_type,
             actives=actives,
+            limit=limit,
+            at=at,
         )
@@ -0,0 +1,48 @@
+from temporal_context_mcp.context_management import RecommendationRepository
+from temporal_context_mcp.context_management.application.dto import (
+    TemporalContextResultDto,
+)
+from temporal_context_mcp.context_management.application.find_temporal_context import (
+    FindTemporalContext,
+)
+from temporal_context_mcp.shared import ProjectedModel, Projection
+
+
+class FindTopTemporalContexts:
+    def __init__(
+        self,
+        recommendation_repository: RecommendationRepository,
+        find_temporal_context: FindTemporalContext,
+    ) -> None:
+        self.__recommendation_repository = recommendation_repository
+        self.__find_temporal_context = find_temporal_context
+
+    def execute(
+        self,
+        *,
+        top_k: int,
+        projection: Projection | None = None,
+    ) -> list[TemporalContextResultDto] | list[ProjectedModel]:
+        active_contexts = self.__find_temporal_context.execute(
+            actives=True,
+            limit=top_k,
+        )
+        if projection is not None:
+            return [
+                projection.dump(
+                    context,
+                    recommendation=self.__recommendation_repository.find_by_context(
+                        context,
+                    )
+                    or {},
+                )
+                for context in active_contexts
+            ]
+        return [
+            TemporalContextResultDto(
+                recommendation=self.__recommendation_repository.find_by_context(context)
+                or {},
+                **context.model_dump(),
+            )
+            for context in active_contexts
+        ]
@@ -0,0 +1,214 @@
+import heapq
+from datetime import datetime
+from itertools import islice
+from typing import override
+
+from temporal_context_mcp.context_management.domain import (
+    ContextLoadProgress,
+    ContextSearchHit,
+    ContextSearchIndex,
+    ContextSearchPage,
+    TemporalContext,
+    TemporalContextRepository,
+)
+from temporal_context_mcp.context_management.domain.port.calendar_repository import (
+    CalendarRepository,
+)
+from temporal_context_mcp.shared import (
+    ContextType,
+    DateOrdinalSet,
+    TimePatternUtils,
+    get_current_datetime,
+)
+
+
+class OverlayTemporalContextRepository(TemporalContextRepository):
+    """In-memory changes layered over another repository, never written to disk
+
+    Only the upserted contexts and the deleted IDs are held, everything else is
+    read through from the base repository, so an overlay costs memory in
+    proportion to its changes rather than to the stored contexts. The base is
+    read without archiving expired contexts, so nothing is written either way.
+    """
+
+    def __init__(
+        self,
+        base: TemporalContextRepository,
+        calendar_repository: CalendarRepository | None = None,
+    ) -> None:
+        self.base = base
+        self.calendar_repository = calendar_repository
+        self.upserts: dict[str, TemporalContext] = {}
+        self.deleted_ids: set[str] = set()
+        self.__search_index = ContextSearchIndex()
+        self.__revision = 0
+        self.__matchers: dict[str, TimePatternUtils] = {}
+        self.__calendars: dict[str, DateOrdinalSet] = {}
+
+    @property
+    @override
+    def version(self) -> int:
+        """Revision of the base repository plus the changes of the overlay"""
+        return self.base.version + self.__revision
+
+    @override
+    def find_load_progress(self) -> list[ContextLoadProgress]:
+        """Gets the progress of the latest load of each contexts file"""
+        return self.base.find_load_progress()
+
+    @override
+    def find_one_by_id(
+        self,
+        context_id: str,
+        *,
+        archive_expired: bool = True,
+    ) -> TemporalContext | None:
+        """Gets a context by ID"""
+        if context_id in self.upserts:
+            return self.upserts[context_id]
+        if context_id in self.deleted_ids:
+            return None
+        return self.base.find_one_by_id(context_id, archive_expired=False)
+
+    @override
+    def find(
+        self,
+        context_type: ContextType | None = None,
+        actives: bool | None = None,
+        limit: int | None = None,
+        at: datetime | None = None,
+        *,
+        archive_expired: bool = True,
+    ) -> list[TemporalContext]:
+        """Lists contexts by descending priority, optionally filtered by type"""
+        hidden_ids = self.upserts.keys() | self.deleted_ids
+        # Enough base contexts to still reach the limit once the hidden are dropped
+        base_contexts = (
+            context
+            for context in self.base.find(
+                context_type=context_type,
+                actives=actives,
+                limit=limit + len(hidden_ids) if limit is not None else None,
+                at=at,
+                archive_expired=False,
+            )
+            if context.id not in hidden_ids
+        )
+
+        current_time = (at or get_current_datetime()) if actives is not None else None
+        own_contexts = sorted(
+            (
+                context
+                for context in self.upserts.values()
+                if (context_type is None or context.context_type == context_type)
+                and (
+                    current_time is None
+                    or (
+                        context.active
+                        and context.is_valid_at(current_time)
+                        and self.__matcher(context).is_time_match(current_time)
+                    )
+                )
+            ),
+            key=TemporalContext.resolution_key,
+        )
+        return list(
+            islice(
+                heapq.merge(
+                    base_contexts,
+                    own_contexts,
+                    key=TemporalContext.resolution_key,
+                ),
+                limit,
+            ),
+        )
+
+    @override
+    def search(
+        self,
+        query: str,
+        *,
+        context_type: ContextType | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        archive_expired: bool = True,
+    ) -> ContextSearchPage:
+        """Ranks the contexts whose name, ID or type match the query"""
+        hidden_ids = self.upserts.keys() | self.deleted_ids
+        hits = [
+            hit
+            for hit in self.base.search(
+                query,
+                context_type=context_type,
+                archive_expired=False,
+            ).hits
+            if hit.context.id not in hidden_ids
+        ]
+        ranked, _ = self.__search_index.search(query, context_type=context_type)
+        hits += [
+            ContextSearchHit(context=self.upserts[context_id], score=score)
+            for context_id, score in ranked
+        ]
+        hits.sort(key=lambda hit: (-hit.score, hit.context.id))
+        return ContextSearchPage(
+            total=len(hits),
+            hits=hits[offset : offset + limit if limit is not None else None],
+        )
+
+    @override
+    def save(self, context: TemporalContext) -> bool:
+        """Adds a new context"""
+        self.upserts[context.id] = context
+        self.__search_index.add(context)
+        self.__revision += 1
+        return True
+
+    @override
+    def bulk_write(
+        self,
+        *,
+        upserts: list[TemporalContext],
+        delete_ids: list[str],
+    ) -> list[str]:
+        """Upserts and deletes contexts in a single write, returns the deleted IDs"""
+        deleted_ids = [
+            context_id
+            for context_id in dict.fromkeys(delete_ids)
+            if self.find_one_by_id(context_id) is not None
+        ]
+        for context_id in deleted_ids:
+            self.__hide(context_id)
+        for context in upserts:
+            self.upserts[context.id] = context
+            self.__search_index.add(context)
+        self.__revision += 1
+        return deleted_ids
+
+    @override
+    def delete_one_by_id(self, context_id: str) -> bool:
+        """Deletes a context"""
+        if self.find_one_by_id(context_id) is None:
+            return False
+        self.__hide(context_id)
+        self.__revision += 1
+        return True
+
+    def __hide(self, context_id: str) -> None:
+        self.upserts.pop(context_id, None)
+        self.__matchers.pop(context_id, None)
+        self.__search_index.remove(context_id)
+        self.deleted_ids.add(context_id)
+
+    def __matcher(self, context: TemporalContext) -> TimePatternUtils:
+        """Gets the compiled time pattern of an upserted context"""
+        if self.calendar_repository is not None:
+            calendars = self.calendar_repository.find_date_sets()
+            if calendars is not self.__calendars:
+                self.__calendars = calendars
+                self.__matchers = {}
+
+        matcher = self.__matchers.get(context.id)
+        if matcher is None or matcher.pattern is not context.time_pattern:
+            matcher = TimePatternUtils(context.time_pattern, self.__calendars)
+            self.__matchers[context.id] = matcher
+        return matcher
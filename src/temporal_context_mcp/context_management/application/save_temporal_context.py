@@ -12,18 +12,31 @@ from temporal_context_mcp.shared import (
 )
 
 
+def build_temporal_context(dto: SaveTemporalContextDto) -> TemporalContext:
+    context = TemporalContext(
+        id=dto.id or generate_id(),
+        name=dto.name,
+        context_type=dto.context_type,
+        time_pattern=dto.time_pattern,
+        priority=Priority(dto.priority),
+        created_at=get_current_datetime(),
+        valid_from=dto.valid_from,
+        expires_at=dto.expires_at,
+    )
+    if (
+        context.valid_from is not None
+        and context.expires_at is not None
+        and context.expires_at <= context.valid_from
+    ):
+        msg = "expires_at must be after valid_from"
+        raise ValueError(msg)
+    return context
+
+
 class SaveTemporalContext:
     def __init__(self, temporal_context_repository: TemporalContextRepository) -> None:
         self.temporal_context_repository = temporal_context_repository
 
     def execute(self, *, dto: SaveTemporalContextDto) -> bool:
-        temporal_context = TemporalContext(
-            id=dto.id or generate_id(),
-            name=dto.name,
-            context_type=dto.context_type,
-            time_pattern=dto.time_pattern,
-            context_data=dto.context_data,
-            priority=Priority(dto.priority),
-            created_at=get_current_datetime(),
-        )
+        temporal_context = build_temporal_context(dto)
         return self.temporal_context_repository.save(temporal_context)
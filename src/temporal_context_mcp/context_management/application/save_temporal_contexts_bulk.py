@@ -0,0 +1,108 @@
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from temporal_context_mcp.context_management.application.dto import (
+    BulkItemErrorDto,
+    SaveTemporalContextDto,
+    SaveTemporalContextsBulkResultDto,
+)
+from temporal_context_mcp.context_management.application.save_temporal_context import (
+    build_temporal_context,
+)
+from temporal_context_mcp.context_management.domain import (
+    TemporalContext,
+    TemporalContextRepository,
+    UsageHistoryRepository,
+)
+
+DTO_LIST_ADAPTER = TypeAdapter(list[SaveTemporalContextDto])
+
+
+def build_temporal_contexts(
+    items: list[dict[str, Any]],
+) -> tuple[list[TemporalContext], list[BulkItemErrorDto]]:
+    """Builds the contexts of a batch, with an error per invalid or repeated item"""
+    dtos, errors = _validate(items)
+    contexts: dict[str, TemporalContext] = {}
+    for index, dto in dtos:
+        if dto.id is not None and dto.id in contexts:
+            errors.append(
+                BulkItemErrorDto(
+                    index=index,
+                    id=dto.id,
+                    message="Duplicate ID, an earlier item of the batch has it",
+                ),
+            )
+            continue
+        try:
+            context = build_temporal_context(dto)
+        except ValueError as e:
+            errors.append(BulkItemErrorDto(index=index, id=dto.id, message=str(e)))
+            continue
+        contexts[context.id] = context
+    return list(contexts.values()), errors
+
+
+class SaveTemporalContextsBulk:
+    def __init__(
+        self,
+        temporal_context_repository: TemporalContextRepository,
+        usage_history_repository: UsageHistoryRepository,
+    ) -> None:
+        self.temporal_context_repository = temporal_context_repository
+        self.usage_history_repository = usage_history_repository
+
+    def execute(
+        self,
+        *,
+        items: list[dict[str, Any]],
+        delete_ids: list[str] | None = None,
+    ) -> SaveTemporalContextsBulkResultDto:
+        delete_ids = delete_ids or []
+        upserts, errors = build_temporal_contexts(items)
+        deleted = self.temporal_context_repository.bulk_write(
+            upserts=upserts,
+            delete_ids=delete_ids,
+        )
+        for context_id in deleted:
+            self.usage_history_repository.delete_by_context_id(context_id)
+        errors.extend(
+            BulkItemErrorDto(id=context_id, message="Temporal context not found")
+            for context_id in delete_ids
+            if context_id not in deleted
+        )
+        errors.sort(key=lambda error: -1 if error.index is None else error.index)
+        return SaveTemporalContextsBulkResultDto(
+            saved=[context.id for context in upserts],
+            deleted=deleted,
+            errors=errors,
+        )
+
+
+def _validate(
+    items: list[dict[str, Any]],
+) -> tuple[list[tuple[int, SaveTemporalContextDto]], list[BulkItemErrorDto]]:
+    """Validates the whole batch at once, splitting out the invalid items"""
+    try:
+        return list(enumerate(DTO_LIST_ADAPTER.validate_python(items))), []
+    except ValidationError as e:
+        messages: dict[int, list[str]] = {}
+        for error in e.errors():
+            index, *field = error["loc"]
+            location = ".".join(str(part) for part in field)
+            messages.setdefault(int(index), []).append(
+                f"{location}: {error['msg']}" if location else error["msg"],
+            )
+
+    valid_indexes = [i for i in range(len(items)) if i not in messages]
+    valid_dtos = DTO_LIST_ADAPTER.validate_python([items[i] for i in valid_indexes])
+    errors = [
+        BulkItemErrorDto(
+            index=index,
+            id=str(items[index]["id"]) if items[index].get("id") else None,
+            message="; ".join(item_messages),
+        )
+        for index, item_messages in messages.items()
+    ]
+    return list(zip(valid_indexes, valid_dtos, strict=True)), errors
@@ -0,0 +1,41 @@
+from temporal_context_mcp.context_management.application.dto import (
+    ContextSearchHitDto,
+    ContextSearchResultDto,
+)
+from temporal_context_mcp.context_management.domain import TemporalContextRepository
+from temporal_context_mcp.shared import ContextType
+
+
+class SearchTemporalContexts:
+    def __init__(self, temporal_context_repository: TemporalContextRepository) -> None:
+        self.temporal_context_repository = temporal_context_repository
+
+    def execute(
+        self,
+        *,
+        query: str,
+        context_type: ContextType | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> ContextSearchResultDto:
+        page = self.temporal_context_repository.search(
+            query,
+            context_type=context_type,
+            limit=max(limit, 0),
+            offset=max(offset, 0),
+        )
+        return ContextSearchResultDto(
+            total=page.total,
+            offset=max(offset, 0),
+            hits=[
+                ContextSearchHitDto(
+                    id=hit.context.id,
+                    name=hit.context.name,
+                    context_type=hit.context.context_type,
+                    priority=hit.context.priority,
+                    active=hit.context.active,
+                    score=hit.score,
+                )
+                for hit in page.hits
+            ],
+        )
@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import Any
+
+from temporal_context_mcp.context_management.application.dto import (
+    BulkItemErrorDto,
+    ScheduleSimulationDto,
+    SimulatedMomentDto,
+)
+from temporal_context_mcp.context_management.application.find_schedule_occupancy import (  # noqa: E501
+    FindScheduleOccupancy,
+)
+from temporal_context_mcp.context_management.application.overlay_temporal_context_repository import (  # noqa: E501
+    OverlayTemporalContextRepository,
+)
+from temporal_context_mcp.context_management.application.save_temporal_contexts_bulk import (  # noqa: E501
+    build_temporal_contexts,
+)
+from temporal_context_mcp.context_management.domain import TemporalContextRepository
+from temporal_context_mcp.context_management.domain.port.calendar_repository import (
+    CalendarRepository,
+)
+from temporal_context_mcp.shared import get_current_datetime
+
+
+class SimulateSchedule:
+    """What-if resolution of proposed context changes, without saving them
+
+    The changes are applied to an overlay over the live contexts, which is
+    dropped once the simulation is answered.
+    """
+
+    def __init__(
+        self,
+        temporal_context_repository: TemporalContextRepository,
+        calendar_repository: CalendarRepository | None = None,
+        find_schedule_occupancy: FindScheduleOccupancy | None = None,
+    ) -> None:
+        self.temporal_context_repository = temporal_context_repository
+        self.calendar_repository = calendar_repository
+        self.find_schedule_occupancy = find_schedule_occupancy or FindScheduleOccupancy(
+            temporal_context_repository=temporal_context_repository,
+            calendar_repository=calendar_repository,
+        )
+
+    def execute(
+        self,
+        *,
+        items: list[dict[str, Any]],
+        delete_ids: list[str] | None = None,
+        times: list[datetime] | None = None,
+        week: bool = False,
+    ) -> ScheduleSimulationDto:
+        delete_ids = delete_ids or []
+        if not times and not week:
+            times = [get_current_datetime()]
+
+        upserts, errors = build_temporal_contexts(items)
+        overlay = OverlayTemporalContextRepository(
+            self.temporal_context_repository,
+            self.calendar_repository,
+        )
+        deleted = overlay.bulk_write(upserts=upserts, delete_ids=delete_ids)
+        errors.extend(
+            BulkItemErrorDto(id=context_id, message="Temporal context not found")
+            for context_id in delete_ids
+            if context_id not in deleted
+        )
+        errors.sort(key=lambda error: -1 if error.index is None else error.index)
+        return ScheduleSimulationDto(
+            saved=[context.id for context in upserts],
+            deleted=deleted,
+            errors=errors,
+            moments=[self.__simulate_moment(overlay, at) for at in times or []],
+            occupancy=(
+                self.find_schedule_occupancy.execute(
+                    at=times[0] if times else None,
+                    temporal_context_repository=overlay,
+                )
+                if week
+                else None
+            ),
+        )
+
+    def __simulate_moment(
+        self,
+        overlay: OverlayTemporalContextRepository,
+        at: datetime,
+    ) -> SimulatedMomentDto:
+        active_context_ids = [c.id for c in overlay.find(actives=True, at=at)]
+        current = self.temporal_context_repository.find(
+            actives=True,
+            limit=1,
+            at=at,
+            archive_expired=False,
+        )
+        context_id = active_context_ids[0] if active_context_ids else None
+        current_context_id = current[0].id if current else None
+        return SimulatedMomentDto(
+            at=at,
+            context_id=context_id,
+            active_context_ids=active_context_ids,
+            current_context_id=current_context_id,
+            changed=context_id != current_context_id,
+        )
@@ -1,8 +1,33 @@
+from temporal_context_mcp.context_management.domain.context_load_progress import (
+    ContextLoadProgress,
+)
+from temporal_context_mcp.context_management.domain.context_search_index import (
+    ContextSearchIndex,
+)
+from temporal_context_mcp.context_management.domain.context_search_page import (
+    ContextSearchHit,
+    ContextSearchPage,
+)
 from temporal_context_mcp.context_management.domain.port.temporal_context_repository import (
     TemporalContextRepository,
 )
+from temporal_context_mcp.context_management.domain.port.usage_history_repository import (
+    UsageHistoryRepository,
+)
 from temporal_context_mcp.context_management.domain.temporal_context import (
     TemporalContext,
 )
+from temporal_context_mcp.context_management.domain.usage_history import (
+    UsageHistory,
+)
 
-__all__ = ["TemporalContext", "TemporalContextRepository"]
+__all__ = [
+    "ContextLoadProgress",
+    "ContextSearchHit",
+    "ContextSearchIndex",
+    "ContextSearchPage",
+    "TemporalContext",
+    "TemporalContextRepository",
+    "UsageHistory",
+    "UsageHistoryRepository",
+]
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class ContextLoadProgress(BaseModel):
+    file_name: str = Field(..., description="Contexts file being loaded")
+    total_bytes: int = Field(default=0, description="Size of the file")
+    bytes_read: int = Field(default=0, description="Bytes parsed so far")
+    loaded: int = Field(default=0, description="Valid contexts loaded so far")
+    rejected: int = Field(default=0, description="Invalid records quarantined")
+    corrupt: bool = Field(
+        default=False,
+        description="Whether invalid JSON cut the load short",
+    )
+    finished: bool = Field(default=False, description="Whether the load ended")
+    errors: list[str] = Field(default=[], description="First errors found")
@@ -0,0 +1,156 @@
+import heapq
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+from temporal_context_mcp.context_management.domain.temporal_context import (
+    TemporalContext,
+)
+from temporal_context_mcp.shared import ContextType
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+# Weight of a match in each indexed field
+NAME_WEIGHT = 3.0
+ID_WEIGHT = 2.0
+CONTEXT_TYPE_WEIGHT = 1.0
+# Share of the trigrams of a query token a context must have to match partially
+MIN_TRIGRAM_SIMILARITY = 0.5
+
+type Document = tuple[str, str, ContextType]
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words of a text, splitting identifiers on `_` and `-`"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def get_trigrams(token: str) -> set[str]:
+    """Trigrams of a token padded with spaces, so short tokens have some too"""
+    padded = f" {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class ContextSearchIndex:
+    """Inverted index of tokens and trigrams over descriptive context fields
+
+    Each context is indexed by the tokens of its name, ID and type, each with
+    the weight of its field. Trigrams index the vocabulary of tokens, so a query
+    token also matches the tokens sharing enough trigrams with it (plurals,
+    typos, parts of words) at a fraction of their weight. Queries only visit
+    the postings of their own tokens and trigrams, and contexts are added and
+    removed one at a time.
+    """
+
+    def __init__(self) -> None:
+        self.tokens: dict[str, dict[str, float]] = {}
+        self.trigrams: dict[str, set[str]] = {}
+        self.documents: dict[str, Document] = {}
+        self.__terms: dict[str, dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, context: TemporalContext) -> None:
+        """Indexes a context, replacing its previous version"""
+        document = (context.id, context.name, context.context_type)
+        if self.documents.get(context.id) == document:
+            return
+        self.remove(context.id)
+
+        tokens: dict[str, float] = {}
+        for text, weight in (
+            (context.name, NAME_WEIGHT),
+            (context.id, ID_WEIGHT),
+            (context.context_type.value, CONTEXT_TYPE_WEIGHT),
+        ):
+            for token in tokenize(text):
+                tokens[token] = max(tokens.get(token, 0.0), weight)
+
+        for token, weight in tokens.items():
+            postings = self.tokens.get(token)
+            if postings is None:
+                postings = self.tokens[token] = {}
+                for trigram in get_trigrams(token):
+                    self.trigrams.setdefault(trigram, set()).add(token)
+            postings[context.id] = weight
+        self.documents[context.id] = document
+        self.__terms[context.id] = tokens
+
+    def remove(self, context_id: str) -> None:
+        """Drops a context from the index, if it is there"""
+        if context_id not in self.documents:
+            return
+        for token in self.__terms.pop(context_id):
+            postings = self.tokens[token]
+            del postings[context_id]
+            if postings:
+                continue
+            # Last context with the token, drop it from the vocabulary
+            del self.tokens[token]
+            for trigram in get_trigrams(token):
+                similar_tokens = self.trigrams[trigram]
+                similar_tokens.discard(token)
+                if not similar_tokens:
+                    del self.trigrams[trigram]
+        del self.documents[context_id]
+
+    def replace(self, contexts: Iterable[TemporalContext]) -> None:
+        """Indexes the contexts, dropping the ones not among them"""
+        contexts = {context.id: context for context in contexts}
+        for context_id in self.documents.keys() - contexts.keys():
+            self.remove(context_id)
+        for context in contexts.values():
+            self.add(context)
+
+    def search(
+        self,
+        query: str,
+        *,
+        context_type: ContextType | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> tuple[list[tuple[str, float]], int]:
+        """Ranks the contexts matching any query token, best first
+
+        Returns a page of (context ID, score) pairs and the number of matches.
+        """
+        scores: Counter[str] = Counter()
+        for token in dict.fromkeys(tokenize(query)):
+            for context_id, score in self.__score_token(token).items():
+                scores[context_id] += score
+
+        if context_type is not None:
+            scores = Counter(
+                {
+                    context_id: score
+                    for context_id, score in scores.items()
+                    if self.documents[context_id][2] == context_type
+                },
+            )
+
+        def rank_key(item: tuple[str, float]) -> tuple[float, str]:
+            return -item[1], item[0]
+
+        if limit is None:
+            ranked = sorted(scores.items(), key=rank_key)
+        else:
+            ranked = heapq.nsmallest(offset + limit, scores.items(), key=rank_key)
+        return ranked[offset:], len(scores)
+
+    def __score_token(self, token: str) -> dict[str, float]:
+        """Best weighted match of each context for a query token"""
+        query_trigrams = get_trigrams(token)
+        shared: Counter[str] = Counter()
+        for trigram in query_trigrams:
+            shared.update(self.trigrams.get(trigram, ()))
+
+        scores: dict[str, float] = {}
+        for similar_token, count in shared.items():
+            similarity = count / len(query_trigrams)
+            if similarity < MIN_TRIGRAM_SIMILARITY:
+                continue
+            # A whole token counts double
+            factor = 2.0 if similar_token == token else similarity
+            for context_id, weight in self.tokens[similar_token].items():
+                scores[context_id] = max(scores.get(context_id, 0.0), factor * weight)
+        return scores
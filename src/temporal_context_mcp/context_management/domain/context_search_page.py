@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+from temporal_context_mcp.context_management.domain.temporal_context import (
+    TemporalContext,
+)
+
+
+class ContextSearchHit(BaseModel):
+    context: TemporalContext = Field(..., description="Matching context")
+    score: float = Field(..., description="Relevance, higher is better")
+
+
+class ContextSearchPage(BaseModel):
+    total: int = Field(default=0, description="Contexts matching the query")
+    hits: list[ContextSearchHit] = Field(
+        default=[],
+        description="Requested page of matches, best first",
+    )
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from temporal_context_mcp.shared import DateOrdinalSet
+
+
+class CalendarRepository(ABC):
+    @abstractmethod
+    def find(self) -> list[dict[str, Any]]:
+        """Lists all calendars"""
+
+    @abstractmethod
+    def find_date_sets(self) -> dict[str, DateOrdinalSet]:
+        """Gets the compiled dates of every calendar by ID
+
+        The mapping is replaced, never mutated, when a calendar changes, so callers
+        can cache anything derived from it while it stays the same object.
+        """
+
+    @abstractmethod
+    def save(self, calendar: dict[str, Any]) -> bool:
+        """Adds or replaces a calendar"""
+
+    @abstractmethod
+    def delete_one_by_id(self, calendar_id: str) -> bool:
+        """Deletes a calendar"""
@@ -1,9 +1,25 @@
 from abc import ABC, abstractmethod
 
+from temporal_context_mcp.context_management.domain.temporal_context import (
+    TemporalContext,
+)
 from temporal_context_mcp.shared import ContextType
 
 
 class RecommendationRepository(ABC):
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Revision of the recommendations"""
+
     @abstractmethod
     def find_by_context_type(self, context_type: ContextType) -> dict[str, str] | None:
         pass
+
+    @abstractmethod
+    def find_by_context(self, context: TemporalContext) -> dict[str, str] | None:
+        """Finds the recommendation of a context, with its own overrides applied"""
+
+    @abstractmethod
+    def find_merged(self, contexts: list[TemporalContext]) -> dict[str, str] | None:
+        """Merges the recommendations of contexts given in resolution order"""
@@ -1,5 +1,12 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
+from temporal_context_mcp.context_management.domain.context_load_progress import (
+    ContextLoadProgress,
+)
+from temporal_context_mcp.context_management.domain.context_search_page import (
+    ContextSearchPage,
+)
 from temporal_context_mcp.context_management.domain.temporal_context import (
     TemporalContext,
 )
@@ -7,8 +14,22 @@ from temporal_context_mcp.shared import ContextType
 
 
 class TemporalContextRepository(ABC):
+    @property
     @abstractmethod
-    def find_one_by_id(self, context_id: str) -> TemporalContext | None:
+    def version(self) -> int:
+        """Revision of the contexts and calendars, not bumped by usage marks"""
+
+    @abstractmethod
+    def find_load_progress(self) -> list[ContextLoadProgress]:
+        """Gets the progress of the latest load of each contexts file"""
+
+    @abstractmethod
+    def find_one_by_id(
+        self,
+        context_id: str,
+        *,
+        archive_expired: bool = True,
+    ) -> TemporalContext | None:
         """Gets a context by ID"""
 
     @abstractmethod
@@ -16,17 +37,43 @@ class TemporalContextRepository(ABC):
         self,
         context_type: ContextType | None = None,
         actives: bool | None = None,
+        limit: int | None = None,
+        at: datetime | None = None,
+        *,
+        archive_expired: bool = True,
     ) -> list[TemporalContext]:
-        """Lists all contexts, optionally filtered by type"""
+        """Lists contexts by descending priority, optionally filtered by type
+
+        Active contexts are matched against `at`, the current time by default.
+        Reads archive the expired contexts first; with `archive_expired=False`
+        they are only left out, so the read never writes.
+        """
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        *,
+        context_type: ContextType | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        archive_expired: bool = True,
+    ) -> ContextSearchPage:
+        """Ranks the contexts whose name, ID or type match the query"""
 
     @abstractmethod
     def save(self, context: TemporalContext) -> bool:
         """Adds a new context"""
 
     @abstractmethod
-    def delete_one_by_id(self, context_id: str) -> bool:
-        """Deletes a context"""
+    def bulk_write(
+        self,
+        *,
+        upserts: list[TemporalContext],
+        delete_ids: list[str],
+    ) -> list[str]:
+        """Upserts and deletes contexts in a single write, returns the deleted IDs"""
 
     @abstractmethod
-    def mark_one_as_used(self, context_id: str) -> None:
-        """Marks a context as recently used"""
+    def delete_one_by_id(self, context_id: str) -> bool:
+        """Deletes a context"""
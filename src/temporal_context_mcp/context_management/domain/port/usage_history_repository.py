@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from temporal_context_mcp.context_management.domain.usage_history import (
+    UsageHistory,
+)
+
+
+class UsageHistoryRepository(ABC):
+    @abstractmethod
+    def find_by_context_id(self, context_id: str) -> UsageHistory | None:
+        """Gets the usage history of a context"""
+
+    @abstractmethod
+    def record(self, context_id: str, used_at: datetime) -> None:
+        """Records a usage of a context"""
+
+    @abstractmethod
+    def delete_by_context_id(self, context_id: str) -> None:
+        """Deletes the usage history of a context"""
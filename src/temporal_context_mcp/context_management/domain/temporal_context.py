@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from dateutil import tz
+from pydantic import BaseModel, field_validator, model_validator
 
 from temporal_context_mcp.shared import ContextType, Priority, TimePattern
 
@@ -14,3 +15,33 @@ class TemporalContext(BaseModel):
     created_at: datetime
     last_used: datetime | None = None
     priority: Priority = Priority.LOW
+    valid_from: datetime | None = None
+    expires_at: datetime | None = None
+
+    @field_validator("valid_from", "expires_at")
+    @classmethod
+    def validate_bound(cls, value: datetime | None) -> datetime | None:
+        """Dates without a timezone are taken as local time"""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=tz.tzlocal())
+        return value
+
+    @model_validator(mode="after")
+    def anchor_recurrence(self) -> "TemporalContext":
+        """Recurrences without DTSTART start on the day the context was created"""
+        self.time_pattern = self.time_pattern.anchored(self.created_at)
+        return self
+
+    def resolution_key(self) -> tuple[int, float]:
+        """Sort key placing higher priority, then most recently created, first"""
+        return -self.priority, -self.created_at.timestamp()
+
+    def is_valid_at(self, at: datetime) -> bool:
+        """Whether `at` falls within `valid_from` (inclusive) and `expires_at`"""
+        if self.valid_from is None and self.expires_at is None:
+            return True
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=tz.tzlocal())
+        return (self.valid_from is None or self.valid_from <= at) and (
+            self.expires_at is None or at < self.expires_at
+        )
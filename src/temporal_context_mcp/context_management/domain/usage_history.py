@@ -0,0 +1,69 @@
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from datetime import datetime
+
+from dateutil import tz
+
+DAYS_IN_WEEK = 7
+HOURS_IN_DAY = 24
+
+
+class UsageHistory:
+    """Fixed-size ring buffer of usage timestamps (epoch seconds)"""
+
+    def __init__(
+        self,
+        capacity: int,
+        timestamps: array | None = None,
+        head: int = 0,
+        count: int = 0,
+    ) -> None:
+        self.capacity = capacity
+        self.timestamps = (
+            timestamps if timestamps is not None else array("q", bytes(8 * capacity))
+        )
+        self.head = head
+        self.count = count
+
+    def record(self, used_at: datetime) -> int:
+        """Stores a usage overwriting the oldest one when full, returns its slot"""
+        slot = self.head
+        self.timestamps[slot] = int(used_at.timestamp())
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return slot
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates the stored timestamps from oldest to newest"""
+        start = (self.head - self.count) % self.capacity
+        for offset in range(self.count):
+            yield self.timestamps[(start + offset) % self.capacity]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def last_used(self) -> datetime | None:
+        """Newest usage in local time, None without usages"""
+        if self.count == 0:
+            return None
+        timestamp = self.timestamps[(self.head - 1) % self.capacity]
+        return datetime.fromtimestamp(timestamp, tz.tzlocal())
+
+    def uses_per_day(self, since: datetime | None = None) -> dict[str, int]:
+        """Counts usages per local calendar day"""
+        min_timestamp = int(since.timestamp()) if since else None
+        counter = Counter(
+            datetime.fromtimestamp(timestamp, tz.tzlocal()).strftime("%Y-%m-%d")
+            for timestamp in self
+            if min_timestamp is None or timestamp >= min_timestamp
+        )
+        return dict(sorted(counter.items()))
+
+    def hour_of_week_histogram(self) -> list[list[int]]:
+        """Counts usages per local weekday (0=Sunday) and hour"""
+        histogram = [[0] * HOURS_IN_DAY for _ in range(DAYS_IN_WEEK)]
+        for timestamp in self:
+            used_at = datetime.fromtimestamp(timestamp, tz.tzlocal())
+            histogram[(used_at.weekday() + 1) % DAYS_IN_WEEK][used_at.hour] += 1
+        return histogram
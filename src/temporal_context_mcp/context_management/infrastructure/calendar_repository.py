@@ -0,0 +1,31 @@
+from typing import Any
+
+from temporal_context_mcp.calendar import (
+    Calendar,
+)
+from temporal_context_mcp.calendar import (
+    CalendarRepositoryImpl as Repository,
+)
+from temporal_context_mcp.context_management.domain.port.calendar_repository import (
+    CalendarRepository,
+)
+from temporal_context_mcp.core import settings
+from temporal_context_mcp.shared import DateOrdinalSet, default_false
+
+
+class CalendarRepositoryImpl(CalendarRepository):
+    def __init__(self) -> None:
+        self.repository = Repository(settings=settings)
+
+    def find(self) -> list[dict[str, Any]]:
+        return [calendar.model_dump(mode="json") for calendar in self.repository.find()]
+
+    def find_date_sets(self) -> dict[str, DateOrdinalSet]:
+        return self.repository.find_date_sets()
+
+    @default_false
+    def save(self, calendar: dict[str, Any]) -> bool:
+        return self.repository.save(Calendar.model_validate(calendar))
+
+    def delete_one_by_id(self, calendar_id: str) -> bool:
+        return self.repository.delete_one_by_id(calendar_id)
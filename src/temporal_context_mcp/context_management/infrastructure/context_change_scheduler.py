@@ -0,0 +1,87 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import timedelta
+
+from temporal_context_mcp.context_management.application.dto import (
+    ContextTransitionDto,
+)
+from temporal_context_mcp.shared import get_current_datetime
+
+_UNKNOWN = object()
+
+
+class ContextChangeScheduler:
+    """Sleeps until the next context transition and reports context changes
+
+    A change is a new version of the current context, so edits to the winning
+    context, its calendars or the recommendations merged into it count too.
+    `wake` forces an early check, e.g. after contexts or calendars were saved.
+    `running` shares a single scheduler task between concurrent sessions.
+    """
+
+    def __init__(
+        self,
+        find_transition: Callable[[], ContextTransitionDto],
+        on_change: Callable[[], Awaitable[None]],
+        max_sleep: timedelta = timedelta(days=1),
+    ) -> None:
+        self.find_transition = find_transition
+        self.on_change = on_change
+        self.max_sleep = max_sleep
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__wake_event: asyncio.Event | None = None
+        self.__task: asyncio.Task | None = None
+        self.__users = 0
+
+    @contextlib.asynccontextmanager
+    async def running(self) -> AsyncIterator[None]:
+        """Keeps the scheduler running while at least one caller is inside"""
+        self.__users += 1
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.run())
+        try:
+            yield
+        finally:
+            self.__users -= 1
+            if self.__users == 0:
+                task, self.__task = self.__task, None
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def run(self) -> None:
+        self.__loop = asyncio.get_running_loop()
+        self.__wake_event = asyncio.Event()
+        version = _UNKNOWN
+        while True:
+            # Cleared before resolving so a wake during resolution is not lost
+            self.__wake_event.clear()
+            transition = await asyncio.to_thread(self.find_transition)
+            if version is not _UNKNOWN and transition.version != version:
+                await self.__notify()
+            version = transition.version
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self.__wake_event.wait(),
+                    self.__sleep_seconds(transition),
+                )
+
+    def wake(self) -> None:
+        """Re-evaluates the current context now, safe to call from any thread"""
+        if self.__loop is not None and self.__wake_event is not None:
+            self.__loop.call_soon_threadsafe(self.__wake_event.set)
+
+    def __sleep_seconds(self, transition: ContextTransitionDto) -> float:
+        max_sleep = self.max_sleep.total_seconds()
+        if transition.changes_at is None:
+            return max_sleep
+        remaining = (transition.changes_at - get_current_datetime()).total_seconds()
+        return min(max(remaining, 0.0), max_sleep)
+
+    async def __notify(self) -> None:
+        try:
+            await self.on_change()
+        except Exception as e:
+            print(f"Error notifying context change: {e}")
@@ -1,13 +1,41 @@
+import functools
+import threading
+from datetime import datetime, timedelta
+from typing import Any
+
 from temporal_context_mcp.context_management import RecommendationRepository
 from temporal_context_mcp.context_management.application import (
+    FindContextTransition,
+    FindContextUsage,
     FindCurrentTemporalContext,
+    FindScheduleOccupancy,
     FindTemporalContext,
+    FindTopTemporalContexts,
+    SaveTemporalContextsBulk,
+    SearchTemporalContexts,
+    SimulateSchedule,
 )
-from temporal_context_mcp.context_management.application.dto.temporal_context_result_dto import (
+from temporal_context_mcp.context_management.application.dto import (
+    ContextSearchResultDto,
+    ContextTransitionDto,
+    ContextUsageResultDto,
+    NotModifiedResultDto,
+    SaveTemporalContextsBulkResultDto,
+    ScheduleOccupancyDto,
+    ScheduleSimulationDto,
     TemporalContextResultDto,
 )
 from temporal_context_mcp.context_management.domain import (
+    ContextLoadProgress,
+    TemporalContext,
     TemporalContextRepository,
+    UsageHistoryRepository,
+)
+from temporal_context_mcp.context_management.domain.port.calendar_repository import (
+    CalendarRepository,
+)
+from temporal_context_mcp.context_management.infrastructure.calendar_repository import (
+    CalendarRepositoryImpl,
 )
 from temporal_context_mcp.context_management.infrastructure.recommendation_repository import (
     RecommendationRepositoryImpl,
@@ -15,39 +43,196 @@ from temporal_context_mcp.context_management.infrastructure.recommendation_repos
 from temporal_context_mcp.context_management.infrastructure.temporal_context_repository_impl import (
     TemporalContextRepositoryImpl,
 )
+from temporal_context_mcp.context_management.infrastructure.usage_history_repository_impl import (
+    UsageHistoryRepositoryImpl,
+)
+from temporal_context_mcp.core import settings
 from temporal_context_mcp.shared import (
+    ContextType,
+    ProjectedModel,
+    Projection,
+    SingleFlight,
     TimePatternUtils,
+    get_projection,
 )
 
 
 class Controller:
     def __init__(self) -> None:
+        self.__calendar_repository: CalendarRepository = CalendarRepositoryImpl()
         self.__ctx_repository: TemporalContextRepository = (
-            TemporalContextRepositoryImpl()
+            TemporalContextRepositoryImpl(
+                data_dir=settings.data_dir,
+                calendar_repository=self.__calendar_repository,
+                load_workers=settings.context_load_workers or None,
+            )
         )
         self.__recommendation_repository: RecommendationRepository = (
             RecommendationRepositoryImpl()
         )
+        self.__usage_history_repository: UsageHistoryRepository = (
+            UsageHistoryRepositoryImpl(
+                data_dir=settings.data_dir,
+                capacity=settings.usage_history_capacity,
+            )
+        )
         self.__find_temporal_context = FindTemporalContext(self.__ctx_repository)
+        self.__find_top_temporal_contexts = FindTopTemporalContexts(
+            recommendation_repository=self.__recommendation_repository,
+            find_temporal_context=self.__find_temporal_context,
+        )
+        self.__save_temporal_contexts_bulk = SaveTemporalContextsBulk(
+            temporal_context_repository=self.__ctx_repository,
+            usage_history_repository=self.__usage_history_repository,
+        )
+        self.__search_temporal_contexts = SearchTemporalContexts(
+            self.__ctx_repository,
+        )
+        self.__find_context_usage = FindContextUsage(self.__usage_history_repository)
+        self.__find_schedule_occupancy = FindScheduleOccupancy(
+            temporal_context_repository=self.__ctx_repository,
+            calendar_repository=self.__calendar_repository,
+        )
+        self.__find_context_transition = FindContextTransition(
+            find_schedule_occupancy=self.__find_schedule_occupancy,
+            horizon=timedelta(minutes=settings.schedule_horizon_minutes),
+        )
         self.__find_current_temporal_context = FindCurrentTemporalContext(
             temporal_context_repository=self.__ctx_repository,
             recommendation_repository=self.__recommendation_repository,
             find_temporal_context=self.__find_temporal_context,
+            usage_history_repository=self.__usage_history_repository,
+            find_context_transition=self.__find_context_transition,
         )
+        self.__simulate_schedule = SimulateSchedule(
+            temporal_context_repository=self.__ctx_repository,
+            calendar_repository=self.__calendar_repository,
+            find_schedule_occupancy=self.__find_schedule_occupancy,
+        )
+        self.__single_flight = SingleFlight()
+        # Repositories and use cases keep unsynchronized in-memory state, while
+        # the current context and transitions are resolved in worker threads
+        self.__lock = threading.RLock()
+
+    def get_current_context(
+        self,
+        *,
+        if_none_match: int | None = None,
+        fields: list[str] | None = None,
+        compact: bool = False,
+    ) -> TemporalContextResultDto | NotModifiedResultDto | ProjectedModel | None:
+        projection = (
+            get_projection(TemporalContextResultDto, fields, compact=compact)
+            if fields or compact
+            else None
+        )
+        # Concurrent identical requests share one resolution and one usage update
+        return self.__single_flight.run(
+            ("get_current_context", if_none_match, projection),
+            functools.partial(self.__find_current_context, if_none_match, projection),
+        )
+
+    def __find_current_context(
+        self,
+        if_none_match: int | None,
+        projection: Projection | None,
+    ) -> TemporalContextResultDto | NotModifiedResultDto | ProjectedModel | None:
+        with self.__lock:
+            return self.__find_current_temporal_context.execute(
+                if_none_match=if_none_match,
+                projection=projection,
+            )
+
+    def get_context_transition(self) -> ContextTransitionDto:
+        with self.__lock:
+            transition = self.__find_context_transition.execute()
+            return transition.model_copy(
+                update={"version": self.__find_current_temporal_context.find_version()},
+            )
 
-    def get_current_context(self) -> TemporalContextResultDto | None:
-        return self.__find_current_temporal_context.execute()
+    def get_top_contexts(
+        self,
+        *,
+        top_k: int = 3,
+        fields: list[str] | None = None,
+        compact: bool = False,
+    ) -> list[TemporalContextResultDto] | list[ProjectedModel]:
+        projection = (
+            get_projection(TemporalContextResultDto, fields, compact=compact)
+            if fields or compact
+            else None
+        )
+        with self.__lock:
+            return self.__find_top_temporal_contexts.execute(
+                top_k=top_k,
+                projection=projection,
+            )
+
+    def save_contexts_bulk(
+        self,
+        *,
+        contexts: list[dict[str, Any]],
+        delete_ids: list[str] | None = None,
+    ) -> SaveTemporalContextsBulkResultDto:
+        with self.__lock:
+            return self.__save_temporal_contexts_bulk.execute(
+                items=contexts,
+                delete_ids=delete_ids,
+            )
+
+    def get_context_usage(
+        self,
+        *,
+        context_id: str,
+        days: int = 7,
+    ) -> ContextUsageResultDto:
+        with self.__lock:
+            return self.__find_context_usage.execute(context_id=context_id, days=days)
+
+    def get_load_status(self) -> list[ContextLoadProgress]:
+        with self.__lock:
+            return self.__ctx_repository.find_load_progress()
+
+    def get_schedule_occupancy(self) -> ScheduleOccupancyDto:
+        with self.__lock:
+            return self.__find_schedule_occupancy.execute()
+
+    def simulate_schedule(
+        self,
+        *,
+        contexts: list[dict[str, Any]] | None = None,
+        delete_ids: list[str] | None = None,
+        times: list[datetime] | None = None,
+        week: bool = False,
+    ) -> ScheduleSimulationDto:
+        with self.__lock:
+            return self.__simulate_schedule.execute(
+                items=contexts or [],
+                delete_ids=delete_ids,
+                times=times,
+                week=week,
+            )
 
     def list_contexts(
         self,
         *,
-        context_type: str | None = None,
+        context_type: ContextType | None = None,
         actives: bool | None = None,
-    ) -> str:
-        contexts = self.__find_temporal_context.execute(
-            context_type=context_type,
-            actives=actives,
-        )
+        fields: list[str] | None = None,
+        compact: bool = False,
+    ) -> str | list[ProjectedModel]:
+        with self.__lock:
+            contexts = [
+                context.model_copy(update={"last_used": self.__find_last_used(context)})
+                for context in self.__find_temporal_context.execute(
+                    context_type=context_type,
+                    actives=actives,
+                )
+            ]
+        if fields or compact:
+            projection = get_projection(TemporalContext, fields, compact=compact)
+            return [projection.dump(context) for context in contexts]
+
         result_text = f"📋 **Temporal Contexts** ({len(contexts)} found)\n\n"
 
         for context in contexts:
@@ -59,13 +244,80 @@ class Controller:
                 else "Never"
             )
 
+            validity = " ".join(
+                f"{label} {moment.strftime('%Y-%m-%d %H:%M')}"
+                for label, moment in (
+                    ("from", context.valid_from),
+                    ("until", context.expires_at),
+                )
+                if moment is not None
+            )
+
             result_text += f"""**{context.name}** ({context.id})
         • Type: {context.context_type}
         • Status: {status}
         • Pattern: {pattern_desc}
         • Priority: {context.priority}
+        • Valid: {validity or "Always"}
         • Last used: {last_used}
 
         """
 
         return result_text
+
+    def __find_last_used(self, context: TemporalContext) -> datetime | None:
+        """Newest usage from the usage history, older files may still store one"""
+        history = self.__usage_history_repository.find_by_context_id(context.id)
+        return (history.last_used() if history else None) or context.last_used
+
+    def search_contexts(
+        self,
+        *,
+        query: str,
+        context_type: ContextType | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> ContextSearchResultDto:
+        with self.__lock:
+            return self.__search_temporal_contexts.execute(
+                query=query,
+                context_type=context_type,
+                limit=limit,
+                offset=offset,
+            )
+
+    def save_calendar(
+        self,
+        *,
+        calendar_id: str,
+        name: str,
+        dates: list[str] | None = None,
+        ranges: list[tuple[str, str]] | None = None,
+    ) -> bool:
+        with self.__lock:
+            return self.__calendar_repository.save(
+                {
+                    "id": calendar_id,
+                    "name": name,
+                    "dates": dates or [],
+                    "ranges": ranges or [],
+                },
+            )
+
+    def delete_calendar(self, *, calendar_id: str) -> bool:
+        with self.__lock:
+            return self.__calendar_repository.delete_one_by_id(calendar_id)
+
+    def list_calendars(self) -> str:
+        with self.__lock:
+            calendars = self.__calendar_repository.find()
+        result_text = f"📅 **Calendars** ({len(calendars)} found)\n\n"
+
+        for calendar in calendars:
+            result_text += f"""**{calendar["name"]}** ({calendar["id"]})
+        • Dates: {len(calendar["dates"])}
+        • Ranges: {len(calendar["ranges"])}
+
+        """
+
+        return result_text
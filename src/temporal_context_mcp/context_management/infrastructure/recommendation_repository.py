@@ -1,5 +1,9 @@
 from temporal_context_mcp.context_management import RecommendationRepository
+from temporal_context_mcp.context_management.domain import TemporalContext
 from temporal_context_mcp.core import settings
+from temporal_context_mcp.recommendation import (
+    Recommendation,
+)
 from temporal_context_mcp.recommendation import (
     RecommendationRepositoryImpl as Repository,
 )
@@ -10,8 +14,36 @@ class RecommendationRepositoryImpl(RecommendationRepository):
     def __init__(self) -> None:
         self.repository = Repository(settings=settings)
 
+    @property
+    def version(self) -> int:
+        return self.repository.version
+
     def find_by_context_type(self, context_type: ContextType) -> dict[str, str] | None:
         recommendation = self.repository.find_by_context_type(context_type)
         if recommendation:
             return recommendation.model_dump(mode="json")
         return None
+
+    def find_by_context(self, context: TemporalContext) -> dict[str, str] | None:
+        recommendation = self.repository.find_by_context(
+            context.context_type,
+            context.id,
+        )
+        if recommendation:
+            return recommendation.model_dump(mode="json")
+        return None
+
+    def find_merged(self, contexts: list[TemporalContext]) -> dict[str, str] | None:
+        weighted_recommendations = [
+            (recommendation, context.priority)
+            for context in contexts
+            if (
+                recommendation := self.repository.find_by_context(
+                    context.context_type,
+                    context.id,
+                )
+            )
+        ]
+        if not weighted_recommendations:
+            return None
+        return Recommendation.merge(weighted_recommendations).model_dump(mode="json")
@@ -0,0 +1,227 @@
+import gc
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from temporal_context_mcp.context_management.domain import (
+    ContextLoadProgress,
+    TemporalContext,
+)
+from temporal_context_mcp.shared.domain.utils.json_stream import JsonArrayReader
+
+# Smaller files are validated in process, starting workers would cost more
+PARALLEL_MIN_BYTES = 8 << 20
+CHUNK_RECORDS = 2000
+MAX_REPORTED_ERRORS = 20
+
+CONTEXTS_ADAPTER = TypeAdapter(list[TemporalContext])
+
+
+class RejectedContext(NamedTuple):
+    index: int
+    error: str
+    record: Any
+
+
+class ContextLoadResult(NamedTuple):
+    contexts: list[TemporalContext]
+    rejected: list[RejectedContext]
+    progress: ContextLoadProgress
+
+
+def validate_contexts(
+    start: int,
+    records: list[Any],
+) -> list[TemporalContext | RejectedContext]:
+    """Validates decoded records, rejecting the invalid ones one by one
+
+    The chunk is validated in a single call and only validated record by
+    record again when some record in it is invalid.
+    """
+    try:
+        return CONTEXTS_ADAPTER.validate_python(records)
+    except ValidationError:
+        pass
+
+    results = []
+    for index, record in enumerate(records, start):
+        try:
+            results.append(TemporalContext.model_validate(record))
+        except ValidationError as e:
+            error = "; ".join(
+                f"{'.'.join(map(str, error['loc'])) or 'record'}: {error['msg']}"
+                for error in e.errors()
+            )
+            results.append(RejectedContext(index, error, record))
+    return results
+
+
+def validate_raw_contexts(
+    start: int,
+    records: list[str],
+) -> list[TemporalContext | RejectedContext]:
+    """Validates records given as JSON text, as sent to the process pool"""
+    try:
+        return CONTEXTS_ADAPTER.validate_json(f"[{','.join(records)}]")
+    except ValidationError:
+        return validate_contexts(start, [json.loads(record) for record in records])
+
+
+class TemporalContextLoader:
+    """Streaming loader of contexts files
+
+    The JSON array is parsed item by item and validated in chunks, on a process
+    pool for large files, with a bounded number of chunks in flight, so memory
+    stays close to the loaded contexts themselves. Invalid records are rejected
+    individually and a syntax error only loses the records after it.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        on_progress: Callable[[ContextLoadProgress], None] | None = None,
+        parallel_min_bytes: int = PARALLEL_MIN_BYTES,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.on_progress = on_progress
+        self.parallel_min_bytes = parallel_min_bytes
+
+    def load(self, f: BinaryIO, file_name: str) -> ContextLoadResult:
+        progress = ContextLoadProgress(
+            file_name=file_name,
+            total_bytes=os.fstat(f.fileno()).st_size,
+        )
+        result = ContextLoadResult([], [], progress)
+        parallel = self.workers > 1 and progress.total_bytes >= self.parallel_min_bytes
+        # Text is much cheaper than decoded records to send to the workers
+        reader = JsonArrayReader(f, raw=parallel)
+
+        def collect(validated: list[TemporalContext | RejectedContext]) -> None:
+            for item in validated:
+                if isinstance(item, RejectedContext):
+                    result.rejected.append(item)
+                    self.__report_error(progress, f"#{item.index}: {item.error}")
+                else:
+                    result.contexts.append(item)
+            progress.loaded = len(result.contexts)
+            progress.rejected = len(result.rejected)
+            progress.bytes_read = reader.bytes_read
+            self.__notify(progress)
+
+        self.__notify(progress)
+        # Nothing loaded can be garbage, pausing the collector saves rescanning
+        # every new context on each collection
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.__load(reader, progress, collect, parallel=parallel)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        progress.bytes_read = reader.bytes_read
+        progress.finished = True
+        self.__notify(progress)
+        return result
+
+    def __load(
+        self,
+        reader: JsonArrayReader,
+        progress: ContextLoadProgress,
+        collect: Callable[[list[TemporalContext | RejectedContext]], None],
+        *,
+        parallel: bool,
+    ) -> None:
+        with self.__executor(parallel=parallel) as executor:
+            pending: deque[Future] = deque()
+            try:
+                for number, records in enumerate(_chunks(reader)):
+                    start = number * CHUNK_RECORDS
+                    if executor is None:
+                        collect(validate_contexts(start, records))
+                        continue
+                    pending.append(
+                        executor.submit(validate_raw_contexts, start, records),
+                    )
+                    if len(pending) >= 2 * self.workers:
+                        collect(pending.popleft().result())
+            except json.JSONDecodeError as e:
+                progress.corrupt = True
+                self.__report_error(
+                    progress,
+                    f"Invalid JSON after byte {reader.bytes_read}: {e.msg}",
+                )
+            finally:
+                while pending:
+                    collect(pending.popleft().result())
+
+    @contextmanager
+    def __executor(self, *, parallel: bool) -> Iterator[Executor | None]:
+        if not parallel:
+            yield None
+            return
+        # Spawned, forking a process with running threads is unsafe
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            yield executor
+
+    def __notify(self, progress: ContextLoadProgress) -> None:
+        if self.on_progress is not None:
+            self.on_progress(progress)
+
+    @staticmethod
+    def __report_error(progress: ContextLoadProgress, error: str) -> None:
+        if len(progress.errors) < MAX_REPORTED_ERRORS:
+            progress.errors.append(error)
+
+
+def _chunks(reader: JsonArrayReader) -> Iterator[list[Any]]:
+    """Groups the records, flushing the ones read before invalid JSON"""
+    chunk = []
+    try:
+        for record in reader:
+            chunk.append(record)
+            if len(chunk) == CHUNK_RECORDS:
+                yield chunk
+                chunk = []
+    except json.JSONDecodeError:
+        if chunk:
+            yield chunk
+        raise
+    if chunk:
+        yield chunk
+
+
+def quarantine(file_path: Path, result: ContextLoadResult) -> list[Path]:
+    """Sets aside what a load could not use, returns the files written
+
+    Rejected records are appended to a JSON lines file next to the contexts
+    file, and a file cut short by invalid JSON is copied there as is.
+    """
+    paths = []
+    if result.progress.corrupt:
+        paths.append(file_path.with_name(f"{file_path.name}.{time.time_ns()}.corrupt"))
+        shutil.copyfile(file_path, paths[-1])
+    if result.rejected:
+        paths.append(file_path.with_name(f"{file_path.stem}.quarantine.jsonl"))
+        with open(paths[-1], "a", encoding="utf-8") as f:
+            for rejected in result.rejected:
+                entry = {
+                    "index": rejected.index,
+                    "error": rejected.error,
+                    "record": rejected.record,
+                }
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return paths
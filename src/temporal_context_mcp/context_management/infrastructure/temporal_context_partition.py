@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.context_management.infrastructure.temporal_context_loader import (  # noqa: E501
+    TemporalContextLoader,
+    quarantine,
+)
+from temporal_context_mcp.shared import JsonFileStore
+
+
+class TemporalContextPartition:
+    """Contexts of a single type, stored in their own file
+
+    The file is only read on first access and when another process changed it.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        loader: TemporalContextLoader | None = None,
+    ) -> None:
+        self.store = JsonFileStore(file_path)
+        self.loader = loader or TemporalContextLoader()
+        self.contexts: list[TemporalContext] = []
+        self.positions: dict[str, int] = {}
+        self.loaded = False
+
+    def find_one_by_id(self, context_id: str) -> TemporalContext | None:
+        position = self.positions.get(context_id)
+        return self.contexts[position] if position is not None else None
+
+    def refresh(self) -> bool:
+        """Loads the partition if needed, returns whether its contexts changed"""
+        if self.loaded and not self.store.has_changed():
+            return False
+
+        previous_contexts = self.contexts
+        if self.store.exists():
+            self.__read_contexts()
+        else:
+            self.replace([])
+        self.loaded = True
+        return self.contexts != previous_contexts
+
+    def replace(self, contexts: list[TemporalContext]) -> None:
+        """Sorts contexts in resolution order and rebuilds the ID index"""
+        self.contexts = sorted(contexts, key=TemporalContext.resolution_key)
+        self.positions = {
+            context.id: position for position, context in enumerate(self.contexts)
+        }
+
+    def save(self) -> None:
+        """Saves the partition to its JSON file"""
+        try:
+            self.write()
+        except Exception as e:
+            print(f"Error saving contexts: {e}")
+
+    def write(self) -> None:
+        """Writes the partition to its JSON file, raising on failure"""
+        self.store.write(
+            [context.model_dump(mode="json") for context in self.contexts],
+        )
+
+    def __read_contexts(self) -> None:
+        """Streams the file in, setting aside the records that cannot be loaded"""
+        with self.store.lock():
+            try:
+                with self.store.open_for_read() as f:
+                    result = self.loader.load(f, self.store.file_path.name)
+            except Exception as e:
+                print(f"Error loading contexts: {e}")
+                self.replace([])
+                return
+
+            self.replace(result.contexts)
+            if result.rejected or result.progress.corrupt:
+                paths = quarantine(self.store.file_path, result)
+                print(
+                    f"Error loading contexts: {result.progress.rejected} invalid "
+                    f"records, set aside in {', '.join(map(str, paths))}",
+                )
+                self.save()
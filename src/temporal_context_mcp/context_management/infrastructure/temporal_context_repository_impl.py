@@ -1,127 +1,516 @@
+import heapq
 import json
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import override
 
 from temporal_context_mcp.context_management.domain import (
+    ContextLoadProgress,
+    ContextSearchHit,
+    ContextSearchIndex,
+    ContextSearchPage,
     TemporalContext,
     TemporalContextRepository,
 )
+from temporal_context_mcp.context_management.domain.port.calendar_repository import (
+    CalendarRepository,
+)
+from temporal_context_mcp.context_management.infrastructure.temporal_context_loader import (  # noqa: E501
+    TemporalContextLoader,
+    quarantine,
+)
+from temporal_context_mcp.context_management.infrastructure.temporal_context_partition import (  # noqa: E501
+    TemporalContextPartition,
+)
 from temporal_context_mcp.shared import (
     ContextType,
+    DateOrdinalSet,
+    JsonFileStore,
     TimePattern,
     TimePatternUtils,
     default_false,
     get_current_datetime,
 )
+from temporal_context_mcp.shared.domain.utils.json_file_store import (
+    write_json_atomically,
+)
+
+PARTITIONS_DIR_NAME = "temporal_contexts"
+LEGACY_CONTEXTS_FILE_NAME = "temporal_contexts.json"
+ARCHIVE_FILE_NAME = "temporal_contexts_archive.jsonl"
 
 
 class TemporalContextRepositoryImpl(TemporalContextRepository):
-    """Management of persistent storage for temporal contexts"""
+    """Management of persistent storage for temporal contexts
+
+    Contexts are partitioned by type, one JSON file per type under
+    `temporal_contexts/`. Partitions are loaded on first access, typed queries
+    only read their own partition and writes only rewrite the partitions they
+    change. Files are streamed in, see `TemporalContextLoader`. A search index
+    is kept up to date with every write and every partition (re)load.
 
-    def __init__(self, data_dir: str = "data") -> None:
+    Contexts with an `expires_at` are kept in a min-heap by expiry. Once expired
+    they are moved out of their partition into an append-only archive file,
+    which is never read back, so partitions only hold current contexts.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "data",
+        calendar_repository: CalendarRepository | None = None,
+        load_workers: int | None = None,
+    ) -> None:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self.contexts_file = self.data_dir / "temporal_contexts.json"
-        self.contexts: list[TemporalContext] = []
-        self.__load_contexts()
+        self.partitions_dir = self.data_dir / PARTITIONS_DIR_NAME
+        self.archive_file = self.data_dir / ARCHIVE_FILE_NAME
+        self.loader = TemporalContextLoader(
+            workers=load_workers,
+            on_progress=self.__record_load_progress,
+        )
+        self.partitions: dict[ContextType, TemporalContextPartition] = {
+            context_type: TemporalContextPartition(
+                self.partitions_dir / f"{context_type.value}.json",
+                self.loader,
+            )
+            for context_type in ContextType
+        }
+        self.__load_progress: dict[str, ContextLoadProgress] = {}
+        self.calendar_repository = calendar_repository
+        self.__matchers: dict[str, TimePatternUtils] = {}
+        self.__calendars: dict[str, DateOrdinalSet] = {}
+        self.__search_index = ContextSearchIndex()
+        # Heap entries are checked against the current expiries when popped
+        self.__expiry_heap: list[tuple[datetime, str]] = []
+        self.__expiries: dict[str, datetime] = {}
+        self.__version = 0
+        self.__initialize_partitions()
+
+    @property
+    @override
+    def version(self) -> int:
+        """Revision of the contexts and calendars, not bumped by usage marks
+
+        Files changed by other processes and calendar edits are checked first,
+        so the revision is current without listing any context.
+        """
+        self.__refresh(self.partitions.values())
+        self.__refresh_calendars()
+        return self.__version
 
     @override
-    def find_one_by_id(self, context_id: str) -> TemporalContext | None:
+    def find_load_progress(self) -> list[ContextLoadProgress]:
+        """Gets the progress of the latest load of each contexts file"""
+        return list(self.__load_progress.values())
+
+    @override
+    def find_one_by_id(
+        self,
+        context_id: str,
+        *,
+        archive_expired: bool = True,
+    ) -> TemporalContext | None:
         """Gets a context by ID"""
-        return next(
-            (context for context in self.contexts if context.id == context_id),
-            None,
-        )
+        partition = self.__locate([context_id]).get(context_id)
+        if partition is None:
+            return None
+        if not archive_expired:
+            if context_id in self.__find_expired_ids():
+                return None
+        elif self.__archive_expired():
+            partition = self.__locate([context_id]).get(context_id)
+        return partition.find_one_by_id(context_id) if partition else None
 
     @override
     def find(
         self,
         context_type: ContextType | None = None,
         actives: bool | None = None,
+        limit: int | None = None,
+        at: datetime | None = None,
+        *,
+        archive_expired: bool = True,
     ) -> list[TemporalContext]:
-        """Lists all contexts, optionally filtered by type"""
-        contexts = self.contexts.copy()
-        if context_type is not None:
-            contexts = [c for c in contexts if c.context_type == context_type]
-        if actives is not None:
-            current_time = get_current_datetime()
-            contexts = [
-                context
-                for context in contexts
-                if context.active
-                and TimePatternUtils(
-                    context.time_pattern,
-                ).is_time_match(current_time)
-            ]
-        contexts.sort(key=lambda x: x.priority)
+        """Lists contexts by descending priority, optionally filtered by type
+
+        Partitions are kept in resolution order and merged lazily, so the scan
+        stops as soon as `limit` matches are found.
+        """
+        partitions = (
+            [self.partitions[context_type]]
+            if context_type is not None
+            else list(self.partitions.values())
+        )
+        self.__refresh(partitions)
+        expired_ids = self.__expire(archive=archive_expired)
+        current_time = (at or get_current_datetime()) if actives is not None else None
+        contexts = []
+        for context in heapq.merge(
+            *(partition.contexts for partition in partitions),
+            key=TemporalContext.resolution_key,
+        ):
+            if limit is not None and len(contexts) >= limit:
+                break
+            if context.id in expired_ids:
+                continue
+            if current_time is not None and not (
+                context.active
+                and context.is_valid_at(current_time)
+                and self.__matcher(context).is_time_match(current_time)
+            ):
+                continue
+            contexts.append(context)
         return contexts
 
+    @override
+    def search(
+        self,
+        query: str,
+        *,
+        context_type: ContextType | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        archive_expired: bool = True,
+    ) -> ContextSearchPage:
+        """Ranks the contexts whose name, ID or type match the query"""
+        self.__refresh(self.partitions.values())
+        expired_ids = self.__expire(archive=archive_expired)
+        if expired_ids:
+            # Still indexed, so they are ranked and left out before paging
+            ranked, _ = self.__search_index.search(query, context_type=context_type)
+            ranked = [item for item in ranked if item[0] not in expired_ids]
+            total = len(ranked)
+            ranked = ranked[offset : offset + limit if limit is not None else None]
+        else:
+            ranked, total = self.__search_index.search(
+                query,
+                context_type=context_type,
+                limit=limit,
+                offset=offset,
+            )
+        return ContextSearchPage(
+            total=total,
+            hits=[
+                ContextSearchHit(
+                    context=self.partitions[
+                        self.__search_index.documents[context_id][2]
+                    ].find_one_by_id(context_id),
+                    score=score,
+                )
+                for context_id, score in ranked
+            ],
+        )
+
     @override
     @default_false
     def save(self, context: TemporalContext) -> bool:
         """Adds a new context"""
-        if any(c.id == context.id for c in self.contexts):
-            for i, ctx in enumerate(self.contexts):
-                if ctx.id == context.id:
-                    self.contexts[i] = context
-                    self.__save_contexts()
-                    return True
-            return False
+        with self.__transaction([context.id], [context.context_type]) as located:
+            partition = self.partitions[context.context_type]
+            previous_partition = located.get(context.id)
+            if previous_partition is not None and previous_partition is not partition:
+                previous_partition.replace(
+                    [c for c in previous_partition.contexts if c.id != context.id],
+                )
+                previous_partition.save()
 
-        self.contexts.append(context)
-        self.__save_contexts()
+            contexts = [c for c in partition.contexts if c.id != context.id]
+            partition.replace([*contexts, context])
+            self.__search_index.add(context)
+            self.__schedule_expiry(context)
+            self.__version += 1
+            partition.save()
         return True
 
+    @override
+    def bulk_write(
+        self,
+        *,
+        upserts: list[TemporalContext],
+        delete_ids: list[str],
+    ) -> list[str]:
+        """Upserts and deletes contexts in a single write, returns the deleted IDs
+
+        Only the partitions holding or receiving these contexts are rewritten.
+        """
+        with self.__transaction(
+            [*(context.id for context in upserts), *delete_ids],
+            {context.context_type for context in upserts},
+        ) as located:
+            deleted_ids = [
+                context_id
+                for context_id in dict.fromkeys(delete_ids)
+                if context_id in located
+            ]
+
+            affected = set(located.values()) | {
+                self.partitions[context.context_type] for context in upserts
+            }
+            contents = {
+                partition: {context.id: context for context in partition.contexts}
+                for partition in affected
+            }
+            locations = dict(located)
+            for context_id in deleted_ids:
+                del contents[locations.pop(context_id)][context_id]
+            for context in upserts:
+                if context.id in locations:
+                    contents[locations[context.id]].pop(context.id, None)
+                locations[context.id] = self.partitions[context.context_type]
+                contents[locations[context.id]][context.id] = context
+
+            for partition in affected:
+                partition.replace(list(contents[partition].values()))
+            for context_id in deleted_ids:
+                self.__forget(context_id)
+            for context in upserts:
+                self.__search_index.add(context)
+                self.__schedule_expiry(context)
+            self.__version += 1
+            try:
+                for partition in affected:
+                    partition.write()
+            except Exception:
+                # Some partitions may be written already, reload them from disk
+                for partition in affected:
+                    partition.loaded = False
+                raise
+        return deleted_ids
+
     @override
     def delete_one_by_id(self, context_id: str) -> bool:
         """Deletes a context"""
-        original_length = len(self.contexts)
-        self.contexts = [c for c in self.contexts if c.id != context_id]
+        with self.__transaction([context_id]) as located:
+            partition = located.get(context_id)
+            if partition is None:
+                return False
 
-        if len(self.contexts) < original_length:
-            self.__save_contexts()
-            return True
-        return False
+            partition.replace([c for c in partition.contexts if c.id != context_id])
+            self.__forget(context_id)
+            self.__version += 1
+            partition.save()
+        return True
 
-    @override
-    def mark_one_as_used(self, context_id: str) -> None:
-        """Marks a context as recently used"""
-        for context in self.contexts:
-            if context.id == context_id:
-                context.last_used = get_current_datetime()
-                self.__save_contexts()
+    @contextmanager
+    def __transaction(
+        self,
+        context_ids: Iterable[str],
+        context_types: Iterable[ContextType] = (),
+    ) -> Iterator[dict[str, TemporalContextPartition]]:
+        """Locks the partitions involved and picks up changes from other processes
+
+        Yields the partition currently holding each of the existing contexts.
+        """
+        context_ids = list(context_ids)
+        partitions = {self.partitions[context_type] for context_type in context_types}
+        while True:
+            involved = partitions | set(self.__locate(context_ids).values())
+            with ExitStack() as stack:
+                # Always locked in the same order to avoid deadlocks
+                for partition in self.partitions.values():
+                    if partition in involved:
+                        stack.enter_context(partition.store.lock())
+                self.__refresh(involved)
+                located = self.__locate(context_ids)
+                # Retry if another process moved a context to another partition
+                if set(located.values()) <= involved:
+                    yield located
+                    return
+
+    def __locate(
+        self,
+        context_ids: Iterable[str],
+    ) -> dict[str, TemporalContextPartition]:
+        """Finds the partition of each context, loading partitions only as needed"""
+        pending = set(context_ids)
+        located = {}
+        if not pending:
+            return located
+
+        loaded = [p for p in self.partitions.values() if p.loaded]
+        unloaded = [p for p in self.partitions.values() if not p.loaded]
+        for partitions in (loaded, unloaded):
+            self.__refresh(partitions)
+            for partition in partitions:
+                for context_id in pending & partition.positions.keys():
+                    located[context_id] = partition
+            pending -= located.keys()
+            if not pending:
                 break
+        return located
 
-    def __load_contexts(self) -> None:
-        """Loads contexts from the JSON file"""
-        if self.contexts_file.exists():
-            try:
-                with open(self.contexts_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.contexts = [
-                        TemporalContext.model_validate(context_data)
-                        for context_data in data
-                    ]
-            except Exception as e:
-                print(f"Error loading contexts: {e}")
-                self.contexts = []
-                self.__save_contexts()
-        else:
-            self.__create_default_contexts()
+    def __record_load_progress(self, progress: ContextLoadProgress) -> None:
+        self.__load_progress[progress.file_name] = progress
+
+    def __refresh(self, partitions: Iterable[TemporalContextPartition]) -> None:
+        """Loads partitions on first access and reloads those changed elsewhere"""
+        changed = False
+        for partition in partitions:
+            # A first load reveals contexts but does not change any of them
+            was_loaded = partition.loaded
+            if partition.refresh():
+                self.__track(partition)
+                changed = was_loaded or changed
+        if changed:
+            self.__version += 1
+
+    def __track(self, partition: TemporalContextPartition) -> None:
+        """Brings the search index and expiries in line with a (re)loaded partition"""
+        context_type = next(t for t, p in self.partitions.items() if p is partition)
+        for context_id, document in list(self.__search_index.documents.items()):
+            if document[2] == context_type and context_id not in partition.positions:
+                self.__forget(context_id)
+        for context in partition.contexts:
+            self.__search_index.add(context)
+            self.__schedule_expiry(context)
+
+    def __forget(self, context_id: str) -> None:
+        """Drops what is derived from a context that left the repository"""
+        self.__matchers.pop(context_id, None)
+        self.__search_index.remove(context_id)
+        self.__expiries.pop(context_id, None)
+
+    def __schedule_expiry(self, context: TemporalContext) -> None:
+        if context.expires_at is None:
+            self.__expiries.pop(context.id, None)
+        elif self.__expiries.get(context.id) != context.expires_at:
+            self.__expiries[context.id] = context.expires_at
+            heapq.heappush(self.__expiry_heap, (context.expires_at, context.id))
+
+    def __expire(self, *, archive: bool) -> set[str]:
+        """Archives the expired contexts, or only finds them if reads cannot write"""
+        if archive:
+            self.__archive_expired()
+            return set()
+        return self.__find_expired_ids()
+
+    def __find_expired_ids(self) -> set[str]:
+        """IDs of the expired contexts still waiting to be archived"""
+        now = get_current_datetime()
+        if not self.__expiry_heap or self.__expiry_heap[0][0] > now:
+            return set()
+        return {
+            context_id
+            for context_id, expires_at in self.__expiries.items()
+            if expires_at <= now
+        }
+
+    def __archive_expired(self) -> bool:
+        """Moves the expired contexts to the archive, returns whether any moved"""
+        now = get_current_datetime()
+        expired_ids = []
+        while self.__expiry_heap and self.__expiry_heap[0][0] <= now:
+            expires_at, context_id = heapq.heappop(self.__expiry_heap)
+            if self.__expiries.get(context_id) == expires_at:
+                del self.__expiries[context_id]
+                expired_ids.append(context_id)
+        if not expired_ids:
+            return False
 
-    def __save_contexts(self) -> None:
-        """Saves contexts to the JSON file"""
         try:
-            data = [context.model_dump(mode="json") for context in self.contexts]
-            with open(self.contexts_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            with self.__transaction(expired_ids) as located:
+                # Another process may have archived or extended them meanwhile
+                expired = [
+                    context
+                    for context_id, partition in located.items()
+                    if (context := partition.find_one_by_id(context_id)).expires_at
+                    is not None
+                    and context.expires_at <= now
+                ]
+                if not expired:
+                    return False
+
+                with open(self.archive_file, "a", encoding="utf-8") as f:
+                    f.write(
+                        "".join(
+                            f"{json.dumps(context.model_dump(mode='json'))}\n"
+                            for context in expired
+                        ),
+                    )
+                expired_ids = {context.id for context in expired}
+                for partition in {located[context_id] for context_id in expired_ids}:
+                    partition.replace(
+                        [c for c in partition.contexts if c.id not in expired_ids],
+                    )
+                    partition.save()
+                for context_id in expired_ids:
+                    self.__forget(context_id)
+                self.__version += 1
         except Exception as e:
-            print(f"Error saving contexts: {e}")
+            print(f"Error archiving contexts: {e}")
+            return False
+        return True
+
+    def __refresh_calendars(self) -> None:
+        """Drops the compiled time patterns once the calendars change"""
+        if self.calendar_repository is not None:
+            calendars = self.calendar_repository.find_date_sets()
+            if calendars is not self.__calendars:
+                self.__calendars = calendars
+                self.__matchers = {}
+                self.__version += 1
+
+    def __matcher(self, context: TemporalContext) -> TimePatternUtils:
+        """Gets the compiled time pattern of a context"""
+        self.__refresh_calendars()
+        matcher = self.__matchers.get(context.id)
+        if matcher is None or matcher.pattern is not context.time_pattern:
+            matcher = TimePatternUtils(context.time_pattern, self.__calendars)
+            self.__matchers[context.id] = matcher
+        return matcher
+
+    def __initialize_partitions(self) -> None:
+        """Creates the partitions from the legacy single file or with examples"""
+        legacy_store = JsonFileStore(self.data_dir / LEGACY_CONTEXTS_FILE_NAME)
+        with legacy_store.lock():
+            if self.partitions_dir.exists():
+                return
 
-    def __create_default_contexts(self) -> None:
+            migrated = False
+            contexts = self.__create_default_contexts()
+            if legacy_store.exists():
+                try:
+                    with legacy_store.open_for_read() as f:
+                        result = self.loader.load(f, legacy_store.file_path.name)
+                    contexts = result.contexts
+                    migrated = True
+                    if result.rejected or result.progress.corrupt:
+                        paths = quarantine(legacy_store.file_path, result)
+                        print(
+                            f"Error loading contexts: {result.progress.rejected} "
+                            f"invalid records, set aside in "
+                            f"{', '.join(map(str, paths))}",
+                        )
+                except Exception as e:
+                    print(f"Error loading contexts: {e}")
+                    contexts = []
+
+            # Written aside and renamed into place, so partitions appear all at once
+            temp_dir = Path(tempfile.mkdtemp(dir=self.data_dir))
+            for context_type, partition in self.partitions.items():
+                partition_contexts = [
+                    context.model_dump(mode="json")
+                    for context in contexts
+                    if context.context_type == context_type
+                ]
+                if partition_contexts:
+                    write_json_atomically(
+                        temp_dir / partition.store.file_path.name,
+                        partition_contexts,
+                    )
+            temp_dir.rename(self.partitions_dir)
+            if migrated:
+                legacy_store.file_path.rename(
+                    legacy_store.file_path.with_suffix(".json.migrated"),
+                )
+
+    @staticmethod
+    def __create_default_contexts() -> list[TemporalContext]:
         """Creates example contexts to demonstrate functionality"""
-        default_contexts = [
+        return [
             TemporalContext(
                 id="work_hours",
                 name="Work Schedule",
@@ -150,6 +539,3 @@ class TemporalContextRepositoryImpl(TemporalContextRepository):
                 created_at=datetime.now(),
             ),
         ]
-
-        self.contexts = default_contexts
-        self.__save_contexts()
@@ -0,0 +1,140 @@
+import os
+import struct
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import override
+from urllib.parse import quote
+
+from temporal_context_mcp.context_management.domain import (
+    UsageHistory,
+    UsageHistoryRepository,
+)
+from temporal_context_mcp.shared.domain.utils.json_file_store import (
+    FileFingerprint,
+    get_file_fingerprint,
+    lock_file,
+)
+
+HEADER = struct.Struct("=qq")  # head, count
+SLOT = struct.Struct("=q")
+
+
+class UsageHistoryRepositoryImpl(UsageHistoryRepository):
+    """Fixed-size binary storage of usage histories, one file per context
+
+    Each file holds a header and `capacity` epoch-second slots, so recording a
+    usage rewrites a single slot and the header instead of the whole history.
+    Records are written under an advisory lock and the in-memory copy is only
+    reloaded when another process changed the file.
+    """
+
+    def __init__(self, data_dir: str = "data", capacity: int = 1024) -> None:
+        self.history_dir = Path(data_dir) / "usage_history"
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self.histories: dict[str, UsageHistory] = {}
+        self.fingerprints: dict[str, FileFingerprint] = {}
+
+    @override
+    def find_by_context_id(self, context_id: str) -> UsageHistory | None:
+        """Gets the usage history of a context"""
+        fingerprint = get_file_fingerprint(self.__history_file(context_id))
+        if fingerprint is None:
+            return None
+        history = self.histories.get(context_id)
+        if history is None or fingerprint != self.fingerprints.get(context_id):
+            history = self.__load_history(context_id)
+        return history
+
+    @override
+    def record(self, context_id: str, used_at: datetime) -> None:
+        """Records a usage of a context"""
+        history_file = self.__history_file(context_id)
+        try:
+            self.__create_history_file(history_file)
+            with open(history_file, "r+b") as f, lock_file(f):
+                # The header moves on every record, so it tells whether another
+                # process wrote since our last record, even within one mtime tick
+                history = self.histories.get(context_id)
+                file_size = os.fstat(f.fileno()).st_size
+                header = HEADER.unpack(f.read(HEADER.size))
+                if (
+                    history is None
+                    or header != (history.head, history.count)
+                    or file_size != self.__file_size()
+                ):
+                    f.seek(0)
+                    history = self.__parse_history(f.read())
+                    self.histories[context_id] = history
+
+                slot = history.record(used_at)
+                f.seek(0)
+                f.write(HEADER.pack(history.head, history.count))
+                if file_size != self.__file_size():
+                    f.write(history.timestamps.tobytes())
+                    f.truncate()
+                else:
+                    f.seek(HEADER.size + slot * SLOT.size)
+                    f.write(SLOT.pack(history.timestamps[slot]))
+                f.flush()
+                self.fingerprints[context_id] = FileFingerprint.of(
+                    os.fstat(f.fileno()),
+                )
+        except Exception as e:
+            print(f"Error saving usage history: {e}")
+
+    @override
+    def delete_by_context_id(self, context_id: str) -> None:
+        """Deletes the usage history of a context"""
+        self.histories.pop(context_id, None)
+        self.fingerprints.pop(context_id, None)
+        self.__history_file(context_id).unlink(missing_ok=True)
+
+    def __file_size(self) -> int:
+        return HEADER.size + self.capacity * SLOT.size
+
+    def __history_file(self, context_id: str) -> Path:
+        return self.history_dir / f"{quote(context_id, safe='')}.bin"
+
+    def __load_history(self, context_id: str) -> UsageHistory | None:
+        """Loads a usage history from its binary file"""
+        try:
+            with open(self.__history_file(context_id), "rb") as f, lock_file(f):
+                history = self.__parse_history(f.read())
+                fingerprint = FileFingerprint.of(os.fstat(f.fileno()))
+        except Exception as e:
+            print(f"Error loading usage history: {e}")
+            return None
+
+        self.histories[context_id] = history
+        self.fingerprints[context_id] = fingerprint
+        return history
+
+    def __parse_history(self, raw: bytes) -> UsageHistory:
+        head, count = HEADER.unpack_from(raw)
+        timestamps = array("q")
+        timestamps.frombytes(raw[HEADER.size :])
+        if len(timestamps) == self.capacity:
+            return UsageHistory(self.capacity, timestamps, head, count)
+
+        # Capacity changed, keep the newest usages that still fit
+        stored = UsageHistory(len(timestamps), timestamps, head, count)
+        history = UsageHistory(capacity=self.capacity)
+        for timestamp in list(stored)[-self.capacity :]:
+            history.record(datetime.fromtimestamp(timestamp))
+        return history
+
+    def __create_history_file(self, history_file: Path) -> None:
+        """Creates an empty history file unless another process already did"""
+        if history_file.exists():
+            return
+        # Written aside and hard-linked into place, so it never appears half written
+        temp_file = history_file.with_name(f".{history_file.name}.{os.getpid()}.tmp")
+        temp_file.write_bytes(bytes(self.__file_size()))
+        try:
+            os.link(temp_file, history_file)
+        except FileExistsError:
+            pass
+        finally:
+            temp_file.unlink(missing_ok=True)
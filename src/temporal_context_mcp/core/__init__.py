@@ -1,3 +1,13 @@
+from temporal_context_mcp.core.profiler import ProfileHotspot, ToolProfiler
+from temporal_context_mcp.core.resource_subscriptions import ResourceSubscriptions
 from temporal_context_mcp.core.settings import Settings, settings
+from temporal_context_mcp.core.socket_transport import socket_transport
 
-__all__ = ["Settings", "settings"]
+__all__ = [
+    "ProfileHotspot",
+    "ResourceSubscriptions",
+    "Settings",
+    "ToolProfiler",
+    "settings",
+    "socket_transport",
+]
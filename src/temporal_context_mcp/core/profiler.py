@@ -0,0 +1,166 @@
+import cProfile
+import functools
+import inspect
+import json
+import pstats
+import random
+import threading
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from time import time_ns
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from temporal_context_mcp.core.settings import Settings
+
+ALLOCATION_TOP_N = 25
+
+
+class ProfileHotspot(BaseModel):
+    function: str = Field(..., description="Function name")
+    location: str = Field(..., description="File and line of the function")
+    calls: int = Field(..., description="Number of calls")
+    total_time: float = Field(..., description="Time spent in the function itself")
+    cumulative_time: float = Field(..., description="Time including sub-calls")
+
+
+class ToolProfiler:
+    """Opt-in sampling profiler for MCP tool handlers"""
+
+    def __init__(self, settings: Settings) -> None:
+        self.enabled = settings.profiling_enabled
+        self.sample_rate = settings.profiling_sample_rate
+        self.max_files = settings.profiling_max_files
+        self.profiles_dir = Path(settings.data_dir) / settings.profiling_dir_name
+        self.__random = random.Random()  # noqa: S311
+        self.__lock = threading.Lock()
+        if self.enabled:
+            self.profiles_dir.mkdir(parents=True, exist_ok=True)
+
+    def profile(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wraps a tool handler so that a sample of its calls is profiled"""
+        if not self.enabled:
+            return func
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                if not self.__should_sample():
+                    return await func(*args, **kwargs)
+                profile = self.__start()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.__stop(profile, func.__name__)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            if not self.__should_sample():
+                return func(*args, **kwargs)
+            profile = self.__start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.__stop(profile, func.__name__)
+
+        return wrapper
+
+    def find_hotspots(
+        self,
+        *,
+        limit: int = 10,
+        tool_name: str | None = None,
+    ) -> list[ProfileHotspot]:
+        """Aggregates the stored CPU profiles and returns the hottest functions"""
+        pattern = f"*-{tool_name}.prof" if tool_name else "*.prof"
+        files = [str(path) for path in sorted(self.profiles_dir.glob(pattern))]
+        if not files:
+            return []
+
+        stats = pstats.Stats(*files)
+        entries = sorted(
+            stats.stats.items(),  # type: ignore[attr-defined]
+            key=lambda item: item[1][2],
+            reverse=True,
+        )
+        return [
+            ProfileHotspot(
+                function=function,
+                location=f"{file_name}:{line}",
+                calls=calls,
+                total_time=total_time,
+                cumulative_time=cumulative_time,
+            )
+            for (file_name, line, function), (
+                _,
+                calls,
+                total_time,
+                cumulative_time,
+                _,
+            ) in entries[:limit]
+        ]
+
+    def __should_sample(self) -> bool:
+        return self.__random.random() < self.sample_rate
+
+    def __start(self) -> cProfile.Profile | None:
+        # cProfile cannot run twice at the same time, overlapping calls are skipped
+        if not self.__lock.acquire(blocking=False):
+            return None
+        tracemalloc.start()
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def __stop(self, profile: cProfile.Profile | None, tool_name: str) -> None:
+        if profile is None:
+            return
+        try:
+            profile.disable()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.__write(profile, snapshot, peak, tool_name)
+        except Exception as e:
+            print(f"Error saving profile: {e}")
+        finally:
+            self.__lock.release()
+
+    def __write(
+        self,
+        profile: cProfile.Profile,
+        snapshot: tracemalloc.Snapshot,
+        peak: int,
+        tool_name: str,
+    ) -> None:
+        """Writes CPU and allocation results and rotates old files"""
+        base_name = f"{time_ns()}-{tool_name}"
+        profile.dump_stats(self.profiles_dir / f"{base_name}.prof")
+
+        allocations = [
+            {
+                "location": str(stat.traceback),
+                "size": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[:ALLOCATION_TOP_N]
+        ]
+        with open(
+            self.profiles_dir / f"{base_name}.alloc.json",
+            "w",
+            encoding="utf-8",
+        ) as f:
+            json.dump({"peak": peak, "allocations": allocations}, f, indent=2)
+
+        self.__rotate()
+
+    def __rotate(self) -> None:
+        profiles = sorted(self.profiles_dir.glob("*.prof"))
+        for stale in profiles[: max(len(profiles) - self.max_files, 0)]:
+            stale.unlink(missing_ok=True)
+            stale.with_suffix(".alloc.json").unlink(missing_ok=True)
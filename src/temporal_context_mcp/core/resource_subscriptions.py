@@ -0,0 +1,52 @@
+import weakref
+from typing import Any
+
+from mcp.server.lowlevel import Server
+from mcp.server.session import ServerSession
+from mcp.types import ServerCapabilities
+from pydantic import AnyUrl
+
+
+class ResourceSubscriptions:
+    """Sessions subscribed to resource updates
+
+    Registers the subscribe/unsubscribe handlers on the low-level server and
+    advertises the `resources.subscribe` capability, which it hard-codes off.
+    Sessions are held weakly, so closed sessions drop out on their own.
+    """
+
+    def __init__(self, server: Server) -> None:
+        self.server = server
+        self.__sessions: dict[str, weakref.WeakSet[ServerSession]] = {}
+
+        server.subscribe_resource()(self.__subscribe)
+        server.unsubscribe_resource()(self.__unsubscribe)
+        get_capabilities = server.get_capabilities
+
+        def get_subscribable_capabilities(*args: Any) -> ServerCapabilities:  # noqa: ANN401
+            capabilities = get_capabilities(*args)
+            if capabilities.resources is not None:
+                capabilities.resources.subscribe = True
+            return capabilities
+
+        server.get_capabilities = get_subscribable_capabilities
+
+    def count(self, uri: str) -> int:
+        return len(self.__sessions.get(uri, ()))
+
+    async def notify(self, uri: str) -> None:
+        """Sends a resource-updated notification to every subscribed session"""
+        for session in list(self.__sessions.get(uri, ())):
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+            except Exception as e:
+                print(f"Error notifying {uri}: {e}")
+                self.__sessions[uri].discard(session)
+
+    async def __subscribe(self, uri: AnyUrl) -> None:
+        session = self.server.request_context.session
+        self.__sessions.setdefault(str(uri), weakref.WeakSet()).add(session)
+
+    async def __unsubscribe(self, uri: AnyUrl) -> None:
+        session = self.server.request_context.session
+        self.__sessions.get(str(uri), weakref.WeakSet()).discard(session)
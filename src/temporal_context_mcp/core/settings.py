@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,6 +8,19 @@ class Settings(BaseSettings):
     data_dir: str = "data"
     contexts_file_name: str = "context.json"
     recommendations_file_name: str = "recommendations.json"
+    recommendation_layers_file_name: str = "recommendation_layers.json"
+    recommendation_tenant: str = ""
+    calendars_file_name: str = "calendars.json"
+    usage_history_capacity: int = Field(default=1024, gt=0)
+    context_load_workers: int = 0
+    schedule_horizon_minutes: int = 1440
+
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = Field(default=0.1, ge=0, le=1)
+    profiling_dir_name: str = "profiles"
+    profiling_max_files: int = 50
+
+    daemon_socket_path: str = ""
 
 
 settings = Settings()
@@ -0,0 +1,83 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio
+import anyio.lowlevel
+from anyio.abc import ByteStream
+from anyio.streams.buffered import BufferedByteReceiveStream
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from mcp import types
+from mcp.shared.message import SessionMessage
+
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+@asynccontextmanager
+async def socket_transport(
+    stream: ByteStream,
+) -> AsyncIterator[
+    tuple[
+        MemoryObjectReceiveStream[SessionMessage | Exception],
+        MemoryObjectSendStream[SessionMessage],
+    ]
+]:
+    """MCP transport over a byte stream with newline-delimited JSON-RPC
+
+    Same framing as the stdio transport, usable on both ends of a socket.
+    """
+    read_stream_writer, read_stream = anyio.create_memory_object_stream[
+        SessionMessage | Exception
+    ](0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream[
+        SessionMessage
+    ](0)
+    buffered_stream = BufferedByteReceiveStream(stream)
+    writer_done = anyio.Event()
+
+    async def socket_reader() -> None:
+        async with read_stream_writer:
+            while True:
+                try:
+                    line = await buffered_stream.receive_until(
+                        b"\n",
+                        MAX_MESSAGE_BYTES,
+                    )
+                except (
+                    anyio.EndOfStream,
+                    anyio.IncompleteRead,
+                    anyio.BrokenResourceError,
+                    anyio.ClosedResourceError,
+                ):
+                    break
+                try:
+                    message = types.JSONRPCMessage.model_validate_json(line)
+                except Exception as exc:
+                    await read_stream_writer.send(exc)
+                    continue
+                await read_stream_writer.send(SessionMessage(message))
+
+    async def socket_writer() -> None:
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    json = session_message.message.model_dump_json(
+                        by_alias=True,
+                        exclude_none=True,
+                    )
+                    await stream.send(json.encode() + b"\n")
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            await anyio.lowlevel.checkpoint()
+        finally:
+            writer_done.set()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(socket_reader)
+        tg.start_soon(socket_writer)
+        try:
+            yield read_stream, write_stream
+        finally:
+            # Let the writer flush what was already sent, then stop reading
+            await write_stream.aclose()
+            with anyio.move_on_after(1):
+                await writer_done.wait()
+            tg.cancel_scope.cancel()
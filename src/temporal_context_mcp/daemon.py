@@ -0,0 +1,63 @@
+"""Shared long-lived server for many MCP clients
+
+Listens on a Unix domain socket and runs one MCP session per connection
+against a single loaded server, so clients share the data, caches and the
+context change scheduler. Clients connect through `temporal_context_mcp.shim`.
+"""
+
+import fcntl
+import os
+from pathlib import Path
+
+import anyio
+from anyio.abc import SocketStream
+
+from temporal_context_mcp.core import settings, socket_transport
+from temporal_context_mcp.server import mcp
+from temporal_context_mcp.shim import PRIVATE_DIR_MODE, get_socket_path
+
+
+async def handle_connection(stream: SocketStream) -> None:
+    server = mcp._mcp_server  # noqa: SLF001
+    try:
+        async with stream, socket_transport(stream) as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    except Exception as e:
+        print(f"Error in daemon session: {e}")
+
+
+async def serve(socket_path: Path) -> None:
+    """Serves MCP sessions on the socket unless another daemon already does"""
+    # A configured socket may live in a shared directory, which is left as is
+    socket_path.parent.mkdir(mode=PRIVATE_DIR_MODE, parents=True, exist_ok=True)
+    lock_fd = os.open(
+        socket_path.with_suffix(".lock"),
+        os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW,
+        0o600,
+    )
+    with os.fdopen(lock_fd, "r+b") as lock_file:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print(f"A daemon is already listening on {socket_path}")
+            return
+
+        # Holding the lock means any existing socket file is stale
+        socket_path.unlink(missing_ok=True)
+        listener = await anyio.create_unix_listener(socket_path)
+        os.chmod(socket_path, 0o600)
+        print(f"Listening on {socket_path}")
+        async with listener:
+            await listener.serve(handle_connection)
+
+
+def main() -> None:
+    anyio.run(serve, get_socket_path(settings.daemon_socket_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""End-to-end load test of the MCP server
+
+Simulates concurrent agents, each with its own in-memory MCP client session
+against the real `server.mcp` app, calling tools according to a weighted mix
+with random think times. Runs offline against an empty temporary data directory.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import math
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from mcp import ClientSession, types
+from pydantic import BaseModel, Field
+
+DEFAULT_MIX = "get_current_context=8,list_contexts=1,save_contexts_bulk=1"
+PERCENTILES = (50, 95, 99)
+
+
+def _save_contexts_bulk_arguments(rng: random.Random, agent: int) -> dict[str, Any]:
+    return {
+        "contexts": [
+            {
+                "id": f"load_{agent}_{rng.randrange(16)}",
+                "name": f"Load test context of agent {agent}",
+                "context_type": rng.choice(["focus_time", "availability"]),
+                "time_pattern": {"hour_range": sorted(rng.sample(range(24), 2))},
+                "priority": rng.randint(1, 3),
+            },
+        ],
+    }
+
+
+def _save_calendar_arguments(rng: random.Random, agent: int) -> dict[str, Any]:
+    return {
+        "calendar_id": f"load_{agent}",
+        "name": f"Load test calendar of agent {agent}",
+        "dates": [f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"],
+    }
+
+
+# Tool name -> arguments for a call made by an agent
+OPERATIONS: dict[str, Callable[[random.Random, int], dict[str, Any]]] = {
+    "get_current_context": lambda _rng, _agent: {},
+    "get_top_contexts": lambda _rng, _agent: {"top_k": 3},
+    "list_contexts": lambda _rng, _agent: {},
+    "list_calendars": lambda _rng, _agent: {},
+    "get_context_usage": lambda _rng, _agent: {"context_id": "work_hours"},
+    "save_contexts_bulk": _save_contexts_bulk_arguments,
+    "save_calendar": _save_calendar_arguments,
+}
+
+
+class OperationStats(BaseModel):
+    tool: str = Field(..., description="Tool name")
+    calls: int = Field(default=0, description="Completed calls")
+    errors: int = Field(default=0, description="Calls that returned an error")
+    throughput: float = Field(default=0.0, description="Calls per second")
+    latency_ms: dict[str, float] = Field(
+        default={},
+        description="Latency percentiles (p50, p95, p99) in milliseconds",
+    )
+
+
+class LoadTestReport(BaseModel):
+    agents: int = Field(..., description="Concurrent simulated agents")
+    duration_seconds: float = Field(..., description="Measured wall time")
+    total: OperationStats = Field(..., description="All tools together")
+    operations: list[OperationStats] = Field(default=[], description="Per tool")
+    bytes_written: int | None = Field(
+        default=None,
+        description="Bytes written by the process (None if not measurable)",
+    )
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parses a `tool=weight,...` mix"""
+    weights = {}
+    for item in mix.split(","):
+        tool, _, weight = item.strip().partition("=")
+        if tool not in OPERATIONS:
+            msg = f"Unknown tool in mix: {tool}"
+            raise ValueError(msg)
+        weights[tool] = float(weight or 1)
+    return weights
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def call_tool(
+    session: ClientSession,
+    name: str,
+    arguments: dict[str, Any],
+) -> types.CallToolResult:
+    """Calls a tool without the client-side output schema validation
+
+    Real clients validate in their own process, here it would run in the
+    measured one and dominate the latencies.
+    """
+    return await session.send_request(
+        types.ClientRequest(
+            types.CallToolRequest(
+                method="tools/call",
+                params=types.CallToolRequestParams(name=name, arguments=arguments),
+            ),
+        ),
+        types.CallToolResult,
+    )
+
+
+def read_bytes_written() -> int | None:
+    """Bytes passed to write calls by this process, on Linux"""
+    try:
+        with open("/proc/self/io", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+async def run_load_test(
+    *,
+    agents: int = 10,
+    duration_seconds: float = 10.0,
+    mix: dict[str, float] | None = None,
+    think_time_ms: float = 0.0,
+    seed: int | None = None,
+) -> LoadTestReport:
+    """Runs the simulated agents against `server.mcp` and measures the calls"""
+    from mcp.shared.memory import (  # noqa: PLC0415
+        create_connected_server_and_client_session,
+    )
+
+    from temporal_context_mcp.server import mcp  # noqa: PLC0415
+
+    mix = mix or parse_mix(DEFAULT_MIX)
+    tools = list(mix)
+    weights = list(mix.values())
+    latencies: dict[str, list[float]] = {tool: [] for tool in tools}
+    errors: dict[str, int] = dict.fromkeys(tools, 0)
+    master_rng = random.Random(seed)  # noqa: S311
+
+    async def run_agent(agent: int, deadline: float) -> None:
+        rng = random.Random(master_rng.random())  # noqa: S311
+        async with create_connected_server_and_client_session(
+            mcp._mcp_server,  # noqa: SLF001
+        ) as session:
+            await session.initialize()
+            while time.perf_counter() < deadline:
+                tool = rng.choices(tools, weights)[0]
+                arguments = OPERATIONS[tool](rng, agent)
+                started = time.perf_counter()
+                result = await call_tool(session, tool, arguments)
+                latencies[tool].append(time.perf_counter() - started)
+                if result.isError:
+                    errors[tool] += 1
+                if think_time_ms > 0:
+                    await asyncio.sleep(rng.expovariate(1000 / think_time_ms))
+
+    bytes_before = read_bytes_written()
+    started = time.perf_counter()
+    deadline = started + duration_seconds
+    async with asyncio.TaskGroup() as tg:
+        for agent in range(agents):
+            tg.create_task(run_agent(agent, deadline))
+    elapsed = time.perf_counter() - started
+    bytes_after = read_bytes_written()
+
+    operations = [
+        _operation_stats(tool, latencies[tool], errors[tool], elapsed) for tool in tools
+    ]
+    return LoadTestReport(
+        agents=agents,
+        duration_seconds=elapsed,
+        total=_operation_stats(
+            "total",
+            [latency for tool in tools for latency in latencies[tool]],
+            sum(errors.values()),
+            elapsed,
+        ),
+        operations=operations,
+        bytes_written=(
+            bytes_after - bytes_before
+            if bytes_before is not None and bytes_after is not None
+            else None
+        ),
+    )
+
+
+def format_report(report: LoadTestReport) -> str:
+    lines = [
+        f"⏱️ **Load test** ({report.agents} agents, {report.duration_seconds:.1f}s)",
+        "",
+        f"{'tool':<24}{'calls':>8}{'errors':>8}{'calls/s':>10}"
+        + "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES),
+    ]
+    lines.extend(
+        f"{stats.tool:<24}{stats.calls:>8}{stats.errors:>8}{stats.throughput:>10.1f}"
+        + "".join(f"{stats.latency_ms[f'p{p}']:>10.2f}" for p in PERCENTILES)
+        for stats in [*report.operations, report.total]
+    )
+    if report.bytes_written is not None:
+        per_call = report.bytes_written / max(report.total.calls, 1)
+        lines += [
+            "",
+            f"Bytes written: {report.bytes_written} ({per_call:.0f} per call)",
+        ]
+    return "\n".join(lines)
+
+
+def _operation_stats(
+    tool: str,
+    latencies: list[float],
+    errors: int,
+    elapsed: float,
+) -> OperationStats:
+    latencies = sorted(latencies)
+    return OperationStats(
+        tool=tool,
+        calls=len(latencies),
+        errors=errors,
+        throughput=len(latencies) / elapsed if elapsed > 0 else 0.0,
+        latency_ms={f"p{p}": percentile(latencies, p) * 1000 for p in PERCENTILES},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="tool=weight,...")
+    parser.add_argument("--think-time-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help="data directory to use, by default an empty temporary one seeded with the "
+        "built-in defaults",
+    )
+    parser.add_argument("--json", action="store_true", help="print a JSON report")
+    args = parser.parse_args()
+
+    from temporal_context_mcp.core import settings  # noqa: PLC0415
+
+    with contextlib.ExitStack() as stack:
+        if args.data_dir is None:
+            args.data_dir = stack.enter_context(
+                tempfile.TemporaryDirectory(prefix="temporal-context-load-"),
+            )
+        # Must be set before the server module is imported
+        settings.data_dir = str(Path(args.data_dir))
+        logging.getLogger("mcp").setLevel(logging.WARNING)
+
+        report = asyncio.run(
+            run_load_test(
+                agents=args.agents,
+                duration_seconds=args.duration,
+                mix=parse_mix(args.mix),
+                think_time_ms=args.think_time_ms,
+                seed=args.seed,
+            ),
+        )
+    print(report.model_dump_json(indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,13 @@ from temporal_context_mcp.recommendation.domain.port.recommendation_repository i
     RecommendationRepository,
 )
 from temporal_context_mcp.recommendation.domain.recommendation import Recommendation
+from temporal_context_mcp.recommendation.domain.recommendation_layers import (
+    RecommendationLayers,
+    RecommendationTable,
+)
+from temporal_context_mcp.recommendation.domain.recommendation_override import (
+    RecommendationOverride,
+)
 from temporal_context_mcp.recommendation.domain.value_object.detail_level import (
     DetailLevel,
 )
@@ -19,7 +26,10 @@ __all__ = [
     "DetailLevel",
     "FormalityLevel",
     "Recommendation",
+    "RecommendationLayers",
+    "RecommendationOverride",
     "RecommendationRepository",
     "RecommendationRepositoryImpl",
+    "RecommendationTable",
     "ResponseStyle",
 ]
@@ -8,3 +8,11 @@ class RecommendationRepository(ABC):
     @abstractmethod
     def find_by_context_type(self, context_type: ContextType) -> Recommendation | None:
         """Find all recommendations based on active context types"""
+
+    @abstractmethod
+    def find_by_context(
+        self,
+        context_type: ContextType,
+        context_id: str,
+    ) -> Recommendation | None:
+        """Finds the recommendation of a context, with its own overrides applied"""
@@ -1,3 +1,6 @@
+from enum import Enum
+from typing import Self
+
 from pydantic import BaseModel, Field
 
 from temporal_context_mcp.recommendation.domain.value_object.detail_level import (
@@ -20,3 +23,41 @@ class Recommendation(BaseModel):
     suggested_tools: list[str] = Field(default=[])
     avoid_topics: list[str] = Field(default=[])
     time_sensitive: bool = Field(default=False)
+
+    @classmethod
+    def merge(cls, weighted_recommendations: list[tuple[Self, int]]) -> Self:
+        """Merges recommendations, given in resolution order with their priority
+
+        Tools and topics are united, the first recommendation sets the style and
+        the formality and detail levels are the priority-weighted mean of all
+        levels, rounded towards the strictest one.
+        """
+        first, _ = weighted_recommendations[0]
+        if len(weighted_recommendations) == 1:
+            return first
+        recommendations = [r for r, _ in weighted_recommendations]
+        return cls(
+            context_type=first.context_type,
+            response_style=first.response_style,
+            formality_level=_weighted_level(
+                [(r.formality_level, w) for r, w in weighted_recommendations],
+            ),
+            detail_level=_weighted_level(
+                [(r.detail_level, w) for r, w in weighted_recommendations],
+            ),
+            suggested_tools=list(
+                dict.fromkeys(t for r in recommendations for t in r.suggested_tools),
+            ),
+            avoid_topics=list(
+                dict.fromkeys(t for r in recommendations for t in r.avoid_topics),
+            ),
+            time_sensitive=any(r.time_sensitive for r in recommendations),
+        )
+
+
+def _weighted_level[E: Enum](weighted_levels: list[tuple[E, int]]) -> E:
+    """Priority-weighted mean of levels declared from least to most strict"""
+    levels = list(type(weighted_levels[0][0]))
+    total = sum(levels.index(level) * weight for level, weight in weighted_levels)
+    weights = sum(weight for _, weight in weighted_levels)
+    return levels[-(-total // weights)]
@@ -0,0 +1,56 @@
+from pydantic import BaseModel, Field
+
+from temporal_context_mcp.recommendation.domain.recommendation import Recommendation
+from temporal_context_mcp.recommendation.domain.recommendation_override import (
+    RecommendationOverride,
+)
+from temporal_context_mcp.shared import ContextType
+
+# (context type, context ID or None for the type itself) -> recommendation
+type RecommendationTable = dict[tuple[ContextType, str | None], Recommendation]
+
+
+class RecommendationLayers(BaseModel):
+    """Overrides layered around the per context type recommendations
+
+    From lowest to highest precedence: global defaults, context type (the
+    recommendations list), individual context and tenant. A context type
+    recommendation only replaces the global defaults it changes.
+    """
+
+    defaults: RecommendationOverride | None = Field(default=None)
+    contexts: dict[str, RecommendationOverride] = Field(default={})
+    tenants: dict[str, RecommendationOverride] = Field(default={})
+
+    def resolve(
+        self,
+        recommendations: list[Recommendation],
+        tenant: str = "",
+    ) -> RecommendationTable:
+        """Flattens all layers into a table of final recommendations
+
+        Context types get an entry when they have a recommendation or global
+        defaults exist. Context overrides get an entry for every context type,
+        since a context may be of any of them.
+        """
+        by_type: dict[ContextType, Recommendation] = {}
+        for recommendation in recommendations:
+            by_type.setdefault(recommendation.context_type, recommendation)
+        tenant_override = self.tenants.get(tenant) or RecommendationOverride()
+
+        table: RecommendationTable = {}
+        for context_type in ContextType:
+            recommendation = Recommendation(context_type=context_type)
+            if self.defaults is not None:
+                recommendation = self.defaults.apply(recommendation)
+            if context_type in by_type:
+                recommendation = RecommendationOverride.of(
+                    by_type[context_type],
+                ).apply(recommendation)
+            if self.defaults is not None or context_type in by_type:
+                table[context_type, None] = tenant_override.apply(recommendation)
+            for context_id, override in self.contexts.items():
+                table[context_type, context_id] = tenant_override.apply(
+                    override.apply(recommendation),
+                )
+        return table
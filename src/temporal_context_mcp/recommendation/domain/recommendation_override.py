@@ -0,0 +1,39 @@
+from typing import Self
+
+from pydantic import BaseModel, Field
+
+from temporal_context_mcp.recommendation.domain.recommendation import Recommendation
+from temporal_context_mcp.recommendation.domain.value_object.detail_level import (
+    DetailLevel,
+)
+from temporal_context_mcp.recommendation.domain.value_object.formality_level import (
+    FormalityLevel,
+)
+from temporal_context_mcp.recommendation.domain.value_object.response_style import (
+    ResponseStyle,
+)
+
+
+class RecommendationOverride(BaseModel):
+    """Partial recommendation, only the fields it sets replace the inherited ones"""
+
+    response_style: ResponseStyle | None = Field(default=None)
+    formality_level: FormalityLevel | None = Field(default=None)
+    detail_level: DetailLevel | None = Field(default=None)
+    suggested_tools: list[str] | None = Field(default=None)
+    avoid_topics: list[str] | None = Field(default=None)
+    time_sensitive: bool | None = Field(default=None)
+
+    @classmethod
+    def of(cls, recommendation: Recommendation) -> Self:
+        """Override with the fields of a recommendation that differ from the defaults
+
+        Whether a field was set is lost once a recommendation is saved with all
+        of its fields, so only values tell what it overrides.
+        """
+        return cls.model_validate(
+            recommendation.model_dump(exclude_defaults=True, exclude={"context_type"}),
+        )
+
+    def apply(self, recommendation: Recommendation) -> Recommendation:
+        return recommendation.model_copy(update=self.model_dump(exclude_none=True))
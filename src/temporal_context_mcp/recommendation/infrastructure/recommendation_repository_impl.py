@@ -6,39 +6,83 @@ from temporal_context_mcp.recommendation import (
     DetailLevel,
     FormalityLevel,
     Recommendation,
+    RecommendationLayers,
     RecommendationRepository,
+    RecommendationTable,
     ResponseStyle,
 )
-from temporal_context_mcp.shared import (
-    ContextType,
-    load_models_from_json_file,
-    save_models_to_json_file,
-)
+from temporal_context_mcp.shared import ContextType, JsonFileStore
 
 
 class RecommendationRepositoryImpl(RecommendationRepository):
+    """Recommendations per context type plus optional override layers
+
+    The layers file holds global defaults, per context and per tenant overrides.
+    Whenever either file changes, all layers are resolved into a flat table, so
+    lookups never merge anything.
+    """
+
     def __init__(self, settings: Settings) -> None:
         self.data_dir = Path(settings.data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.recommendations_file = self.data_dir / settings.recommendations_file_name
+        self.layers_file = self.data_dir / settings.recommendation_layers_file_name
+        self.tenant = settings.recommendation_tenant
+        self.__store = JsonFileStore(self.recommendations_file)
+        self.__layers_store = JsonFileStore(self.layers_file)
         self.recommendations: list[Recommendation] = []
+        self.layers = RecommendationLayers()
+        self.table: RecommendationTable = {}
+        self.__version = 0
         self.__load_recommendations()
+        self.__load_layers()
+        self.__resolve()
+
+    @property
+    def version(self) -> int:
+        """Revision of the resolved table, checking both files for changes first"""
+        self.__refresh()
+        return self.__version
 
     @override
     def find_by_context_type(self, context_type: ContextType) -> Recommendation | None:
-        for rec in self.recommendations:
-            if rec.context_type == context_type:
-                return rec
-        return None
+        self.__refresh()
+        return self.table.get((context_type, None))
+
+    @override
+    def find_by_context(
+        self,
+        context_type: ContextType,
+        context_id: str,
+    ) -> Recommendation | None:
+        self.__refresh()
+        return self.table.get((context_type, context_id)) or self.table.get(
+            (context_type, None),
+        )
+
+    def __refresh(self) -> None:
+        """Resolves the layers again only if a file changed since it was read"""
+        changed = False
+        if self.__store.has_changed() and self.__store.exists():
+            self.__load_recommendations()
+            changed = True
+        if self.__layers_store.has_changed():
+            self.__load_layers()
+            changed = True
+        if changed:
+            self.__resolve()
+
+    def __resolve(self) -> None:
+        self.table = self.layers.resolve(self.recommendations, self.tenant)
+        self.__version += 1
 
     def __load_recommendations(self) -> None:
         """Loads recommendations from the JSON file"""
         if self.recommendations_file.exists():
             try:
-                self.recommendations = load_models_from_json_file(
-                    file_path=str(self.recommendations_file),
-                    model_class=Recommendation,
-                )
+                self.recommendations = [
+                    Recommendation.model_validate(item) for item in self.__store.read()
+                ]
             except Exception as e:
                 print(f"Error loading recommendations: {e}")
                 self.recommendations = []
@@ -46,12 +90,27 @@ class RecommendationRepositoryImpl(RecommendationRepository):
         else:
             self.__create_default_recommendations()
 
+    def __load_layers(self) -> None:
+        """Loads the override layers from their optional JSON file"""
+        self.layers = RecommendationLayers()
+        if not self.layers_file.exists():
+            self.__layers_store.fingerprint = None
+            return
+        try:
+            self.layers = RecommendationLayers.model_validate(
+                self.__layers_store.read(),
+            )
+        except Exception as e:
+            print(f"Error loading recommendation layers: {e}")
+
     def __save_recommendations(self) -> None:
         """Saves recommendations to the JSON file"""
         try:
-            save_models_to_json_file(
-                file_path=str(self.recommendations_file),
-                data=self.recommendations,
+            self.__store.write(
+                [
+                    recommendation.model_dump(mode="json")
+                    for recommendation in self.recommendations
+                ],
             )
         except Exception as e:
             print(f"Error saving recommendations: {e}")
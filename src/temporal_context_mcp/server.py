@@ -1,43 +1,319 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from typing import Any
+
 from mcp.server.fastmcp import FastMCP
 
 from temporal_context_mcp.context_management import (
+    ContextChangeScheduler,
     Controller,
-    TemporalContextRepository,
-    TemporalContextRepositoryImpl,
 )
 from temporal_context_mcp.context_management.application.dto import (
+    ContextSearchResultDto,
+    ContextUsageResultDto,
+    NotModifiedResultDto,
+    SaveTemporalContextsBulkResultDto,
+    ScheduleOccupancyDto,
+    ScheduleSimulationDto,
     TemporalContextResultDto,
 )
+from temporal_context_mcp.context_management.domain import ContextLoadProgress
+from temporal_context_mcp.core import (
+    ProfileHotspot,
+    ResourceSubscriptions,
+    ToolProfiler,
+    settings,
+)
+from temporal_context_mcp.shared import ContextType, ProjectedModel
 
-mcp = FastMCP("temporal-context-mcp")
+CURRENT_CONTEXT_URI = "context://current"
 
-context_repository: TemporalContextRepository = TemporalContextRepositoryImpl()
 controller = Controller()
+profiler = ToolProfiler(settings=settings)
+
+
+async def notify_current_context_changed() -> None:
+    await subscriptions.notify(CURRENT_CONTEXT_URI)
+
+
+scheduler = ContextChangeScheduler(
+    find_transition=controller.get_context_transition,
+    on_change=notify_current_context_changed,
+    max_sleep=timedelta(minutes=settings.schedule_horizon_minutes),
+)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_: FastMCP) -> AsyncIterator[None]:
+    """Runs the context change scheduler while any session is open"""
+    async with scheduler.running():
+        yield
+
+
+mcp = FastMCP("temporal-context-mcp", lifespan=lifespan)
+subscriptions = ResourceSubscriptions(mcp._mcp_server)  # noqa: SLF001
+
+
+@mcp.resource(CURRENT_CONTEXT_URI, mime_type="application/json")
+async def current_context() -> TemporalContextResultDto | None:
+    """Current temporal context and recommendations
+
+    Subscribe to get a resource-updated notification whenever it changes.
+    """
+    return await asyncio.to_thread(controller.get_current_context)
+
+
+# Profiled inside the worker thread, cProfile only sees the thread it runs in
+profiled_get_current_context = profiler.profile(controller.get_current_context)
+
+
+@mcp.tool()
+async def get_current_context(
+    if_none_match: int | None = None,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> TemporalContextResultDto | NotModifiedResultDto | ProjectedModel | None:
+    """Gets the current temporal context and recommendations
+
+    Args:
+        if_none_match: Version of a cached result; if it is still current only
+            a "not modified" response is returned (optional)
+        fields: Only return these fields, dotted paths select nested ones, e.g.
+            ["id", "recommendation.response_style", "version"] (optional)
+        compact: Leave out null and empty values
+    """
+    return await asyncio.to_thread(
+        profiled_get_current_context,
+        if_none_match=if_none_match,
+        fields=fields,
+        compact=compact,
+    )
 
 
 @mcp.tool()
-def get_current_context() -> TemporalContextResultDto | None:
-    """Gets the current temporal context and recommendations"""
-    return controller.get_current_context()
+@profiler.profile
+def get_top_contexts(
+    top_k: int = 3,
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> list[TemporalContextResultDto] | list[ProjectedModel]:
+    """Gets the k highest priority active temporal contexts and their recommendations
+
+    Args:
+        top_k: Maximum number of active contexts to return
+        fields: Only return these fields of each context, as in
+            `get_current_context` (optional)
+        compact: Leave out null and empty values
+    """
+    return controller.get_top_contexts(top_k=top_k, fields=fields, compact=compact)
 
 
 @mcp.tool()
+@profiler.profile
 def list_contexts(
-    context_type: str | None = None,
+    context_type: ContextType | None = None,
     actives: bool | None = None,
-) -> str:
+    fields: list[str] | None = None,
+    compact: bool = False,
+) -> str | list[ProjectedModel]:
     """Lists all temporal contexts
 
+    Returns a markdown summary, or the contexts as objects when `fields` or
+    `compact` are given.
+
     Args:
         context_type: Filter by context type (optional)
         actives: Filter currently active/inactive contexts
+        fields: Only return these fields of each context, e.g.
+            ["id", "priority", "time_pattern.hours"] (optional)
+        compact: Leave out null and empty values
     """
     return controller.list_contexts(
         context_type=context_type,
         actives=actives,
+        fields=fields,
+        compact=compact,
     )
 
 
+@mcp.tool()
+@profiler.profile
+def search_contexts(
+    query: str,
+    context_type: ContextType | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> ContextSearchResultDto:
+    """Searches temporal contexts by name, ID and type, best matches first
+
+    Whole words rank highest, but parts of words, plurals and small typos also
+    match.
+
+    Args:
+        query: Words to look for, e.g. "standup"
+        context_type: Only search contexts of this type (optional)
+        limit: Maximum number of hits to return
+        offset: Number of hits to skip, for the following pages
+    """
+    return controller.search_contexts(
+        query=query,
+        context_type=context_type,
+        limit=limit,
+        offset=offset,
+    )
+
+
+@mcp.tool()
+@profiler.profile
+def get_load_status() -> list[ContextLoadProgress]:
+    """Gets the progress of the latest load of each contexts file
+
+    Includes the records rejected by validation, which are set aside in a
+    `.quarantine.jsonl` file next to the contexts file, and whether invalid JSON
+    cut the load short.
+    """
+    return controller.get_load_status()
+
+
+@mcp.tool()
+@profiler.profile
+def save_contexts_bulk(
+    contexts: list[dict[str, Any]],
+    delete_ids: list[str] | None = None,
+) -> SaveTemporalContextsBulkResultDto:
+    """Creates or updates many temporal contexts and deletes others in a single write
+
+    Args:
+        contexts: Temporal contexts to upsert (id, name, context_type, time_pattern, priority)
+        delete_ids: IDs of the temporal contexts to delete (optional)
+    """
+    result = controller.save_contexts_bulk(
+        contexts=contexts,
+        delete_ids=delete_ids,
+    )
+    scheduler.wake()
+    return result
+
+
+@mcp.tool()
+@profiler.profile
+def get_context_usage(context_id: str, days: int = 7) -> ContextUsageResultDto:
+    """Gets how often a temporal context has been used
+
+    Args:
+        context_id: Temporal context ID
+        days: Number of days included in the per-day usage counts
+    """
+    return controller.get_context_usage(context_id=context_id, days=days)
+
+
+@mcp.tool()
+@profiler.profile
+def get_schedule_occupancy() -> ScheduleOccupancyDto:
+    """Audits the weekly schedule of the active contexts
+
+    Reports the minutes per week each context and context type is active, how
+    often priorities (or only creation dates) decide overlaps, the contexts that
+    never win and, per weekday (0=Sunday) and hour, the winning context and the
+    covered minutes as 7x24 heatmaps. Dates, calendars and recurrences are
+    evaluated for the current week.
+    """
+    return controller.get_schedule_occupancy()
+
+
+@mcp.tool()
+@profiler.profile
+def simulate_schedule(
+    contexts: list[dict[str, Any]] | None = None,
+    delete_ids: list[str] | None = None,
+    times: list[datetime] | None = None,
+    week: bool = False,
+) -> ScheduleSimulationDto:
+    """Simulates context changes without saving them
+
+    Answers which contexts would be active if the changes were saved, compared
+    with the current resolution. Nothing is written to disk.
+
+    Args:
+        contexts: Temporal contexts to add or edit, as in `save_contexts_bulk`
+        delete_ids: IDs of the temporal contexts to remove (optional)
+        times: Dates/times to resolve, now by default unless `week` is set
+        week: Also audit the occupancy of the week of the first time, as in
+            `get_schedule_occupancy`
+    """
+    return controller.simulate_schedule(
+        contexts=contexts,
+        delete_ids=delete_ids,
+        times=times,
+        week=week,
+    )
+
+
+@mcp.tool()
+@profiler.profile
+def save_calendar(
+    calendar_id: str,
+    name: str,
+    dates: list[str] | None = None,
+    ranges: list[tuple[str, str]] | None = None,
+) -> bool:
+    """Creates or replaces a calendar of dates (holidays, vacations, blackouts)
+
+    Contexts reference calendars through `include_calendars` / `exclude_calendars`
+    in their time pattern.
+
+    Args:
+        calendar_id: Calendar ID
+        name: Calendar name
+        dates: Single dates in ISO format (YYYY-MM-DD)
+        ranges: Inclusive date ranges as [start, end] pairs in ISO format
+    """
+    saved = controller.save_calendar(
+        calendar_id=calendar_id,
+        name=name,
+        dates=dates,
+        ranges=ranges,
+    )
+    scheduler.wake()
+    return saved
+
+
+@mcp.tool()
+@profiler.profile
+def delete_calendar(calendar_id: str) -> bool:
+    """Deletes a calendar
+
+    Args:
+        calendar_id: Calendar ID
+    """
+    deleted = controller.delete_calendar(calendar_id=calendar_id)
+    scheduler.wake()
+    return deleted
+
+
+@mcp.tool()
+@profiler.profile
+def list_calendars() -> str:
+    """Lists all calendars"""
+    return controller.list_calendars()
+
+
+@mcp.tool()
+def get_profile_hotspots(
+    limit: int = 10,
+    tool_name: str | None = None,
+) -> list[ProfileHotspot]:
+    """Gets the hottest functions recorded by the sampling profiler
+
+    Args:
+        limit: Maximum number of functions to return
+        tool_name: Only aggregate profiles of this tool (optional)
+    """
+    return profiler.find_hotspots(limit=limit, tool_name=tool_name)
+
+
 def main() -> None:
     mcp.run(transport="stdio")
 
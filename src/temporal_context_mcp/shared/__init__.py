@@ -1,23 +1,37 @@
 from temporal_context_mcp.shared.application.time_pattern_utils import TimePatternUtils
+from temporal_context_mcp.shared.domain.date_ordinal_set import DateOrdinalSet
 from temporal_context_mcp.shared.domain.time_pattern import TimePattern
 from temporal_context_mcp.shared.domain.utils.datetime_utils import get_current_datetime
 from temporal_context_mcp.shared.domain.utils.decorators import default_false
 from temporal_context_mcp.shared.domain.utils.id_utils import generate_id
+from temporal_context_mcp.shared.domain.utils.json_file_store import JsonFileStore
 from temporal_context_mcp.shared.domain.utils.json_utils import (
     load_models_from_json_file,
     save_models_to_json_file,
 )
+from temporal_context_mcp.shared.domain.utils.projection import (
+    ProjectedModel,
+    Projection,
+    get_projection,
+)
+from temporal_context_mcp.shared.domain.utils.single_flight import SingleFlight
 from temporal_context_mcp.shared.domain.value_object.context_type import ContextType
 from temporal_context_mcp.shared.domain.value_object.priority import Priority
 
 __all__ = [
     "ContextType",
+    "DateOrdinalSet",
+    "JsonFileStore",
     "Priority",
+    "ProjectedModel",
+    "Projection",
+    "SingleFlight",
     "TimePattern",
     "TimePatternUtils",
     "default_false",
     "generate_id",
     "get_current_datetime",
+    "get_projection",
     "load_models_from_json_file",
     "save_models_to_json_file",
 ]
@@ -0,0 +1,104 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+from dateutil import tz
+from dateutil.rrule import rrulestr
+
+DEFAULT_WINDOW = timedelta(days=14)
+
+
+class RecurrenceWindow:
+    """Occurrence intervals of an RRULE, expanded lazily over a rolling window
+
+    Lookups are a bisect over the cached intervals; the rule is only iterated
+    again when the target time leaves the expanded window, and a window far
+    behind the target is rebuilt around it rather than extended up to it.
+    """
+
+    def __init__(
+        self,
+        rule: str,
+        duration: timedelta,
+        window: timedelta = DEFAULT_WINDOW,
+    ) -> None:
+        # Contexts pin a missing DTSTART when created, see `TimePattern.anchored`
+        default_start = datetime.now().replace(
+            hour=0,
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+        self.rule = rrulestr(rule, dtstart=default_start, forceset=True)
+        self.duration = duration
+        self.window = window
+        first = next(iter(self.rule), None)
+        self.is_aware = first is not None and first.tzinfo is not None
+        self.is_empty = first is None
+        self.starts: list[datetime] = []
+        self.ends: list[datetime] = []
+        self.window_start: datetime | None = None
+        self.window_end: datetime | None = None
+
+    def contains(self, target: datetime) -> bool:
+        """Verifies if a moment falls inside one of the occurrences"""
+        if self.is_empty:
+            return False
+        target = self.__normalize(target)
+        if (
+            self.window_start is None
+            or target < self.window_start
+            # Nothing cached can still be running, skip the occurrences in between
+            or target - self.duration >= self.window_end
+        ):
+            self.__reset(target)
+        elif target >= self.window_end:
+            self.__extend(target)
+
+        position = bisect_right(self.starts, target) - 1
+        return position >= 0 and target < self.ends[position]
+
+    def occurrences(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Occurrence intervals overlapping `start` to `end`, without caching them"""
+        if self.is_empty:
+            return []
+        starts = self.rule.between(
+            self.__normalize(start) - self.duration,
+            self.__normalize(end),
+            inc=True,
+        )
+        return [(s, s + self.duration) for s in starts]
+
+    def __normalize(self, target: datetime) -> datetime:
+        if self.is_aware:
+            return target if target.tzinfo else target.replace(tzinfo=tz.tzlocal())
+        if target.tzinfo:
+            return target.astimezone(tz.tzlocal()).replace(tzinfo=None)
+        return target
+
+    def __reset(self, target: datetime) -> None:
+        """Expands a new window, including occurrences still running at `target`"""
+        self.window_start = target - self.duration
+        self.window_end = target + self.window
+        self.starts = self.rule.between(self.window_start, self.window_end, inc=True)
+        self.ends = [start + self.duration for start in self.starts]
+
+    def __extend(self, target: datetime) -> None:
+        """Appends the occurrences after the window and drops the finished ones"""
+        new_end = target + self.window
+        new_starts = [
+            start
+            for start in self.rule.between(self.window_end, new_end, inc=True)
+            if not self.starts or start > self.starts[-1]
+        ]
+        self.starts.extend(new_starts)
+        self.ends.extend(start + self.duration for start in new_starts)
+
+        self.window_start = target - self.duration
+        self.window_end = new_end
+        finished = bisect_right(self.ends, self.window_start)
+        del self.starts[:finished]
+        del self.ends[:finished]
@@ -1,15 +1,60 @@
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
 
 from croniter import croniter
 
+from temporal_context_mcp.shared.application.recurrence_window import (
+    RecurrenceWindow,
+)
+from temporal_context_mcp.shared.domain.date_ordinal_set import DateOrdinalSet
 from temporal_context_mcp.shared.domain.time_pattern import TimePattern
 
 SECONDS_IN_MINUTE = 60
+DEFAULT_DURATION_MINUTES = 60
+
+
+def parse_iso_dates(values: list[str]) -> list[date]:
+    """Parses ISO dates, ignoring the invalid ones"""
+    dates = []
+    for value in values:
+        try:
+            dates.append(date.fromisoformat(value))
+        except ValueError:
+            continue
+    return dates
 
 
 class TimePatternUtils:
-    def __init__(self, pattern: TimePattern) -> None:
+    def __init__(
+        self,
+        pattern: TimePattern,
+        calendars: Mapping[str, DateOrdinalSet] | None = None,
+    ) -> None:
         self.pattern = pattern
+        calendars = calendars or {}
+        self.specific_dates = (
+            DateOrdinalSet(parse_iso_dates(pattern.specific_dates))
+            if pattern.specific_dates
+            else None
+        )
+        self.include_calendars = (
+            [calendars.get(c, DateOrdinalSet()) for c in pattern.include_calendars]
+            if pattern.include_calendars
+            else None
+        )
+        self.exclude_calendars = [
+            calendars[c] for c in pattern.exclude_calendars or [] if c in calendars
+        ]
+        self.recurrence = (
+            RecurrenceWindow(
+                pattern.rrule,
+                timedelta(
+                    minutes=pattern.duration_minutes or DEFAULT_DURATION_MINUTES,
+                ),
+            )
+            if pattern.rrule
+            else None
+        )
         self.days_map = {
             0: "Sun",
             1: "Mon",
@@ -39,6 +84,21 @@ class TimePatternUtils:
         if self.pattern.cron_pattern:
             descriptions.append(f"Patrón: {self.pattern.cron_pattern}")
 
+        if self.pattern.rrule:
+            duration = self.pattern.duration_minutes or DEFAULT_DURATION_MINUTES
+            rule = self.pattern.rrule.replace("\n", " ")
+            descriptions.append(f"Recurrence: {rule} ({duration} min)")
+
+        if self.pattern.include_calendars:
+            descriptions.append(
+                f"Calendars: {', '.join(self.pattern.include_calendars)}",
+            )
+
+        if self.pattern.exclude_calendars:
+            descriptions.append(
+                f"Except: {', '.join(self.pattern.exclude_calendars)}",
+            )
+
         return " | ".join(descriptions) if descriptions else "Siempre activo"
 
     def is_time_match(self, target_time: datetime) -> bool:
@@ -62,10 +122,13 @@ class TimePatternUtils:
             if not (start_hour <= target_time.hour <= end_hour):
                 return False
 
-        # Check specific dates
-        if self.pattern.specific_dates:
-            date_str = target_time.strftime("%Y-%m-%d")
-            if date_str not in self.pattern.specific_dates:
+        # Check specific dates and calendars
+        if not self.is_date_match(target_time.date()):
+            return False
+
+        # Check recurrence
+        if self.recurrence is not None:
+            if not self.recurrence.contains(target_time):
                 return False
 
         # Check cron pattern
@@ -79,3 +142,13 @@ class TimePatternUtils:
                 return False
 
         return True
+
+    def is_date_match(self, target_date: date) -> bool:
+        """Verifies a date against the specific dates and calendars"""
+        if self.specific_dates is not None and target_date not in self.specific_dates:
+            return False
+        if self.include_calendars is not None and not any(
+            target_date in calendar for calendar in self.include_calendars
+        ):
+            return False
+        return not any(target_date in calendar for calendar in self.exclude_calendars)
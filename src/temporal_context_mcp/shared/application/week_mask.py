@@ -0,0 +1,168 @@
+import math
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from croniter import croniter
+from dateutil import tz
+
+from temporal_context_mcp.shared.application.time_pattern_utils import (
+    TimePatternUtils,
+)
+
+DAYS_IN_WEEK = 7
+HOURS_IN_DAY = 24
+MINUTES_IN_HOUR = 60
+MINUTES_IN_DAY = HOURS_IN_DAY * MINUTES_IN_HOUR
+MINUTES_IN_WEEK = DAYS_IN_WEEK * MINUTES_IN_DAY
+# Minutes are evaluated one second in, like the context transition probes, so
+# cron patterns match during the minute before each run as in `is_time_match`
+PROBE_SECOND = 1
+
+
+def get_week_start(at: datetime) -> datetime:
+    """Midnight of the Sunday starting the week of `at`"""
+    days_since_sunday = (at.weekday() + 1) % DAYS_IN_WEEK
+    return at.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
+        days=days_since_sunday,
+    )
+
+
+def get_minute_of_week(moment: datetime, week_start: datetime) -> int:
+    """Minute of the week starting at `week_start` in which `moment` falls"""
+    return math.floor(_minute_of_week(moment, week_start))
+
+
+def compile_week_mask(matcher: TimePatternUtils, week_start: datetime) -> np.ndarray:
+    """Minutes of the week (0=Sunday 00:00) in which a time pattern matches
+
+    Weekly fields are broadcast over a 7x24x60 grid and the date-dependent ones
+    (dates, calendars, recurrences and cron days) are evaluated for the dates of
+    the week starting at `week_start`, so no minute is matched one by one.
+    """
+    pattern = matcher.pattern
+    dates = [(week_start + timedelta(days=day)).date() for day in range(DAYS_IN_WEEK)]
+
+    days = np.array([matcher.is_date_match(d) for d in dates])
+    if pattern.days_of_week:
+        days &= np.isin(np.arange(DAYS_IN_WEEK), pattern.days_of_week)
+
+    hours = np.ones(HOURS_IN_DAY, dtype=bool)
+    if pattern.hours:
+        hours &= np.isin(np.arange(HOURS_IN_DAY), pattern.hours)
+    if pattern.hour_range:
+        start_hour, end_hour = pattern.hour_range
+        hours &= (np.arange(HOURS_IN_DAY) >= start_hour) & (
+            np.arange(HOURS_IN_DAY) <= end_hour
+        )
+
+    mask = np.repeat((days[:, None] & hours[None, :]).reshape(-1), MINUTES_IN_HOUR)
+    if matcher.recurrence is not None:
+        mask &= _recurrence_mask(matcher, week_start)
+    if pattern.cron_pattern:
+        mask &= _cron_mask(pattern.cron_pattern, week_start, dates)
+    return mask
+
+
+def compile_window_mask(
+    start: datetime | None,
+    end: datetime | None,
+    week_start: datetime,
+) -> np.ndarray:
+    """Minutes of the week within [start, end), unbounded on a None side"""
+    mask = np.zeros(MINUTES_IN_WEEK, dtype=bool)
+    first = 0 if start is None else _first_minute_from(start, week_start)
+    last = MINUTES_IN_WEEK if end is None else _first_minute_from(end, week_start)
+    mask[max(first, 0) : max(min(last, MINUTES_IN_WEEK), 0)] = True
+    return mask
+
+
+def _first_minute_from(moment: datetime, week_start: datetime) -> int:
+    """First minute of the week whose probe is at or after `moment`"""
+    return math.ceil(_minute_of_week(moment, week_start) - PROBE_SECOND / 60)
+
+
+def _minute_of_week(moment: datetime, week_start: datetime) -> float:
+    """Wall-clock minutes since `week_start`, in seconds resolution"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(week_start.tzinfo or tz.tzlocal())
+    days = (moment.date() - week_start.date()).days
+    seconds = moment.hour * 3600 + moment.minute * 60 + moment.second
+    return days * MINUTES_IN_DAY + (seconds + moment.microsecond / 1e6) / 60
+
+
+def _recurrence_mask(matcher: TimePatternUtils, week_start: datetime) -> np.ndarray:
+    mask = np.zeros(MINUTES_IN_WEEK, dtype=bool)
+    week_end = week_start + timedelta(days=DAYS_IN_WEEK)
+    for start, end in matcher.recurrence.occurrences(week_start, week_end):
+        # A minute matches if its probe falls in [start, end)
+        first = _first_minute_from(start, week_start)
+        last = _first_minute_from(end, week_start)
+        mask[max(first, 0) : max(min(last, MINUTES_IN_WEEK), 0)] = True
+    return mask
+
+
+def _cron_mask(
+    cron_pattern: str,
+    week_start: datetime,
+    dates: list[date],
+) -> np.ndarray:
+    """Minutes in which the next cron run is the following minute"""
+    try:
+        cron = croniter(cron_pattern, week_start)
+        runs = _cron_runs(cron, [*dates, dates[-1] + timedelta(days=1)])
+        if runs is None:
+            runs = _iterate_cron_runs(cron, week_start)
+    except Exception:
+        return np.zeros(MINUTES_IN_WEEK, dtype=bool)
+    return runs[1 : MINUTES_IN_WEEK + 1]
+
+
+def _cron_runs(cron: croniter, dates: list[date]) -> np.ndarray | None:
+    """Expands the cron fields over the given days, None if they are not plain"""
+    expanded = cron.expanded
+    if len(expanded) != 5 or cron.nth_weekday_of_month:  # noqa: PLR2004
+        return None
+    minutes, hours, days_of_month, months, days_of_week = expanded
+    if any(
+        value != "*" and not isinstance(value, int)
+        for field in expanded
+        for value in field
+    ):
+        return None
+
+    def allowed(field: list, values: list[int]) -> np.ndarray:
+        return (
+            np.ones(len(values), dtype=bool)
+            if field == ["*"]
+            else (np.isin(values, field))
+        )
+
+    day_of_month = allowed(days_of_month, [d.day for d in dates])
+    day_of_week = allowed(
+        [day if day == "*" else day % DAYS_IN_WEEK for day in days_of_week],
+        [(d.weekday() + 1) % DAYS_IN_WEEK for d in dates],
+    )
+    # Like cron, a restricted day of month and day of week match either one
+    if days_of_month != ["*"] and days_of_week != ["*"]:
+        days = day_of_month | day_of_week
+    else:
+        days = day_of_month & day_of_week
+    days &= allowed(months, [d.month for d in dates])
+
+    day_runs = (
+        allowed(hours, list(range(HOURS_IN_DAY)))[:, None]
+        & allowed(minutes, list(range(MINUTES_IN_HOUR)))[None, :]
+    ).reshape(-1)
+    return (days[:, None] & day_runs[None, :]).reshape(-1)
+
+
+def _iterate_cron_runs(cron: croniter, week_start: datetime) -> np.ndarray:
+    """Marks every run of the week one by one, for patterns that do not expand"""
+    runs = np.zeros(MINUTES_IN_WEEK + MINUTES_IN_DAY, dtype=bool)
+    cron.set_current(week_start - timedelta(seconds=1))
+    while True:
+        run = cron.get_next(datetime)
+        minute = int(_minute_of_week(run, week_start))
+        if minute >= len(runs):
+            return runs
+        runs[minute] = True
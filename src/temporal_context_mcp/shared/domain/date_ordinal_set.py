@@ -0,0 +1,38 @@
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import date
+
+
+class DateOrdinalSet:
+    """Set of dates stored as sorted, merged ordinal ranges with bisect lookup"""
+
+    def __init__(
+        self,
+        dates: Iterable[date] = (),
+        ranges: Iterable[tuple[date, date]] = (),
+    ) -> None:
+        pairs = sorted(
+            [(d.toordinal(), d.toordinal()) for d in dates]
+            + [
+                (min(start, end).toordinal(), max(start, end).toordinal())
+                for start, end in ranges
+            ],
+        )
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        for start, end in pairs:
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __contains__(self, target: date) -> bool:
+        ordinal = target.toordinal()
+        position = bisect_right(self.starts, ordinal) - 1
+        return position >= 0 and ordinal <= self.ends[position]
+
+    def __len__(self) -> int:
+        return sum(
+            end - start + 1 for start, end in zip(self.starts, self.ends, strict=True)
+        )
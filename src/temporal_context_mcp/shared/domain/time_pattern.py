@@ -1,4 +1,8 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+
+from dateutil import tz
+from dateutil.rrule import rrulestr
+from pydantic import BaseModel, Field, field_validator
 
 
 class TimePattern(BaseModel):
@@ -24,3 +28,44 @@ class TimePattern(BaseModel):
         description="Custom cron pattern",
         default=None,
     )
+    rrule: str | None = Field(
+        description=(
+            "RFC 5545 recurrence (e.g., "
+            "'DTSTART:20250107T090000\\nRRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=TU')"
+        ),
+        default=None,
+    )
+    duration_minutes: int | None = Field(
+        description="Duration of each recurrence occurrence in minutes (default 60)",
+        default=None,
+        gt=0,
+    )
+    include_calendars: list[str] | None = Field(
+        description="Calendar IDs, only dates in one of them match",
+        default=None,
+    )
+    exclude_calendars: list[str] | None = Field(
+        description="Calendar IDs, dates in any of them never match",
+        default=None,
+    )
+
+    @field_validator("rrule")
+    @classmethod
+    def validate_rrule(cls, value: str | None) -> str | None:
+        if value is not None:
+            rrulestr(value, forceset=True)
+        return value
+
+    def anchored(self, start: datetime) -> "TimePattern":
+        """Pins a recurrence without DTSTART to midnight of the day of `start`
+
+        Otherwise the series would start over, and intervals and counts shift,
+        every time the pattern is compiled again.
+        """
+        if self.rrule is None or "DTSTART" in self.rrule.upper():
+            return self
+        if start.tzinfo is not None:
+            start = start.astimezone(tz.tzlocal())
+        return self.model_copy(
+            update={"rrule": f"DTSTART:{start:%Y%m%d}T000000\n{self.rrule}"},
+        )
@@ -0,0 +1,120 @@
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, BinaryIO, NamedTuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking is available
+    fcntl = None
+
+
+class FileFingerprint(NamedTuple):
+    inode: int
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, stat_result: os.stat_result) -> "FileFingerprint":
+        return cls(stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+
+def get_file_fingerprint(file_path: Path) -> FileFingerprint | None:
+    try:
+        return FileFingerprint.of(file_path.stat())
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def lock_file(f: IO) -> Iterator[None]:
+    """Takes an exclusive advisory lock on an open file"""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def write_json_atomically(file_path: Path, data: Any) -> FileFingerprint:  # noqa: ANN401
+    """Writes JSON to a temporary file and renames it over the target"""
+    fd, temp_path = tempfile.mkstemp(
+        dir=file_path.parent,
+        prefix=f".{file_path.name}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+            fingerprint = FileFingerprint.of(os.fstat(f.fileno()))
+        os.replace(temp_path, file_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    return fingerprint
+
+
+class JsonFileStore:
+    """JSON file shared by several processes
+
+    Read-modify-write cycles run under an advisory lock on a sidecar `.lock`
+    file, writes are atomic (temporary file plus rename) and a stat fingerprint
+    tells whether another process changed the file since it was last read.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        self.file_path = file_path
+        self.lock_path = file_path.with_name(f"{file_path.name}.lock")
+        self.fingerprint: FileFingerprint | None = None
+        self.__thread_lock = threading.RLock()
+        self.__lock_file: IO | None = None
+        self.__depth = 0
+
+    def exists(self) -> bool:
+        return self.file_path.exists()
+
+    def has_changed(self) -> bool:
+        """Verifies if the file changed since it was last read or written"""
+        return get_file_fingerprint(self.file_path) != self.fingerprint
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Holds the cross-process lock, reentrant within the same thread"""
+        with self.__thread_lock:
+            if self.__depth == 0:
+                self.__lock_file = open(self.lock_path, "a+b")
+                if fcntl is not None:
+                    fcntl.flock(self.__lock_file.fileno(), fcntl.LOCK_EX)
+            self.__depth += 1
+            try:
+                yield
+            finally:
+                self.__depth -= 1
+                if self.__depth == 0:
+                    self.__lock_file.close()  # closing releases the flock
+                    self.__lock_file = None
+
+    def read(self) -> Any:  # noqa: ANN401
+        with self.lock(), open(self.file_path, encoding="utf-8") as f:
+            self.fingerprint = FileFingerprint.of(os.fstat(f.fileno()))
+            return json.load(f)
+
+    @contextmanager
+    def open_for_read(self) -> Iterator[BinaryIO]:
+        """Opens the file under the lock, for reads too large to parse at once"""
+        with self.lock(), open(self.file_path, "rb") as f:
+            self.fingerprint = FileFingerprint.of(os.fstat(f.fileno()))
+            yield f
+
+    def write(self, data: Any) -> None:  # noqa: ANN401
+        with self.lock():
+            self.fingerprint = write_json_atomically(self.file_path, data)
@@ -0,0 +1,108 @@
+import codecs
+import json
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+CHUNK_SIZE = 1 << 20
+# Longest item accepted, past it a syntax error is not taken for a cut item
+MAX_ITEM_SIZE = 64 << 20
+WHITESPACE = " \t\n\r"
+# A number cut after its "." or exponent still decodes, e.g. "1.5e" as 1.5 with
+# "e" left over, so a leftover of these characters may be a cut number
+CUT_NUMBER_TAIL = ".eE+-"
+MAX_CUT_NUMBER_TAIL_SIZE = 2
+
+
+class JsonArrayReader:
+    """Reads the items of a top-level JSON array one at a time
+
+    The file is decoded in fixed-size chunks and each item is returned decoded,
+    or as its JSON text with `raw`, so memory stays bounded by the chunk and the
+    largest item instead of growing with the file. `bytes_read` tells how far it
+    got.
+    """
+
+    def __init__(
+        self,
+        f: BinaryIO,
+        *,
+        raw: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.f = f
+        self.raw = raw
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+        self.__decoder = json.JSONDecoder()
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.__buffer = ""
+        self.__position = 0
+        self.__eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        self.__expect("[")
+        if self.__peek() == "]":
+            return
+        while True:
+            yield self.__read_item()
+            if self.__peek() == "]":
+                return
+            self.__expect(",")
+
+    def __read_item(self) -> Any:  # noqa: ANN401
+        self.__peek()
+        start = self.__position
+        while True:
+            try:
+                item, end = self.__decoder.raw_decode(self.__buffer, start)
+            except json.JSONDecodeError:
+                # The item may just be cut by the end of the chunk
+                if self.__eof or len(self.__buffer) - start > MAX_ITEM_SIZE:
+                    raise
+                start = self.__read_chunk(start)
+                continue
+            if not self.__eof and self.__may_continue(end):
+                start = self.__read_chunk(start)
+                continue
+            self.__position = end
+            return self.__buffer[start:end] if self.raw else item
+
+    def __may_continue(self, end: int) -> bool:
+        """Whether an item decoded up to `end` could go on in the next chunk"""
+        # A number or literal ending with the buffer, or a number cut inside
+        return len(self.__buffer) - end <= MAX_CUT_NUMBER_TAIL_SIZE and all(
+            character in CUT_NUMBER_TAIL for character in self.__buffer[end:]
+        )
+
+    def __peek(self) -> str:
+        """Skips whitespace and returns the next character"""
+        while True:
+            while (
+                self.__position < len(self.__buffer)
+                and self.__buffer[self.__position] in WHITESPACE
+            ):
+                self.__position += 1
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if self.__eof:
+                msg = "Unexpected end of JSON array"
+                raise json.JSONDecodeError(msg, self.__buffer, self.__position)
+            self.__read_chunk(self.__position)
+
+    def __expect(self, character: str) -> None:
+        if self.__peek() != character:
+            msg = f"Expected '{character}'"
+            raise json.JSONDecodeError(msg, self.__buffer, self.__position)
+        self.__position += 1
+
+    def __read_chunk(self, keep_from: int) -> int:
+        """Drops the buffer before `keep_from` and appends the next chunk"""
+        chunk = self.f.read(self.chunk_size)
+        self.bytes_read += len(chunk)
+        self.__eof = not chunk
+        self.__buffer = self.__buffer[keep_from:] + self.__text_decoder.decode(
+            chunk,
+            final=self.__eof,
+        )
+        self.__position -= keep_from
+        return 0
@@ -1,8 +1,13 @@
 import json
+from pathlib import Path
 from typing import TypeVar
 
 from pydantic import BaseModel
 
+from temporal_context_mcp.shared.domain.utils.json_file_store import (
+    write_json_atomically,
+)
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -14,5 +19,4 @@ def load_models_from_json_file[T](file_path: str, model_class: type[T]) -> list[
 
 def save_models_to_json_file(file_path: str, data: list[BaseModel]) -> None:
     json_data = [model.model_dump(mode="json") for model in data]
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
+    write_json_atomically(Path(file_path), json_data)
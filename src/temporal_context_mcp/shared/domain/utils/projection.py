@@ -0,0 +1,140 @@
+import functools
+from collections.abc import Iterable
+from typing import Any, get_args
+
+from pydantic import BaseModel, JsonValue, RootModel
+from pydantic_core import to_jsonable_python
+
+type IncludeTree = dict[str, "IncludeTree | bool"]
+
+# Left out by the compact mode
+EMPTY_VALUES = (None, "", [], {})
+
+
+class ProjectedModel(RootModel[dict[str, Any]]):
+    """Fields of a model kept by a projection"""
+
+
+class Projection:
+    """Serializer of a subset of the fields of a model
+
+    Fields are top-level names or dotted paths into nested models and dicts,
+    e.g. `time_pattern.hours`. The compact mode also leaves out null and empty
+    values, at any depth. Field paths are resolved once, so dumping only
+    serializes the selected fields instead of trimming a full dump.
+    """
+
+    def __init__(
+        self,
+        model: type[BaseModel],
+        fields: frozenset[str] | None = None,
+        *,
+        compact: bool = False,
+    ) -> None:
+        self.model = model
+        self.compact = compact
+        self.include: IncludeTree = (
+            _build_include_tree(model, fields)
+            if fields
+            else dict.fromkeys(model.model_fields, True)
+        )
+
+    def dump(self, value: BaseModel, **extra: object) -> ProjectedModel:
+        """Dumps the selected fields, taking the `extra` ones from the keywords
+
+        The value can be any model sharing the other fields, so an entity is
+        projected as its result DTO without building the DTO first.
+        """
+        data = value.model_dump(
+            mode="json",
+            include={
+                name: node for name, node in self.include.items() if name not in extra
+            },
+            exclude_none=self.compact,
+        )
+        for name, extra_value in extra.items():
+            node = self.include.get(name)
+            if node is not None:
+                data[name] = _select(to_jsonable_python(extra_value), node)
+        return ProjectedModel(_drop_empty(data) if self.compact else data)
+
+
+def get_projection(
+    model: type[BaseModel],
+    fields: Iterable[str] | None = None,
+    *,
+    compact: bool = False,
+) -> Projection:
+    """Gets the projection of a model, built once per field set"""
+    return _get_projection(model, frozenset(fields) if fields else None, compact)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_projection(
+    model: type[BaseModel],
+    fields: frozenset[str] | None,
+    compact: bool,
+) -> Projection:
+    return Projection(model, fields, compact=compact)
+
+
+def _build_include_tree(model: type[BaseModel], fields: frozenset[str]) -> IncludeTree:
+    """Turns field paths into the `include` argument of `model_dump`"""
+    tree: IncludeTree = {}
+    # Shorter paths first, so a whole field wins over paths into it
+    for path in sorted(fields, key=lambda field: field.count(".")):
+        node, node_model = tree, model
+        *parents, leaf = path.split(".")
+        for name in parents:
+            node_model = _field_model(node_model, name, path)
+            child = node.setdefault(name, {})
+            if child is True:
+                break
+            node = child
+        else:
+            _field_model(node_model, leaf, path)
+            node[leaf] = True
+    return tree
+
+
+def _field_model(
+    model: type[BaseModel] | None,
+    name: str,
+    path: str,
+) -> type[BaseModel] | None:
+    """Checks a field exists and gets its model, None for dicts and other values"""
+    if model is None:
+        return None
+    field = model.model_fields.get(name)
+    if field is None:
+        msg = (
+            f"Unknown field '{path}', expected one of: {', '.join(model.model_fields)}"
+        )
+        raise ValueError(msg)
+    for annotation in (field.annotation, *get_args(field.annotation)):
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return annotation
+    return None
+
+
+def _select(value: JsonValue, node: "IncludeTree | bool") -> JsonValue:
+    """Keeps the included keys of a plain value, as `include` does for models"""
+    if node is True or not isinstance(value, dict):
+        return value
+    return {
+        name: _select(value[name], child)
+        for name, child in node.items()
+        if name in value
+    }
+
+
+def _drop_empty(value: JsonValue) -> JsonValue:
+    """Leaves out null and empty values of the dicts within a plain value"""
+    if isinstance(value, dict):
+        trimmed = {name: _drop_empty(item) for name, item in value.items()}
+        return {
+            name: item for name, item in trimmed.items() if item not in EMPTY_VALUES
+        }
+    if isinstance(value, list):
+        return [_drop_empty(item) for item in value]
+    return value
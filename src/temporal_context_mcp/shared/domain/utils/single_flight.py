@@ -0,0 +1,46 @@
+import threading
+from collections.abc import Callable, Hashable
+
+
+class _Call[T]:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single execution
+
+    The first caller runs the function, callers arriving while it is in flight
+    wait for it and share its result (or its exception).
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: dict[Hashable, _Call] = {}
+
+    def run[T](self, key: Hashable, func: Callable[[], T]) -> T:
+        with self.__lock:
+            call = self.__calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self.__calls[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,185 @@
+"""Thin stdio client for the shared daemon
+
+Proxies stdin/stdout to the daemon's Unix socket and starts the daemon when
+none is running. Only the standard library is imported, so a client pays for
+the interpreter start and a socket connect instead of loading the server.
+
+The socket, its lock and the daemon log live in a private (0700) directory,
+and the shim only talks to a socket and a daemon of the current user.
+"""
+
+import os
+import socket
+import stat
+import struct
+import subprocess  # noqa: S404
+import sys
+import threading
+import time
+from pathlib import Path
+
+BUFFER_SIZE = 64 * 1024
+START_TIMEOUT_SECONDS = 15.0
+RETRY_INTERVAL_SECONDS = 0.05
+ENV_FILE = ".env"
+RUNTIME_DIR_NAME = "temporal-context-mcp"
+SOCKET_FILE_NAME = "daemon.sock"
+PRIVATE_DIR_MODE = 0o700
+# struct ucred of SO_PEERCRED: pid, uid, gid
+PEER_CREDENTIALS = struct.Struct("3i")
+
+
+def get_runtime_dir() -> Path:
+    """Private directory of the socket, lock and log of the current user"""
+    base_dir = os.environ.get("XDG_RUNTIME_DIR") or Path.home() / ".cache"
+    runtime_dir = Path(base_dir) / RUNTIME_DIR_NAME
+    ensure_private_dir(runtime_dir)
+    return runtime_dir
+
+
+def get_socket_path(socket_path: str | None = None) -> Path:
+    """The configured socket, by default in the private runtime directory"""
+    if socket_path is None:
+        socket_path = get_setting("DAEMON_SOCKET_PATH")
+    return Path(socket_path) if socket_path else get_runtime_dir() / SOCKET_FILE_NAME
+
+
+def get_setting(name: str) -> str:
+    """Reads a setting like `Settings` does, from the environment or `.env`
+
+    The daemon loads `Settings`, which the shim cannot import, so both resolve
+    to the same value as long as they share the working directory.
+    """
+    for key, value in os.environ.items():
+        if key.upper() == name:
+            return value
+    try:
+        lines = Path(ENV_FILE).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return ""
+
+    setting = ""
+    for line in lines:
+        key, separator, value = line.strip().removeprefix("export ").partition("=")
+        if not separator or key.strip().upper() != name:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":  # noqa: PLR2004
+            setting = value[1:-1]
+        else:
+            setting = value.split(" #", 1)[0].strip()
+    return setting
+
+
+def ensure_private_dir(path: Path) -> None:
+    """Creates a directory only the current user can use, or checks an existing one"""
+    path.mkdir(mode=PRIVATE_DIR_MODE, parents=True, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        msg = f"{path} is not a directory owned by the current user"
+        raise PermissionError(msg)
+    if stat.S_IMODE(info.st_mode) != PRIVATE_DIR_MODE:
+        os.chmod(path, PRIVATE_DIR_MODE)
+
+
+def connect(socket_path: Path) -> socket.socket:
+    """Connects to the daemon, starting it first if it is not running"""
+    try:
+        return _connect(socket_path)
+    except PermissionError:
+        raise
+    except OSError:
+        _start_daemon(socket_path)
+
+    deadline = time.monotonic() + START_TIMEOUT_SECONDS
+    while True:
+        try:
+            return _connect(socket_path)
+        except PermissionError:
+            raise
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(RETRY_INTERVAL_SECONDS)
+
+
+def proxy(sock: socket.socket) -> None:
+    """Copies stdin to the socket and the socket to stdout until either closes"""
+
+    def forward_stdin() -> None:
+        try:
+            while chunk := os.read(sys.stdin.fileno(), BUFFER_SIZE):
+                sock.sendall(chunk)
+        except OSError:
+            pass
+        finally:
+            try:
+                sock.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    threading.Thread(target=forward_stdin, daemon=True).start()
+    stdout = sys.stdout.buffer
+    while chunk := sock.recv(BUFFER_SIZE):
+        stdout.write(chunk)
+        stdout.flush()
+
+
+def _connect(socket_path: Path) -> socket.socket:
+    """Connects to the socket, refusing sockets and daemons of other users"""
+    info = os.lstat(socket_path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        msg = f"{socket_path} is not a socket owned by the current user"
+        raise PermissionError(msg)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+        # The file could be replaced between the check and the connect
+        if hasattr(socket, "SO_PEERCRED"):
+            _, uid, _ = PEER_CREDENTIALS.unpack(
+                sock.getsockopt(
+                    socket.SOL_SOCKET,
+                    socket.SO_PEERCRED,
+                    PEER_CREDENTIALS.size,
+                ),
+            )
+            if uid != os.getuid():
+                msg = f"The daemon on {socket_path} runs as another user"
+                raise PermissionError(msg)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _start_daemon(socket_path: Path) -> None:
+    """Starts the daemon detached from this process, logging next to the socket"""
+    socket_path.parent.mkdir(mode=PRIVATE_DIR_MODE, parents=True, exist_ok=True)
+    with open(socket_path.with_suffix(".log"), "ab") as log_file:
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, "-m", "temporal_context_mcp.daemon"],
+            env={
+                **os.environ,
+                "DAEMON_SOCKET_PATH": str(socket_path),
+                "PYTHONUNBUFFERED": "1",
+            },
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+        )
+
+
+def main() -> None:
+    try:
+        sock = connect(get_socket_path())
+    except OSError as e:
+        print(f"Could not connect to the temporal context daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+    with sock:
+        proxy(sock)
+
+
+if __name__ == "__main__":
+    main()
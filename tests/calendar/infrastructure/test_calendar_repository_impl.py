@@ -0,0 +1,33 @@
+from datetime import date
+
+from temporal_context_mcp.calendar import Calendar, CalendarRepositoryImpl
+from temporal_context_mcp.core import Settings
+
+
+def test_save_persists_and_compiles_calendar(mock_settings: Settings) -> None:
+    repository = CalendarRepositoryImpl(settings=mock_settings)
+    previous_date_sets = repository.find_date_sets()
+
+    saved = repository.save(
+        Calendar(
+            id="holidays",
+            name="Holidays",
+            dates=[date(2025, 12, 25)],
+            ranges=[(date(2025, 8, 1), date(2025, 8, 15))],
+        ),
+    )
+
+    assert saved is True
+    assert repository.find_date_sets() is not previous_date_sets
+    reloaded = CalendarRepositoryImpl(settings=mock_settings)
+    assert [calendar.id for calendar in reloaded.find()] == ["holidays"]
+    assert date(2025, 8, 7) in reloaded.find_date_sets()["holidays"]
+
+
+def test_delete_one_by_id_removes_calendar(mock_settings: Settings) -> None:
+    repository = CalendarRepositoryImpl(settings=mock_settings)
+    repository.save(Calendar(id="holidays", name="Holidays"))
+
+    assert repository.delete_one_by_id("holidays") is True
+    assert repository.delete_one_by_id("holidays") is False
+    assert repository.find_date_sets() == {}
@@ -12,4 +12,7 @@ def mock_settings(tmp_path: Path) -> Settings:
     settings.data_dir = str(tmp_path)
     settings.contexts_file_name = "context.json"
     settings.recommendations_file_name = "recommendations.json"
+    settings.recommendation_layers_file_name = "recommendation_layers.json"
+    settings.recommendation_tenant = ""
+    settings.calendars_file_name = "calendars.json"
     return settings
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+from dateutil import tz
+
+from temporal_context_mcp.context_management.application import (
+    FindContextTransition,
+    FindScheduleOccupancy,
+)
+from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.shared import ContextType, Priority, TimePattern
+from tests.context_management.conftest import MockTemporalContextRepository
+
+MONDAY = datetime(2025, 1, 6, 8, 30, 15, tzinfo=tz.tzlocal())
+
+
+def create_find_context_transition(
+    repository: MockTemporalContextRepository,
+    horizon: timedelta = timedelta(days=1),
+) -> FindContextTransition:
+    return FindContextTransition(FindScheduleOccupancy(repository), horizon=horizon)
+
+
+def test_find_context_transition_should_return_next_change_of_active_context(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    find_context_transition = create_find_context_transition(
+        mock_temporal_context_repository,
+    )
+
+    before = find_context_transition.execute(since=MONDAY)
+    during = find_context_transition.execute(since=MONDAY.replace(hour=9))
+
+    assert before.context_id is None
+    assert before.changes_at == MONDAY.replace(hour=9, minute=0, second=1)
+    assert during.context_id == "work_hours"
+    assert during.changes_at == MONDAY.replace(hour=18, minute=0, second=1)
+
+
+def test_find_context_transition_should_follow_priorities_and_cron_runs(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    mock_temporal_context_repository.data.append(
+        TemporalContext(
+            id="standup",
+            name="Standup",
+            context_type=ContextType.AVAILABILITY,
+            time_pattern=TimePattern(cron_pattern="*/15 9-17 * * 1-5"),
+            priority=Priority.HIGH,
+            created_at=MONDAY,
+        ),
+    )
+    find_context_transition = create_find_context_transition(
+        mock_temporal_context_repository,
+    )
+
+    result = find_context_transition.execute(since=MONDAY.replace(hour=9, minute=2))
+
+    assert result.context_id == "work_hours"
+    # The cron pattern matches during the minute before its 09:15 run
+    assert result.changes_at == MONDAY.replace(hour=9, minute=14, second=1)
+
+
+def test_find_context_transition_should_continue_into_the_next_week(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    mock_temporal_context_repository.data[0].time_pattern = TimePattern(
+        days_of_week=[0],
+        hour_range=(6, 8),
+    )
+    find_context_transition = create_find_context_transition(
+        mock_temporal_context_repository,
+    )
+    saturday_night = datetime(2025, 1, 11, 23, 0, tzinfo=tz.tzlocal())
+
+    result = find_context_transition.execute(since=saturday_night)
+
+    assert result.context_id is None
+    assert result.changes_at == datetime(2025, 1, 12, 6, 0, 1, tzinfo=tz.tzlocal())
+
+
+def test_find_context_transition_should_stop_at_horizon(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    find_context_transition = create_find_context_transition(
+        mock_temporal_context_repository,
+        horizon=timedelta(minutes=10),
+    )
+
+    result = find_context_transition.execute(since=MONDAY)
+
+    assert result.context_id is None
+    assert result.changes_at is None
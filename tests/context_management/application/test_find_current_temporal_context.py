@@ -1,5 +1,33 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from dateutil import tz
+
+from temporal_context_mcp.context_management import TemporalContextRepositoryImpl
 from temporal_context_mcp.context_management.application import (
+    FindContextTransition,
     FindCurrentTemporalContext,
+    FindScheduleOccupancy,
+    FindTemporalContext,
+)
+from temporal_context_mcp.context_management.application.dto import (
+    NotModifiedResultDto,
+)
+from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.shared import (
+    ContextType,
+    Priority,
+    TimePattern,
+    get_current_datetime,
+)
+from temporal_context_mcp.shared.domain.utils.json_file_store import (
+    get_file_fingerprint,
+)
+from tests.context_management.conftest import (
+    MockRecommendationRepository,
+    MockTemporalContextRepository,
+    MockUsageHistoryRepository,
 )
 
 
@@ -18,3 +46,180 @@ def test_find_current_temporal_context_should_return_current_temporal_context_wi
         "avoid_topics": [],
         "time_sensitive": False,
     }
+
+
+def test_find_current_temporal_context_should_return_none_without_active_contexts(
+    mock_find_current_temporal_context: FindCurrentTemporalContext,
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    mock_temporal_context_repository.data[0].active = False
+
+    assert mock_find_current_temporal_context.execute() is None
+
+
+def test_find_current_temporal_context_should_bump_version_only_on_changes(
+    mock_find_current_temporal_context: FindCurrentTemporalContext,
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    first = mock_find_current_temporal_context.execute()
+    second = mock_find_current_temporal_context.execute()
+    mock_temporal_context_repository.revision += 1
+    third = mock_find_current_temporal_context.execute()
+
+    assert first.version == second.version
+    assert third.version > second.version
+
+
+def test_find_current_temporal_context_should_merge_overlapping_recommendations_once(
+    mock_find_current_temporal_context: FindCurrentTemporalContext,
+    mock_temporal_context_repository: MockTemporalContextRepository,
+    mock_recommendation_repository: MockRecommendationRepository,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mock_temporal_context_repository.data.append(
+        TemporalContext(
+            id="focus",
+            name="Focus",
+            context_type=ContextType.FOCUS_TIME,
+            time_pattern=TimePattern(),
+            created_at=get_current_datetime(),
+        ),
+    )
+    mock_recommendation_repository.data.append(
+        {
+            "context_type": ContextType.FOCUS_TIME.value,
+            "suggested_tools": ["timer"],
+            "avoid_topics": ["news"],
+        },
+    )
+    merges = []
+    find_merged = mock_recommendation_repository.find_merged
+    monkeypatch.setattr(
+        mock_recommendation_repository,
+        "find_merged",
+        lambda contexts: merges.append(contexts) or find_merged(contexts),
+    )
+
+    first = mock_find_current_temporal_context.execute()
+    second = mock_find_current_temporal_context.execute()
+    mock_recommendation_repository.revision += 1
+    mock_find_current_temporal_context.execute()
+
+    assert first.recommendation["suggested_tools"] == ["timer"]
+    assert first.recommendation["avoid_topics"] == ["news"]
+    assert second.recommendation == first.recommendation
+    assert [[c.id for c in contexts] for contexts in merges] == [
+        ["focus", "work_hours"],
+        ["focus", "work_hours"],
+    ]
+
+
+def test_find_current_temporal_context_should_record_usage_without_rewriting_contexts(
+    tmp_path: Path,
+    mock_recommendation_repository: MockRecommendationRepository,
+    mock_usage_history_repository: MockUsageHistoryRepository,
+) -> None:
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    repository.save(
+        TemporalContext(
+            id="always",
+            name="Always",
+            context_type=ContextType.WORK_SCHEDULE,
+            time_pattern=TimePattern(),
+            priority=3,
+            created_at=get_current_datetime(),
+        ),
+    )
+    partition_file = tmp_path / "temporal_contexts" / "work_schedule.json"
+    fingerprint = get_file_fingerprint(partition_file)
+    find_current_temporal_context = FindCurrentTemporalContext(
+        temporal_context_repository=repository,
+        recommendation_repository=mock_recommendation_repository,
+        find_temporal_context=FindTemporalContext(repository),
+        usage_history_repository=mock_usage_history_repository,
+    )
+
+    result = find_current_temporal_context.execute()
+
+    assert result.id == "always"
+    assert len(mock_usage_history_repository.find_by_context_id("always")) == 1
+    assert get_file_fingerprint(partition_file) == fingerprint
+
+
+def test_find_current_temporal_context_should_not_record_usage_when_not_modified(
+    mock_find_current_temporal_context: FindCurrentTemporalContext,
+    mock_usage_history_repository: MockUsageHistoryRepository,
+) -> None:
+    version = mock_find_current_temporal_context.execute().version
+
+    result = mock_find_current_temporal_context.execute(if_none_match=version)
+
+    assert result == NotModifiedResultDto(version=version)
+    assert len(mock_usage_history_repository.find_by_context_id("work_hours")) == 1
+
+
+def test_find_current_temporal_context_should_scan_actives_once_per_segment(
+    tmp_path: Path,
+    mock_recommendation_repository: MockRecommendationRepository,
+    mock_usage_history_repository: MockUsageHistoryRepository,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = datetime(2025, 8, 6, 10, 30, tzinfo=tz.tzlocal())  # Wednesday
+    monkeypatch.setattr(
+        "temporal_context_mcp.context_management.application."
+        "find_current_temporal_context.get_current_datetime",
+        lambda: now,
+    )
+
+    def make_context(
+        context_id: str,
+        priority: Priority,
+        time_pattern: TimePattern,
+    ) -> TemporalContext:
+        return TemporalContext(
+            id=context_id,
+            name=context_id,
+            context_type=ContextType.AVAILABILITY,
+            time_pattern=time_pattern,
+            priority=priority,
+            created_at=now - timedelta(days=1),
+        )
+
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    repository.bulk_write(
+        upserts=[
+            make_context("office", Priority.LOW, TimePattern(hour_range=(9, 17))),
+            make_context("standup", Priority.HIGH, TimePattern(hours=[11])),
+        ],
+        delete_ids=["work_hours", "focus_morning", "weekend_casual"],
+    )
+    find_temporal_context = FindTemporalContext(repository)
+    scans = []
+    find = find_temporal_context.execute
+    monkeypatch.setattr(
+        find_temporal_context,
+        "execute",
+        lambda **kwargs: scans.append(kwargs) or find(**kwargs),
+    )
+    find_current_temporal_context = FindCurrentTemporalContext(
+        temporal_context_repository=repository,
+        recommendation_repository=mock_recommendation_repository,
+        find_temporal_context=find_temporal_context,
+        usage_history_repository=mock_usage_history_repository,
+        find_context_transition=FindContextTransition(
+            FindScheduleOccupancy(repository),
+        ),
+    )
+
+    assert find_current_temporal_context.execute().id == "office"
+    now += timedelta(minutes=29)
+    assert find_current_temporal_context.execute().id == "office"
+    assert len(scans) == 1
+
+    now += timedelta(minutes=1, seconds=30)
+    assert find_current_temporal_context.execute().id == "standup"
+    assert len(scans) == 2
+
+    repository.save(make_context("review", Priority.HIGH, TimePattern(hours=[11])))
+    assert find_current_temporal_context.execute().id == "review"
+    assert len(scans) == 3
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+
+from dateutil import tz
+
+from temporal_context_mcp.context_management.application import (
+    FindScheduleOccupancy,
+)
+from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.shared import ContextType, Priority, TimePattern
+from tests.context_management.conftest import MockTemporalContextRepository
+
+AT = datetime(2025, 8, 6, 12, tzinfo=tz.tzlocal())  # Wednesday
+
+
+def create_context(
+    context_id: str,
+    time_pattern: TimePattern,
+    priority: Priority = Priority.MEDIUM,
+    age: int = 0,
+) -> TemporalContext:
+    return TemporalContext(
+        id=context_id,
+        name=context_id,
+        context_type=ContextType.FOCUS_TIME,
+        time_pattern=time_pattern,
+        priority=priority,
+        created_at=AT - timedelta(days=age),
+    )
+
+
+def test_find_schedule_occupancy_should_report_minutes_and_winners(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    mock_temporal_context_repository.data += [
+        create_context(
+            "focus",
+            TimePattern(days_of_week=[3], hours=[10, 11]),
+            priority=Priority.HIGH,
+        ),
+        create_context("mornings", TimePattern(hours=[11])),
+        create_context("old_mornings", TimePattern(hours=[11]), age=1),
+    ]
+
+    result = FindScheduleOccupancy(mock_temporal_context_repository).execute(at=AT)
+
+    occupancies = {c.context_id: c for c in result.contexts}
+    assert [c.context_id for c in result.contexts] == [
+        "focus",
+        "mornings",
+        "old_mornings",
+        "work_hours",
+    ]
+    assert occupancies["work_hours"].active_minutes == 5 * 9 * 60
+    assert occupancies["work_hours"].winning_minutes == 5 * 8 * 60 - 60
+    assert occupancies["focus"].winning_minutes == 120
+    assert occupancies["mornings"].winning_minutes == 6 * 60
+    assert occupancies["old_mornings"].shadowed_minutes == 7 * 60
+    assert result.unreachable_context_ids == ["old_mornings"]
+    assert result.covered_minutes == 5 * 9 * 60 + 2 * 60
+    assert result.contested_minutes == 7 * 60 + 60
+    # Mornings and old mornings tie every day but Wednesday, when focus wins
+    assert result.tie_break_minutes == 6 * 60
+    assert result.context_types[ContextType.FOCUS_TIME] == 7 * 60 + 60
+    assert result.winners[3][10] == "focus"
+    assert result.winners[1][11] == "mornings"
+    assert result.winners[1][9] == "work_hours"
+    assert result.winners[0][9] is None
+    assert result.coverage[1][11] == 60
+    assert result.coverage[0][10] == 0
+
+
+def test_find_schedule_occupancy_should_be_empty_without_active_contexts(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    mock_temporal_context_repository.data[0].active = False
+
+    result = FindScheduleOccupancy(mock_temporal_context_repository).execute(at=AT)
+
+    assert result.week_start == datetime(2025, 8, 3, tzinfo=tz.tzlocal())
+    assert result.contexts == []
+    assert result.covered_minutes == 0
+
+
+def test_find_schedule_occupancy_should_recompile_changed_patterns(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    find_schedule_occupancy = FindScheduleOccupancy(mock_temporal_context_repository)
+    find_schedule_occupancy.execute(at=AT)
+
+    mock_temporal_context_repository.data[0] = mock_temporal_context_repository.data[
+        0
+    ].model_copy(update={"time_pattern": TimePattern(hours=[9])})
+    result = find_schedule_occupancy.execute(at=AT)
+
+    assert result.covered_minutes == 7 * 60
+
+
+def test_find_schedule_occupancy_should_only_count_minutes_of_validity(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    conference = create_context("conference", TimePattern(hours=[11]))
+    conference.valid_from = AT.replace(hour=0)
+    conference.expires_at = AT.replace(hour=11, minute=30) + timedelta(days=2)
+    mock_temporal_context_repository.data.append(conference)
+
+    result = FindScheduleOccupancy(mock_temporal_context_repository).execute(at=AT)
+
+    occupancies = {c.context_id: c for c in result.contexts}
+    assert occupancies["conference"].active_minutes == 2 * 60 + 30
@@ -0,0 +1,79 @@
+from temporal_context_mcp.context_management import TemporalContextRepository
+from temporal_context_mcp.context_management.application import (
+    SaveTemporalContextsBulk,
+)
+
+
+def test_save_temporal_contexts_bulk_should_upsert_and_delete_in_one_batch(
+    mock_save_temporal_contexts_bulk: SaveTemporalContextsBulk,
+    mock_temporal_context_repository: TemporalContextRepository,
+) -> None:
+    result = mock_save_temporal_contexts_bulk.execute(
+        items=[
+            {"id": "a", "name": "A", "time_pattern": {"days_of_week": [1]}},
+            {"id": "b", "name": "B", "time_pattern": {"hours": [9]}},
+        ],
+        delete_ids=["work_hours"],
+    )
+
+    assert result.saved == ["a", "b"]
+    assert result.deleted == ["work_hours"]
+    assert result.errors == []
+    assert {ctx.id for ctx in mock_temporal_context_repository.find()} == {"a", "b"}
+
+
+def test_save_temporal_contexts_bulk_should_report_item_errors_without_aborting(
+    mock_save_temporal_contexts_bulk: SaveTemporalContextsBulk,
+) -> None:
+    result = mock_save_temporal_contexts_bulk.execute(
+        items=[
+            {"id": "bad", "time_pattern": {}},
+            {"id": "ok", "name": "Ok", "time_pattern": {}},
+            {"id": "bad_priority", "name": "Bad", "time_pattern": {}, "priority": 9},
+        ],
+        delete_ids=["missing"],
+    )
+
+    assert result.saved == ["ok"]
+    assert result.deleted == []
+    assert [(error.index, error.id) for error in result.errors] == [
+        (None, "missing"),
+        (0, "bad"),
+        (2, "bad_priority"),
+    ]
+    assert result.errors[1].message.startswith("name:")
+
+
+def test_save_temporal_contexts_bulk_should_reject_expiry_before_start(
+    mock_save_temporal_contexts_bulk: SaveTemporalContextsBulk,
+) -> None:
+    result = mock_save_temporal_contexts_bulk.execute(
+        items=[
+            {
+                "id": "sprint",
+                "name": "Sprint crunch",
+                "time_pattern": {},
+                "valid_from": "2025-08-11T00:00:00",
+                "expires_at": "2025-08-04T00:00:00",
+            },
+        ],
+    )
+
+    assert result.saved == []
+    assert result.errors[0].message == "expires_at must be after valid_from"
+
+
+def test_save_temporal_contexts_bulk_should_reject_repeated_ids(
+    mock_save_temporal_contexts_bulk: SaveTemporalContextsBulk,
+    mock_temporal_context_repository: TemporalContextRepository,
+) -> None:
+    result = mock_save_temporal_contexts_bulk.execute(
+        items=[
+            {"id": "a", "name": "First", "time_pattern": {}},
+            {"id": "a", "name": "Second", "time_pattern": {}},
+        ],
+    )
+
+    assert result.saved == ["a"]
+    assert [(error.index, error.id) for error in result.errors] == [(1, "a")]
+    assert mock_temporal_context_repository.find_one_by_id("a").name == "First"
@@ -0,0 +1,81 @@
+from datetime import datetime
+
+from dateutil import tz
+
+from temporal_context_mcp.context_management.application import (
+    OverlayTemporalContextRepository,
+    SimulateSchedule,
+)
+from temporal_context_mcp.shared import ContextType
+from tests.context_management.conftest import MockTemporalContextRepository
+
+AT = datetime(2025, 8, 6, 11, tzinfo=tz.tzlocal())  # Wednesday
+
+
+def test_simulate_schedule_should_resolve_changes_without_saving_them(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    result = SimulateSchedule(mock_temporal_context_repository).execute(
+        items=[
+            {
+                "id": "standup",
+                "name": "Daily standup",
+                "context_type": "availability",
+                "time_pattern": {"hours": [11]},
+                "priority": 3,
+            },
+            {"name": "Invalid"},
+        ],
+        delete_ids=["missing"],
+        times=[AT, AT.replace(hour=12)],
+        week=True,
+    )
+
+    assert result.saved == ["standup"]
+    assert [(error.index, error.id) for error in result.errors] == [
+        (None, "missing"),
+        (1, None),
+    ]
+    assert [moment.active_context_ids for moment in result.moments] == [
+        ["standup", "work_hours"],
+        ["work_hours"],
+    ]
+    assert [moment.changed for moment in result.moments] == [True, False]
+    assert result.moments[0].current_context_id == "work_hours"
+    assert result.occupancy.contexts[0].context_id == "standup"
+    assert result.occupancy.contexts[0].active_minutes == 7 * 60
+    assert [c.id for c in mock_temporal_context_repository.data] == ["work_hours"]
+
+
+def test_simulate_schedule_should_resolve_deletions(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    result = SimulateSchedule(mock_temporal_context_repository).execute(
+        items=[],
+        delete_ids=["work_hours"],
+        times=[AT],
+    )
+
+    assert result.deleted == ["work_hours"]
+    assert result.moments[0].context_id is None
+    assert result.moments[0].changed
+    assert result.occupancy is None
+
+
+def test_overlay_should_shadow_the_base_repository(
+    mock_temporal_context_repository: MockTemporalContextRepository,
+) -> None:
+    work_hours = mock_temporal_context_repository.data[0]
+    overlay = OverlayTemporalContextRepository(mock_temporal_context_repository)
+    edited = work_hours.model_copy(update={"context_type": ContextType.FOCUS_TIME})
+
+    overlay.save(edited)
+
+    assert overlay.find_one_by_id("work_hours") is edited
+    assert overlay.find(context_type=ContextType.WORK_SCHEDULE) == []
+    assert overlay.find(context_type=ContextType.FOCUS_TIME, limit=1) == [edited]
+    assert overlay.version == mock_temporal_context_repository.version + 1
+    assert overlay.delete_one_by_id("work_hours")
+    assert overlay.find() == []
+    assert not overlay.delete_one_by_id("work_hours")
+    assert mock_temporal_context_repository.find() == [work_hours]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any
 
 import pytest
@@ -5,13 +6,23 @@ import pytest
 from temporal_context_mcp.context_management import (
     RecommendationRepository,
     TemporalContextRepository,
+    UsageHistoryRepository,
 )
 from temporal_context_mcp.context_management.application import (
     FindCurrentTemporalContext,
     FindTemporalContext,
     SaveTemporalContext,
+    SaveTemporalContextsBulk,
 )
-from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.context_management.domain import (
+    ContextLoadProgress,
+    ContextSearchHit,
+    ContextSearchIndex,
+    ContextSearchPage,
+    TemporalContext,
+    UsageHistory,
+)
+from temporal_context_mcp.recommendation import Recommendation
 from temporal_context_mcp.shared import ContextType, TimePattern, get_current_datetime
 
 
@@ -38,20 +49,64 @@ class MockTemporalContextRepository(TemporalContextRepository):
                 created_at=get_current_datetime(),
             ),
         ]
+        self.revision = 0
+        self.load_progress: list[ContextLoadProgress] = []
 
-    def find_one_by_id(self, context_id: str) -> TemporalContext | None:
-        pass
+    @property
+    def version(self) -> int:
+        return self.revision
+
+    def find_load_progress(self) -> list[ContextLoadProgress]:
+        return self.load_progress
+
+    def find_one_by_id(
+        self,
+        context_id: str,
+        *,
+        archive_expired: bool = True,  # noqa: ARG002
+    ) -> TemporalContext | None:
+        return next((ctx for ctx in self.data if ctx.id == context_id), None)
 
     def find(
         self,
         context_type: ContextType | None = None,
         actives: bool | None = None,
+        limit: int | None = None,
+        at: datetime | None = None,  # noqa: ARG002
+        *,
+        archive_expired: bool = True,  # noqa: ARG002
     ) -> list[TemporalContext]:
+        contexts = sorted(self.data, key=TemporalContext.resolution_key)
         if context_type is not None:
-            return [ctx for ctx in self.data if ctx.context_type == context_type]
+            contexts = [ctx for ctx in contexts if ctx.context_type == context_type]
         if actives is not None:
-            return [ctx for ctx in self.data if ctx.active]
-        return self.data
+            contexts = [ctx for ctx in contexts if ctx.active]
+        return contexts[:limit]
+
+    def search(
+        self,
+        query: str,
+        *,
+        context_type: ContextType | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        archive_expired: bool = True,  # noqa: ARG002
+    ) -> ContextSearchPage:
+        index = ContextSearchIndex()
+        index.replace(self.data)
+        ranked, total = index.search(
+            query,
+            context_type=context_type,
+            limit=limit,
+            offset=offset,
+        )
+        return ContextSearchPage(
+            total=total,
+            hits=[
+                ContextSearchHit(context=self.find_one_by_id(context_id), score=score)
+                for context_id, score in ranked
+            ],
+        )
 
     def save(self, context: TemporalContext) -> bool:
         for item in self.data:
@@ -60,10 +115,23 @@ class MockTemporalContextRepository(TemporalContextRepository):
         self.data.append(context)
         return True
 
-    def delete_one_by_id(self, context_id: str) -> bool:
-        pass
+    def bulk_write(
+        self,
+        *,
+        upserts: list[TemporalContext],
+        delete_ids: list[str],
+    ) -> list[str]:
+        deleted = [ctx.id for ctx in self.data if ctx.id in delete_ids]
+        upsert_ids = {ctx.id for ctx in upserts}
+        self.data = [
+            ctx
+            for ctx in self.data
+            if ctx.id not in delete_ids and ctx.id not in upsert_ids
+        ]
+        self.data.extend(upserts)
+        return deleted
 
-    def mark_one_as_used(self, context_id: str) -> None:
+    def delete_one_by_id(self, context_id: str) -> bool:
         pass
 
 
@@ -81,12 +149,45 @@ class MockRecommendationRepository(RecommendationRepository):
             },
         ]
 
+        self.revision = 0
+
+    @property
+    def version(self) -> int:
+        return self.revision
+
     def find_by_context_type(self, context_type: ContextType) -> dict[str, str] | None:
         return next(
-            (rec for rec in self.data if rec["context_type"] == context_type),
+            (rec for rec in self.data if rec["context_type"] == context_type.value),
             None,
         )
 
+    def find_by_context(self, context: TemporalContext) -> dict[str, str] | None:
+        return self.find_by_context_type(context.context_type)
+
+    def find_merged(self, contexts: list[TemporalContext]) -> dict[str, str] | None:
+        weighted_recommendations = [
+            (Recommendation.model_validate(rec), context.priority)
+            for context in contexts
+            if (rec := self.find_by_context(context))
+        ]
+        if not weighted_recommendations:
+            return None
+        return Recommendation.merge(weighted_recommendations).model_dump(mode="json")
+
+
+class MockUsageHistoryRepository(UsageHistoryRepository):
+    def __init__(self) -> None:
+        self.data: dict[str, UsageHistory] = {}
+
+    def find_by_context_id(self, context_id: str) -> UsageHistory | None:
+        return self.data.get(context_id)
+
+    def record(self, context_id: str, used_at: datetime) -> None:
+        self.data.setdefault(context_id, UsageHistory(capacity=8)).record(used_at)
+
+    def delete_by_context_id(self, context_id: str) -> None:
+        self.data.pop(context_id, None)
+
 
 @pytest.fixture
 def mock_temporal_context_repository() -> TemporalContextRepository:
@@ -98,6 +199,11 @@ def mock_recommendation_repository() -> RecommendationRepository:
     return MockRecommendationRepository()
 
 
+@pytest.fixture
+def mock_usage_history_repository() -> UsageHistoryRepository:
+    return MockUsageHistoryRepository()
+
+
 @pytest.fixture
 def mock_save_temporal_context(
     mock_temporal_context_repository: TemporalContextRepository,
@@ -107,10 +213,22 @@ def mock_save_temporal_context(
     )
 
 
+@pytest.fixture
+def mock_save_temporal_contexts_bulk(
+    mock_temporal_context_repository: TemporalContextRepository,
+    mock_usage_history_repository: UsageHistoryRepository,
+) -> SaveTemporalContextsBulk:
+    return SaveTemporalContextsBulk(
+        temporal_context_repository=mock_temporal_context_repository,
+        usage_history_repository=mock_usage_history_repository,
+    )
+
+
 @pytest.fixture
 def mock_find_current_temporal_context(
     mock_temporal_context_repository: TemporalContextRepository,
     mock_recommendation_repository: RecommendationRepository,
+    mock_usage_history_repository: UsageHistoryRepository,
 ) -> FindCurrentTemporalContext:
     return FindCurrentTemporalContext(
         temporal_context_repository=mock_temporal_context_repository,
@@ -118,4 +236,5 @@ def mock_find_current_temporal_context(
         find_temporal_context=FindTemporalContext(
             temporal_context_repository=mock_temporal_context_repository,
         ),
+        usage_history_repository=mock_usage_history_repository,
     )
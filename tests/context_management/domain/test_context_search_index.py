@@ -0,0 +1,72 @@
+from temporal_context_mcp.context_management.domain import (
+    ContextSearchIndex,
+    TemporalContext,
+)
+from temporal_context_mcp.shared import ContextType, TimePattern, get_current_datetime
+
+
+def create_context(
+    context_id: str,
+    name: str,
+    context_type: ContextType = ContextType.AVAILABILITY,
+) -> TemporalContext:
+    return TemporalContext(
+        id=context_id,
+        name=name,
+        context_type=context_type,
+        time_pattern=TimePattern(),
+        created_at=get_current_datetime(),
+    )
+
+
+def create_index() -> ContextSearchIndex:
+    index = ContextSearchIndex()
+    index.replace(
+        [
+            create_context("daily_standup", "Daily standup"),
+            create_context("standups_review", "Review of the standups"),
+            create_context("deep_work", "Deep work", ContextType.FOCUS_TIME),
+            create_context("lunch", "Lunch break"),
+        ],
+    )
+    return index
+
+
+def test_search_should_rank_whole_words_first_and_match_similar_ones() -> None:
+    ranked, total = create_index().search("standup")
+
+    assert [context_id for context_id, _ in ranked] == [
+        "daily_standup",
+        "standups_review",
+    ]
+    assert total == 2
+    assert create_index().search("meeting")[1] == 0
+    assert [i for i, _ in create_index().search("standps")[0]] == [
+        "standups_review",
+        "daily_standup",
+    ]
+
+
+def test_search_should_filter_by_type_and_paginate() -> None:
+    index = create_index()
+
+    assert index.search("work focus", context_type=ContextType.FOCUS_TIME) == (
+        [("deep_work", 8.0)],
+        1,
+    )
+    ranked, total = index.search("standup review", limit=1, offset=1)
+    assert [context_id for context_id, _ in ranked] == ["daily_standup"]
+    assert total == 2
+
+
+def test_index_should_be_updated_one_context_at_a_time() -> None:
+    index = create_index()
+
+    index.add(create_context("lunch", "Team lunch"))
+    index.remove("daily_standup")
+
+    assert [i for i, _ in index.search("team")[0]] == ["lunch"]
+    assert [i for i, _ in index.search("daily")[0]] == []
+    assert "daily" not in index.tokens
+    assert all("daily" not in tokens for tokens in index.trigrams.values())
+    assert len(index) == 3
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+from dateutil import tz
+
+from temporal_context_mcp.context_management.domain.usage_history import (
+    UsageHistory,
+)
+
+SUNDAY = datetime(2025, 1, 5, 23, 59, tzinfo=tz.tzlocal())
+
+
+def test_hour_of_week_histogram_should_count_by_local_weekday_and_hour() -> None:
+    history = UsageHistory(capacity=8)
+    history.record(SUNDAY)
+    history.record(SUNDAY + timedelta(minutes=1))  # Monday 00:00
+    history.record(SUNDAY + timedelta(days=6, minutes=-59))  # Saturday 23:00
+    history.record(SUNDAY + timedelta(days=6, minutes=-30))
+
+    histogram = history.hour_of_week_histogram()
+
+    assert len(histogram) == 7
+    assert all(len(hours) == 24 for hours in histogram)
+    assert histogram[0][23] == 1
+    assert histogram[1][0] == 1
+    assert histogram[6][23] == 2
+    assert sum(map(sum, histogram)) == 4
+
+
+def test_hour_of_week_histogram_should_only_count_the_kept_usages() -> None:
+    history = UsageHistory(capacity=2)
+    for days in range(3):
+        history.record(SUNDAY + timedelta(days=days))
+
+    histogram = history.hour_of_week_histogram()
+
+    assert histogram[0][23] == 0
+    assert histogram[1][23] == 1
+    assert histogram[2][23] == 1
+
+
+def test_last_used_should_be_the_newest_kept_usage() -> None:
+    history = UsageHistory(capacity=2)
+    assert history.last_used() is None
+
+    for days in range(3):
+        history.record(SUNDAY + timedelta(days=days))
+
+    assert history.last_used() == SUNDAY + timedelta(days=2)
@@ -0,0 +1,66 @@
+import asyncio
+from datetime import timedelta
+
+from temporal_context_mcp.context_management import ContextChangeScheduler
+from temporal_context_mcp.context_management.application.dto import (
+    ContextTransitionDto,
+)
+from temporal_context_mcp.shared import get_current_datetime
+
+
+def test_scheduler_notifies_only_when_current_context_changes() -> None:
+    # The winner is edited in place once, then another context wins
+    transitions = iter(
+        [
+            ("work_hours", 1),
+            ("work_hours", 1),
+            ("work_hours", 2),
+            ("focus_morning", 3),
+        ],
+    )
+    notifications = []
+
+    def find_transition() -> ContextTransitionDto:
+        context_id, version = next(transitions, ("focus_morning", 3))
+        return ContextTransitionDto(
+            context_id=context_id,
+            changes_at=get_current_datetime() + timedelta(milliseconds=20),
+            version=version,
+        )
+
+    async def on_change() -> None:  # noqa: RUF029
+        notifications.append(1)
+
+    async def run_scheduler() -> None:
+        scheduler = ContextChangeScheduler(find_transition, on_change)
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+    asyncio.run(run_scheduler())
+
+    assert notifications == [1, 1]
+
+
+def test_scheduler_wake_re_evaluates_before_next_transition() -> None:
+    versions = iter([1])
+    notifications = []
+
+    def find_transition() -> ContextTransitionDto:
+        return ContextTransitionDto(context_id="work_hours", version=next(versions, 2))
+
+    async def on_change() -> None:  # noqa: RUF029
+        notifications.append(1)
+
+    async def run_scheduler() -> None:
+        scheduler = ContextChangeScheduler(find_transition, on_change)
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)
+        assert notifications == []
+        scheduler.wake()
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    asyncio.run(run_scheduler())
+
+    assert notifications == [1]
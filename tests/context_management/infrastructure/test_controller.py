@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from temporal_context_mcp.context_management import Controller
+from temporal_context_mcp.core import settings
+from temporal_context_mcp.shared import ContextType
+
+
+@pytest.fixture
+def controller(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Controller:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    return Controller()
+
+
+def test_list_contexts_should_filter_by_context_type(controller: Controller) -> None:
+    focus_contexts = controller.list_contexts(
+        context_type=ContextType.FOCUS_TIME,
+        fields=["id", "context_type"],
+    )
+    summary = controller.list_contexts(context_type=ContextType.WORK_SCHEDULE)
+
+    assert [context.root for context in focus_contexts] == [
+        {"id": "focus_morning", "context_type": "focus_time"},
+    ]
+    assert "(1 found)" in summary
+    assert "(work_hours)" in summary
+
+
+def test_current_context_should_follow_edits_to_the_recommendation_files(
+    controller: Controller,
+    tmp_path: Path,
+) -> None:
+    controller.save_contexts_bulk(
+        contexts=[
+            {
+                "id": "always",
+                "name": "Always",
+                "context_type": "focus_time",
+                "time_pattern": {},
+                "priority": 3,
+            },
+        ],
+    )
+    first = controller.get_current_context()
+    recommendations_file = tmp_path / settings.recommendations_file_name
+    recommendations = json.loads(recommendations_file.read_text())
+    for recommendation in recommendations:
+        if recommendation["context_type"] == "focus_time":
+            recommendation["response_style"] = "professional"
+    recommendations_file.write_text(json.dumps(recommendations))
+
+    second = controller.get_current_context(if_none_match=first.version)
+
+    assert first.recommendation["response_style"] == "concise"
+    assert second.version > first.version
+    assert second.recommendation["response_style"] == "professional"
+
+    (tmp_path / settings.recommendation_layers_file_name).write_text(
+        json.dumps({"contexts": {"always": {"detail_level": "low"}}}),
+    )
+
+    third = controller.get_current_context(if_none_match=second.version)
+
+    assert third.version > second.version
+    assert third.recommendation["detail_level"] == "low"
+
+
+def test_context_transition_should_follow_edits_to_the_same_winner(
+    controller: Controller,
+) -> None:
+    context = {
+        "id": "always",
+        "name": "Always",
+        "context_type": "focus_time",
+        "time_pattern": {"exclude_calendars": ["holidays"]},
+        "priority": 3,
+    }
+    controller.save_contexts_bulk(contexts=[context])
+    first = controller.get_context_transition()
+    controller.save_contexts_bulk(contexts=[{**context, "name": "Always on"}])
+    second = controller.get_context_transition()
+    controller.save_calendar(calendar_id="holidays", name="Holidays", dates=[])
+    third = controller.get_context_transition()
+
+    assert first.context_id == second.context_id == third.context_id == "always"
+    assert first.version < second.version < third.version
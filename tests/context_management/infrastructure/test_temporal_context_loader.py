@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from temporal_context_mcp.context_management.domain import (
+    ContextLoadProgress,
+    TemporalContext,
+)
+from temporal_context_mcp.context_management.infrastructure.temporal_context_loader import (
+    TemporalContextLoader,
+)
+from temporal_context_mcp.shared import ContextType, TimePattern, get_current_datetime
+
+
+def _write_contexts(file_path: Path, count: int, invalid: set[int]) -> None:
+    records = [
+        TemporalContext(
+            id=f"context_{index}",
+            name=f"Context {index}",
+            context_type=ContextType.FOCUS_TIME,
+            time_pattern=TimePattern(hour_range=(9, 17)),
+            created_at=get_current_datetime(),
+        ).model_dump(mode="json")
+        for index in range(count)
+    ]
+    for index in invalid:
+        records[index]["priority"] = "urgent"
+    file_path.write_text(json.dumps(records), encoding="utf-8")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_rejects_only_invalid_records(tmp_path: Path, workers: int) -> None:
+    file_path = tmp_path / "contexts.json"
+    _write_contexts(file_path, count=25, invalid={3, 20})
+    progress: list[ContextLoadProgress] = []
+    loader = TemporalContextLoader(
+        workers=workers,
+        on_progress=progress.append,
+        parallel_min_bytes=0,
+    )
+
+    with open(file_path, "rb") as f:
+        result = loader.load(f, file_path.name)
+
+    assert len(result.contexts) == 23
+    assert "context_3" not in {context.id for context in result.contexts}
+    assert [rejected.index for rejected in result.rejected] == [3, 20]
+    assert result.rejected[0].record["id"] == "context_3"
+    assert "priority" in result.rejected[0].error
+    assert progress[-1].finished
+    assert progress[-1].loaded == 23
+    assert progress[-1].rejected == 2
+    assert progress[-1].bytes_read == file_path.stat().st_size
+
+
+def test_load_keeps_the_records_before_invalid_json(tmp_path: Path) -> None:
+    file_path = tmp_path / "contexts.json"
+    _write_contexts(file_path, count=3, invalid=set())
+    content = file_path.read_text()
+    file_path.write_text(content[: content.rindex('{"id"') + 10])
+
+    with open(file_path, "rb") as f:
+        result = TemporalContextLoader(workers=1).load(f, file_path.name)
+
+    assert [context.id for context in result.contexts] == ["context_0", "context_1"]
+    assert result.progress.corrupt
+    assert result.progress.errors
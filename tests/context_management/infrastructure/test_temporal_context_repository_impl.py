@@ -0,0 +1,262 @@
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from temporal_context_mcp.context_management import TemporalContextRepositoryImpl
+from temporal_context_mcp.context_management.application import SimulateSchedule
+from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.shared import (
+    ContextType,
+    Priority,
+    TimePattern,
+    get_current_datetime,
+)
+
+
+def _make_context(
+    context_id: str,
+    priority: Priority = Priority.LOW,
+    age_days: int = 0,
+) -> TemporalContext:
+    return TemporalContext(
+        id=context_id,
+        name=context_id,
+        context_type=ContextType.FOCUS_TIME,
+        time_pattern=TimePattern(),
+        created_at=get_current_datetime() - timedelta(days=age_days),
+        priority=priority,
+    )
+
+
+def test_bulk_write_upserts_deletes_and_persists_once(tmp_path: Path) -> None:
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+
+    deleted = repository.bulk_write(
+        upserts=[_make_context("new"), _make_context("work_hours")],
+        delete_ids=["focus_morning", "missing"],
+    )
+
+    assert deleted == ["focus_morning"]
+    assert repository.find_one_by_id("focus_morning") is None
+    assert repository.find_one_by_id("new") is not None
+    assert repository.find_one_by_id("work_hours").name == "work_hours"
+    stored = [
+        item
+        for partition_file in (tmp_path / "temporal_contexts").glob("*.json")
+        for item in json.loads(partition_file.read_text())
+    ]
+    assert {item["id"] for item in stored} == {"new", "work_hours", "weekend_casual"}
+
+
+def test_find_returns_actives_by_descending_priority_and_newest_first(
+    tmp_path: Path,
+) -> None:
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    repository.bulk_write(
+        upserts=[
+            _make_context("low", Priority.LOW),
+            _make_context("high_old", Priority.HIGH, age_days=2),
+            _make_context("high_new", Priority.HIGH, age_days=1),
+            _make_context("medium", Priority.MEDIUM),
+        ],
+        delete_ids=["work_hours", "focus_morning", "weekend_casual"],
+    )
+
+    assert [c.id for c in repository.find(actives=True)] == [
+        "high_new",
+        "high_old",
+        "medium",
+        "low",
+    ]
+    assert [c.id for c in repository.find(actives=True, limit=1)] == ["high_new"]
+    assert repository.find(actives=True, limit=0) == []
+    repository.save(_make_context("low", Priority.HIGH))
+    assert [c.id for c in repository.find(actives=True, limit=2)] == [
+        "low",
+        "high_new",
+    ]
+
+
+def test_repositories_sharing_a_file_see_each_other_writes(tmp_path: Path) -> None:
+    first = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    second = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+
+    first.save(_make_context("from_first"))
+    assert second.find_one_by_id("from_first") is not None
+
+    second.save(_make_context("from_second"))
+    second.delete_one_by_id("work_hours")
+
+    ids = {c.id for c in first.find()}
+    assert {"from_first", "from_second"} <= ids
+    assert "work_hours" not in ids
+
+
+def test_version_changes_on_mutations_from_other_processes(tmp_path: Path) -> None:
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    other = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    repository.find()
+    version = repository.version
+
+    repository.find()
+    assert repository.version == version
+
+    other.save(_make_context("new"))
+    repository.find()
+    assert repository.version > version
+
+
+def test_typed_queries_and_writes_only_touch_their_partition(tmp_path: Path) -> None:
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    focus_file = tmp_path / "temporal_contexts" / "focus_time.json"
+    work_file = tmp_path / "temporal_contexts" / "work_schedule.json"
+    work_mtime = work_file.stat().st_mtime_ns
+
+    focus_contexts = repository.find(context_type=ContextType.FOCUS_TIME)
+    repository.save(focus_contexts[0].model_copy(update={"name": "Renamed"}))
+
+    assert [c.id for c in focus_contexts] == ["focus_morning"]
+    assert not repository.partitions[ContextType.WORK_SCHEDULE].loaded
+    assert work_file.stat().st_mtime_ns == work_mtime
+    assert [item["name"] for item in json.loads(focus_file.read_text())] == [
+        "Renamed",
+    ]
+
+
+def test_save_moves_a_context_between_partitions(tmp_path: Path) -> None:
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    context = repository.find_one_by_id("focus_morning").model_copy(
+        update={"context_type": ContextType.AVAILABILITY},
+    )
+
+    repository.save(context)
+
+    assert repository.find(context_type=ContextType.FOCUS_TIME) == []
+    assert [c.id for c in repository.find(context_type=ContextType.AVAILABILITY)] == [
+        "focus_morning",
+    ]
+    assert [c.id for c in repository.find()].count("focus_morning") == 1
+
+
+def test_legacy_contexts_file_is_migrated_to_partitions(tmp_path: Path) -> None:
+    legacy_file = tmp_path / "temporal_contexts.json"
+    legacy_file.write_text(
+        json.dumps([_make_context("legacy").model_dump(mode="json")]),
+    )
+
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+
+    assert [c.id for c in repository.find()] == ["legacy"]
+    assert not legacy_file.exists()
+    assert (tmp_path / "temporal_contexts.json.migrated").exists()
+
+
+def test_invalid_records_are_quarantined_and_the_rest_loaded(tmp_path: Path) -> None:
+    TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    partition_file = tmp_path / "temporal_contexts" / "focus_time.json"
+    invalid = _make_context("invalid").model_dump(mode="json")
+    invalid["time_pattern"] = "every morning"
+    partition_file.write_text(
+        json.dumps([_make_context("valid").model_dump(mode="json"), invalid]),
+    )
+
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+
+    assert [c.id for c in repository.find(ContextType.FOCUS_TIME)] == ["valid"]
+    assert [c["id"] for c in json.loads(partition_file.read_text())] == ["valid"]
+    quarantined = tmp_path / "temporal_contexts" / "focus_time.quarantine.jsonl"
+    entries = [json.loads(line) for line in quarantined.read_text().splitlines()]
+    assert [entry["record"]["id"] for entry in entries] == ["invalid"]
+    [progress] = repository.find_load_progress()
+    assert progress.file_name == "focus_time.json"
+    assert progress.loaded == 1
+    assert progress.rejected == 1
+
+
+def test_search_follows_writes_and_other_processes(tmp_path: Path) -> None:
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    other = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+
+    repository.save(_make_context("daily_standup"))
+    other.save(_make_context("standup_review"))
+    other.delete_one_by_id("work_hours")
+
+    page = repository.search("standup")
+    assert page.total == 2
+    assert [hit.context.id for hit in page.hits] == [
+        "daily_standup",
+        "standup_review",
+    ]
+    assert repository.search("work").total == 0
+
+    repository.delete_one_by_id("daily_standup")
+    assert [hit.context.id for hit in repository.search("standup", limit=5).hits] == [
+        "standup_review",
+    ]
+
+
+def test_expired_contexts_are_moved_to_the_archive(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = get_current_datetime()
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    conference = _make_context("conference")
+    conference.expires_at = now + timedelta(hours=1)
+    sprint = _make_context("sprint")
+    sprint.valid_from = now + timedelta(hours=1)
+    repository.save(conference)
+    repository.save(sprint)
+
+    later = now + timedelta(hours=2)
+    active_ids = [c.id for c in repository.find(actives=True, at=later)]
+    assert "conference" not in active_ids
+    assert "sprint" in active_ids
+    assert repository.find_one_by_id("conference") is not None
+
+    monkeypatch.setattr(
+        "temporal_context_mcp.context_management.infrastructure."
+        "temporal_context_repository_impl.get_current_datetime",
+        lambda: later,
+    )
+    assert "conference" not in {c.id for c in repository.find()}
+    assert repository.search("conference").total == 0
+    archived = [
+        json.loads(line)
+        for line in (tmp_path / "temporal_contexts_archive.jsonl")
+        .read_text(encoding="utf-8")
+        .splitlines()
+    ]
+    assert [context["id"] for context in archived] == ["conference"]
+    other = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    assert other.find_one_by_id("conference") is None
+    assert other.find_one_by_id("sprint") is not None
+
+
+def test_reads_without_archiving_leave_out_expired_contexts_without_writing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = get_current_datetime()
+    repository = TemporalContextRepositoryImpl(data_dir=str(tmp_path))
+    conference = _make_context("conference", Priority.HIGH)
+    conference.expires_at = now + timedelta(hours=1)
+    repository.save(conference)
+
+    later = now + timedelta(hours=2)
+    monkeypatch.setattr(
+        "temporal_context_mcp.context_management.infrastructure."
+        "temporal_context_repository_impl.get_current_datetime",
+        lambda: later,
+    )
+    assert "conference" not in {c.id for c in repository.find(archive_expired=False)}
+    assert repository.find_one_by_id("conference", archive_expired=False) is None
+    assert repository.search("conference", archive_expired=False).total == 0
+    result = SimulateSchedule(repository).execute(items=[], times=[later])
+    assert "conference" not in result.moments[0].active_context_ids
+    assert not (tmp_path / "temporal_contexts_archive.jsonl").exists()
+
+    assert repository.find_one_by_id("conference") is None
+    assert (tmp_path / "temporal_contexts_archive.jsonl").exists()
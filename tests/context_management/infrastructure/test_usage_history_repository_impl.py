@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from dateutil import tz
+
+from temporal_context_mcp.context_management import UsageHistoryRepositoryImpl
+
+START = datetime(2025, 1, 6, 9, 30, tzinfo=tz.tzlocal())  # Monday
+
+
+def test_record_keeps_only_the_newest_usages(tmp_path: Path) -> None:
+    repository = UsageHistoryRepositoryImpl(data_dir=str(tmp_path), capacity=3)
+
+    for minutes in range(5):
+        repository.record("work_hours", START + timedelta(minutes=minutes))
+
+    history = repository.find_by_context_id("work_hours")
+    assert len(history) == 3
+    assert list(history) == [
+        int((START + timedelta(minutes=minutes)).timestamp()) for minutes in (2, 3, 4)
+    ]
+
+
+def test_history_file_size_is_constant_and_reloaded(tmp_path: Path) -> None:
+    repository = UsageHistoryRepositoryImpl(data_dir=str(tmp_path), capacity=4)
+    repository.record("work_hours", START)
+    history_file = tmp_path / "usage_history" / "work_hours.bin"
+    initial_size = history_file.stat().st_size
+
+    for days in range(1, 10):
+        repository.record("work_hours", START + timedelta(days=days))
+
+    assert history_file.stat().st_size == initial_size
+    reloaded = UsageHistoryRepositoryImpl(data_dir=str(tmp_path), capacity=4)
+    assert list(reloaded.find_by_context_id("work_hours")) == list(
+        repository.find_by_context_id("work_hours"),
+    )
+
+
+def test_history_aggregations(tmp_path: Path) -> None:
+    repository = UsageHistoryRepositoryImpl(data_dir=str(tmp_path), capacity=10)
+    repository.record("work_hours", START)
+    repository.record("work_hours", START + timedelta(minutes=10))
+    repository.record("work_hours", START + timedelta(days=1))
+
+    history = repository.find_by_context_id("work_hours")
+
+    assert history.uses_per_day() == {"2025-01-06": 2, "2025-01-07": 1}
+    histogram = history.hour_of_week_histogram()
+    assert histogram[1][9] == 2
+    assert histogram[2][9] == 1
+    assert sum(map(sum, histogram)) == 3
@@ -0,0 +1,60 @@
+import asyncio
+from pathlib import Path
+
+from temporal_context_mcp.core import Settings, ToolProfiler
+
+
+def _busy_function() -> int:
+    return sum(i * i for i in range(10_000))
+
+
+def _make_profiler(mock_settings: Settings, *, enabled: bool) -> ToolProfiler:
+    mock_settings.profiling_enabled = enabled
+    mock_settings.profiling_sample_rate = 1.0
+    mock_settings.profiling_dir_name = "profiles"
+    mock_settings.profiling_max_files = 2
+    return ToolProfiler(settings=mock_settings)
+
+
+def test_profile_returns_original_function_when_disabled(
+    mock_settings: Settings,
+) -> None:
+    profiler = _make_profiler(mock_settings, enabled=False)
+
+    assert profiler.profile(_busy_function) is _busy_function
+
+
+def test_profile_writes_cpu_and_allocation_results_with_rotation(
+    mock_settings: Settings,
+) -> None:
+    profiler = _make_profiler(mock_settings, enabled=True)
+    wrapped = profiler.profile(_busy_function)
+
+    for _ in range(4):
+        assert wrapped() == _busy_function()
+
+    profiles_dir = Path(mock_settings.data_dir) / "profiles"
+    assert len(list(profiles_dir.glob("*.prof"))) == 2
+    assert len(list(profiles_dir.glob("*.alloc.json"))) == 2
+
+
+def test_find_hotspots_returns_profiled_functions(
+    mock_settings: Settings,
+) -> None:
+    profiler = _make_profiler(mock_settings, enabled=True)
+    profiler.profile(_busy_function)()
+
+    hotspots = profiler.find_hotspots(limit=5, tool_name="_busy_function")
+
+    assert 0 < len(hotspots) <= 5
+    assert any(hotspot.function == "_busy_function" for hotspot in hotspots)
+
+
+def test_profile_follows_a_worker_thread(mock_settings: Settings) -> None:
+    profiler = _make_profiler(mock_settings, enabled=True)
+    wrapped = profiler.profile(_busy_function)
+
+    assert asyncio.run(asyncio.to_thread(wrapped)) == _busy_function()
+
+    hotspots = profiler.find_hotspots(limit=50, tool_name="_busy_function")
+    assert any(hotspot.function == "<genexpr>" for hotspot in hotspots)
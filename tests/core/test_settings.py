@@ -0,0 +1,15 @@
+import pytest
+from pydantic import ValidationError
+
+from temporal_context_mcp.core import Settings
+
+
+def test_settings_should_reject_an_empty_usage_history() -> None:
+    with pytest.raises(ValidationError, match="usage_history_capacity"):
+        Settings(usage_history_capacity=0)
+
+
+@pytest.mark.parametrize("sample_rate", [-0.1, 1.5])
+def test_settings_should_reject_a_sample_rate_out_of_range(sample_rate: float) -> None:
+    with pytest.raises(ValidationError, match="profiling_sample_rate"):
+        Settings(profiling_sample_rate=sample_rate)
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import anyio
+from mcp import ClientSession
+from mcp.server.lowlevel import Server
+from mcp.types import TextContent, Tool
+
+from temporal_context_mcp.core import socket_transport
+
+
+def test_socket_transport_runs_an_mcp_session_over_a_unix_socket(
+    tmp_path: Path,
+) -> None:
+    server = Server("test")
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:  # noqa: RUF029
+        return [Tool(name="ping", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict) -> list[TextContent]:  # noqa: RUF029, ARG001
+        return [TextContent(type="text", text=f"pong from {name}")]
+
+    socket_path = tmp_path / "test.sock"
+
+    async def handle_connection(stream: anyio.abc.SocketStream) -> None:
+        async with stream, socket_transport(stream) as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+
+    async def run() -> str:
+        listener = await anyio.create_unix_listener(socket_path)
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(listener.serve, handle_connection)
+            async with (
+                await anyio.connect_unix(socket_path) as stream,
+                socket_transport(stream) as (read_stream, write_stream),
+                ClientSession(read_stream, write_stream) as session,
+            ):
+                await session.initialize()
+                result = await session.call_tool("ping", {})
+            tg.cancel_scope.cancel()
+        return result.content[0].text
+
+    assert anyio.run(run) == "pong from ping"
@@ -0,0 +1,45 @@
+from temporal_context_mcp.recommendation import (
+    DetailLevel,
+    FormalityLevel,
+    Recommendation,
+    ResponseStyle,
+)
+from temporal_context_mcp.shared import ContextType, Priority
+
+
+def test_merge_unites_lists_and_weights_levels_by_priority() -> None:
+    work = Recommendation(
+        context_type=ContextType.WORK_SCHEDULE,
+        response_style=ResponseStyle.PROFESSIONAL,
+        formality_level=FormalityLevel.LOW,
+        detail_level=DetailLevel.LOW,
+        suggested_tools=["calendar", "email"],
+        avoid_topics=["sports"],
+    )
+    focus = Recommendation(
+        context_type=ContextType.FOCUS_TIME,
+        response_style=ResponseStyle.CONCISE,
+        formality_level=FormalityLevel.HIGH,
+        detail_level=DetailLevel.MEDIUM,
+        suggested_tools=["email", "tasks"],
+        avoid_topics=["news"],
+        time_sensitive=True,
+    )
+
+    merged = Recommendation.merge([(work, Priority.HIGH), (focus, Priority.LOW)])
+
+    assert merged.context_type == ContextType.WORK_SCHEDULE
+    assert merged.response_style == ResponseStyle.PROFESSIONAL
+    # (0 * 3 + 2 * 1) / 4 = 0.5, rounded towards the stricter level
+    assert merged.formality_level == FormalityLevel.MEDIUM
+    # (0 * 3 + 1 * 1) / 4 = 0.25
+    assert merged.detail_level == DetailLevel.MEDIUM
+    assert merged.suggested_tools == ["calendar", "email", "tasks"]
+    assert merged.avoid_topics == ["sports", "news"]
+    assert merged.time_sensitive
+
+
+def test_merge_of_a_single_recommendation_returns_it() -> None:
+    recommendation = Recommendation(context_type=ContextType.FOCUS_TIME)
+
+    assert Recommendation.merge([(recommendation, Priority.LOW)]) is recommendation
@@ -0,0 +1,42 @@
+from temporal_context_mcp.recommendation import (
+    DetailLevel,
+    FormalityLevel,
+    Recommendation,
+    RecommendationLayers,
+    RecommendationOverride,
+    ResponseStyle,
+)
+from temporal_context_mcp.shared import ContextType
+
+
+def test_resolve_applies_layers_from_defaults_to_tenant() -> None:
+    layers = RecommendationLayers(
+        defaults=RecommendationOverride(
+            detail_level=DetailLevel.LOW,
+            avoid_topics=["politics"],
+        ),
+        contexts={"deep_work": RecommendationOverride(suggested_tools=["timer"])},
+        tenants={"acme": RecommendationOverride(formality_level=FormalityLevel.HIGH)},
+    )
+    focus = Recommendation.model_validate(
+        {"context_type": "focus_time", "response_style": "concise"},
+    )
+
+    table = layers.resolve([focus], tenant="acme")
+
+    recommendation = table[ContextType.FOCUS_TIME, "deep_work"]
+    assert recommendation.response_style == ResponseStyle.CONCISE
+    assert recommendation.detail_level == DetailLevel.LOW
+    assert recommendation.avoid_topics == ["politics"]
+    assert recommendation.suggested_tools == ["timer"]
+    assert recommendation.formality_level == FormalityLevel.HIGH
+    assert table[ContextType.FOCUS_TIME, None].suggested_tools == []
+    assert table[ContextType.AVAILABILITY, None].detail_level == DetailLevel.LOW
+
+
+def test_resolve_without_defaults_only_has_types_with_recommendations() -> None:
+    table = RecommendationLayers().resolve(
+        [Recommendation(context_type=ContextType.FOCUS_TIME)],
+    )
+
+    assert list(table) == [(ContextType.FOCUS_TIME, None)]
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 from temporal_context_mcp.core import Settings
@@ -80,3 +81,62 @@ def test_find_by_context_types_returns_none_for_no_matches(
     result = repository.find_by_context_type(ContextType.AVAILABILITY)
 
     assert result is None
+
+
+def test_find_by_context_applies_layers_and_reloads_them_on_change(
+    mock_settings: Settings,
+) -> None:
+    mock_settings.recommendation_tenant = "acme"
+    repository = RecommendationRepositoryImpl(settings=mock_settings)
+    version = repository.version
+    layers_file = (
+        Path(mock_settings.data_dir) / mock_settings.recommendation_layers_file_name
+    )
+
+    layers_file.write_text(
+        json.dumps(
+            {
+                "contexts": {"work_hours": {"suggested_tools": ["calendar"]}},
+                "tenants": {"acme": {"time_sensitive": True}},
+            },
+        ),
+    )
+    assert repository.version > version
+    result = repository.find_by_context(ContextType.WORK_SCHEDULE, "work_hours")
+    other = repository.find_by_context(ContextType.WORK_SCHEDULE, "other")
+
+    assert result.suggested_tools == ["calendar"]
+    assert result.formality_level == FormalityLevel.HIGH
+    assert result.time_sensitive
+    assert other.suggested_tools == []
+    assert other.time_sensitive
+    assert repository.find_by_context(ContextType.AVAILABILITY, "work_hours")
+
+    layers_file.unlink()
+
+    result = repository.find_by_context(ContextType.WORK_SCHEDULE, "work_hours")
+    assert result.suggested_tools == []
+    assert repository.find_by_context(ContextType.AVAILABILITY, "work_hours") is None
+
+
+def test_find_by_context_type_resolves_defaults_the_same_after_a_reload(
+    mock_settings: Settings,
+) -> None:
+    layers_file = (
+        Path(mock_settings.data_dir) / mock_settings.recommendation_layers_file_name
+    )
+    layers_file.write_text(
+        json.dumps(
+            {"defaults": {"avoid_topics": ["news"], "detail_level": "low"}},
+        ),
+    )
+
+    created = RecommendationRepositoryImpl(settings=mock_settings)
+    reloaded = RecommendationRepositoryImpl(settings=mock_settings)
+
+    for repository in (created, reloaded):
+        result = repository.find_by_context_type(ContextType.WORK_SCHEDULE)
+        assert result.avoid_topics == ["news"]
+        assert result.detail_level == DetailLevel.LOW
+        assert result.formality_level == FormalityLevel.HIGH
+    assert reloaded.table == created.table
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from dateutil import tz
+from pydantic import ValidationError
+
+from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.shared import ContextType, TimePattern, TimePatternUtils
+from temporal_context_mcp.shared.application.recurrence_window import (
+    RecurrenceWindow,
+)
+
+EVERY_OTHER_TUESDAY = "DTSTART:20250107T090000\nRRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=TU"
+
+
+def test_contains_matches_occurrence_intervals() -> None:
+    window = RecurrenceWindow(EVERY_OTHER_TUESDAY, timedelta(minutes=60))
+
+    assert window.contains(datetime(2025, 1, 7, 9, 30))
+    assert not window.contains(datetime(2025, 1, 7, 10, 0))
+    assert not window.contains(datetime(2025, 1, 14, 9, 30))
+    assert window.contains(datetime(2025, 1, 21, 9, 0))
+
+
+def test_contains_extends_the_window_as_time_advances() -> None:
+    window = RecurrenceWindow(EVERY_OTHER_TUESDAY, timedelta(minutes=60))
+    window.contains(datetime(2025, 1, 7, 9, 30))
+    first_window_end = window.window_end
+
+    assert window.contains(datetime(2025, 3, 4, 9, 30))
+    assert window.window_end > first_window_end
+    assert all(start >= datetime(2025, 3, 4, 8, 30) for start in window.starts)
+    assert window.contains(datetime(2025, 1, 21, 9, 15))
+
+
+def test_contains_rebuilds_the_window_after_a_long_gap() -> None:
+    window = RecurrenceWindow(EVERY_OTHER_TUESDAY, timedelta(minutes=60))
+    window.contains(datetime(2025, 1, 7, 9, 30))
+    target = datetime(2035, 1, 9, 9, 30)
+
+    with patch.object(window.rule, "between", wraps=window.rule.between) as between:
+        assert window.contains(target)
+
+    # Only the occurrences around the target are expanded, not the ten years
+    between.assert_called_once()
+    assert between.call_args.args[0] == target - timedelta(minutes=60)
+    assert window.window_start == target - timedelta(minutes=60)
+
+
+def test_contains_handles_bounded_series_and_aware_targets() -> None:
+    last_friday = RecurrenceWindow(
+        "DTSTART:20250101T170000\nRRULE:FREQ=MONTHLY;BYDAY=-1FR;COUNT=2",
+        timedelta(minutes=30),
+    )
+
+    assert last_friday.contains(datetime(2025, 1, 31, 17, 10, tzinfo=tz.tzlocal()))
+    assert last_friday.contains(datetime(2025, 2, 28, 17, 10))
+    assert not last_friday.contains(datetime(2025, 3, 28, 17, 10))
+
+
+def test_time_pattern_utils_uses_recurrence() -> None:
+    utils = TimePatternUtils(
+        TimePattern(rrule=EVERY_OTHER_TUESDAY, duration_minutes=90),
+    )
+
+    assert utils.is_time_match(datetime(2025, 1, 7, 10, 15))
+    assert not utils.is_time_match(datetime(2025, 1, 14, 10, 15))
+    assert "Recurrence" in utils.generate_description()
+
+
+def test_time_pattern_rejects_invalid_rrule() -> None:
+    with pytest.raises(ValidationError):
+        TimePattern(rrule="RRULE:FREQ=SOMETIMES")
+
+
+def test_contexts_pin_a_recurrence_without_dtstart_to_their_creation_day() -> None:
+    context = TemporalContext(
+        id="one_on_one",
+        name="One on one",
+        context_type=ContextType.AVAILABILITY,
+        time_pattern=TimePattern(rrule="RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=TU"),
+        created_at=datetime(2025, 1, 7, 15, 30, tzinfo=tz.tzlocal()),
+    )
+    reloaded = TemporalContext.model_validate(context.model_dump(mode="json"))
+
+    assert context.time_pattern.rrule.startswith("DTSTART:20250107T000000\n")
+    assert reloaded.time_pattern == context.time_pattern
+    # Matchers built on any day keep the parity of the stored series
+    utils = TimePatternUtils(reloaded.time_pattern)
+    assert utils.is_time_match(datetime(2025, 1, 21, 0, 30))
+    assert not utils.is_time_match(datetime(2025, 1, 28, 0, 30))
@@ -0,0 +1,65 @@
+from datetime import date, datetime, timedelta
+
+from temporal_context_mcp.shared import DateOrdinalSet, TimePattern, TimePatternUtils
+
+HOLIDAYS = DateOrdinalSet(
+    dates=[date(2025, 1, 1), date(2025, 12, 25)],
+    ranges=[(date(2025, 8, 1), date(2025, 8, 15))],
+)
+
+
+def test_date_ordinal_set_merges_and_looks_up_ranges() -> None:
+    dates = DateOrdinalSet(
+        dates=[date(2025, 1, 3)],
+        ranges=[
+            (date(2025, 1, 1), date(2025, 1, 2)),
+            (date(2025, 1, 10), date(2025, 1, 5)),
+        ],
+    )
+
+    assert dates.starts == [date(2025, 1, 1).toordinal(), date(2025, 1, 5).toordinal()]
+    assert len(dates) == 9
+    assert date(2025, 1, 3) in dates
+    assert date(2025, 1, 4) not in dates
+    assert date(2025, 1, 10) in dates
+    assert date(2024, 12, 31) not in dates
+
+
+def test_is_time_match_with_specific_dates() -> None:
+    utils = TimePatternUtils(TimePattern(specific_dates=["2025-03-14", "invalid"]))
+
+    assert utils.is_time_match(datetime(2025, 3, 14, 12))
+    assert not utils.is_time_match(datetime(2025, 3, 15, 12))
+
+
+def test_is_time_match_with_included_and_excluded_calendars() -> None:
+    calendars = {"holidays": HOLIDAYS}
+    on_holidays = TimePatternUtils(
+        TimePattern(include_calendars=["holidays"]),
+        calendars,
+    )
+    off_holidays = TimePatternUtils(
+        TimePattern(days_of_week=[1, 2, 3, 4, 5], exclude_calendars=["holidays"]),
+        calendars,
+    )
+
+    assert on_holidays.is_time_match(datetime(2025, 8, 10, 9))
+    assert not on_holidays.is_time_match(datetime(2025, 8, 16, 9))
+    assert not off_holidays.is_time_match(datetime(2025, 1, 1, 9))
+    assert off_holidays.is_time_match(datetime(2025, 1, 2, 9))
+
+
+def test_is_time_match_with_unknown_included_calendar_never_matches() -> None:
+    utils = TimePatternUtils(TimePattern(include_calendars=["missing"]), {})
+
+    assert not utils.is_time_match(datetime(2025, 1, 1, 9))
+
+
+def test_large_calendar_lookup_stays_correct() -> None:
+    start = date(2000, 1, 1)
+    calendar = DateOrdinalSet(
+        dates=[start + timedelta(days=2 * i) for i in range(5000)],
+    )
+
+    assert start + timedelta(days=4000) in calendar
+    assert start + timedelta(days=4001) not in calendar
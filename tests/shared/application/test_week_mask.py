@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+import pytest
+from dateutil import tz
+
+from temporal_context_mcp.shared import TimePattern, TimePatternUtils
+from temporal_context_mcp.shared.application.week_mask import (
+    MINUTES_IN_WEEK,
+    PROBE_SECOND,
+    compile_week_mask,
+    get_week_start,
+)
+
+WEEK_START = datetime(2025, 8, 3, tzinfo=tz.tzlocal())  # Sunday
+
+
+def test_get_week_start_returns_previous_sunday_midnight() -> None:
+    at = datetime(2025, 8, 6, 15, 30, tzinfo=tz.tzlocal())
+
+    assert get_week_start(at) == WEEK_START
+    assert get_week_start(WEEK_START) == WEEK_START
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        TimePattern(days_of_week=[1, 2, 3, 4, 5], hour_range=(9, 17)),
+        TimePattern(hours=[8, 20], specific_dates=["2025-08-05"]),
+        TimePattern(cron_pattern="*/15 9-17 * * 1-5"),
+        TimePattern(cron_pattern="0 0 4 * 0"),
+        TimePattern(cron_pattern="0 9 * * 2#1"),
+        TimePattern(
+            rrule="DTSTART:20250101T233000\nRRULE:FREQ=DAILY;INTERVAL=2",
+            duration_minutes=45,
+        ),
+    ],
+)
+def test_compile_week_mask_agrees_with_is_time_match(pattern: TimePattern) -> None:
+    matcher = TimePatternUtils(pattern)
+
+    mask = compile_week_mask(TimePatternUtils(pattern), WEEK_START)
+
+    # Every 7th minute plus both sides of each matched one, as cron is slow
+    minutes = set(range(0, MINUTES_IN_WEEK, 7))
+    for minute in mask.nonzero()[0].tolist():
+        minutes.update((minute - 1, minute, minute + 1))
+    minutes = sorted(minute for minute in minutes if 0 <= minute < MINUTES_IN_WEEK)
+    assert [bool(mask[minute]) for minute in minutes] == [
+        matcher.is_time_match(
+            WEEK_START + timedelta(minutes=minute, seconds=PROBE_SECOND),
+        )
+        for minute in minutes
+    ]
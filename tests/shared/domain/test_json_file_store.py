@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from temporal_context_mcp.shared import JsonFileStore
+
+
+def test_has_changed_detects_writes_from_another_store(tmp_path: Path) -> None:
+    file_path = tmp_path / "data.json"
+    first = JsonFileStore(file_path)
+    second = JsonFileStore(file_path)
+
+    first.write([1])
+    assert not first.has_changed()
+    assert second.has_changed()
+    assert second.read() == [1]
+    assert not second.has_changed()
+
+    second.write([1, 2])
+    assert first.has_changed()
+    assert first.read() == [1, 2]
+
+
+def test_write_replaces_file_without_leaving_temporary_files(tmp_path: Path) -> None:
+    store = JsonFileStore(tmp_path / "data.json")
+
+    with store.lock(), store.lock():
+        store.write({"a": 1})
+        store.write({"a": 2})
+
+    assert store.read() == {"a": 2}
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "data.json",
+        "data.json.lock",
+    ]
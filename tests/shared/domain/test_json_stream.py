@@ -0,0 +1,56 @@
+import io
+import json
+
+import pytest
+
+from temporal_context_mcp.shared.domain.utils.json_stream import JsonArrayReader
+
+ITEMS = [{"id": i, "name": "é" * i, "values": [1.5, None, True]} for i in range(50)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_reader_returns_every_item_whatever_the_chunk_size(chunk_size: int) -> None:
+    raw = json.dumps([*ITEMS, 12345, "text", []], indent=2).encode()
+
+    reader = JsonArrayReader(io.BytesIO(raw), chunk_size=chunk_size)
+    raw_reader = JsonArrayReader(io.BytesIO(raw), raw=True, chunk_size=chunk_size)
+
+    assert list(reader) == [*ITEMS, 12345, "text", []]
+    assert [json.loads(item) for item in raw_reader] == [*ITEMS, 12345, "text", []]
+    assert reader.bytes_read == len(raw)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 33))
+def test_reader_reads_numbers_cut_anywhere_by_a_chunk(chunk_size: int) -> None:
+    items = [-1.5e10, 1, 2.25, 3e-7, -4.5e12, 0, 67890, [1.5e2, -0.5], {"n": 1e3}]
+    raw = json.dumps(items).encode()
+
+    assert list(JsonArrayReader(io.BytesIO(raw), chunk_size=chunk_size)) == items
+    assert (
+        list(
+            JsonArrayReader(io.BytesIO(raw.replace(b" ", b"")), chunk_size=chunk_size),
+        )
+        == items
+    )
+
+
+@pytest.mark.parametrize(
+    ("raw", "valid_items"),
+    [
+        (b"", []),
+        (b"{}", []),
+        (b"[1, 2", [1, 2]),
+        (b"[1 2]", [1]),
+        (b'[{"a": 1}, {"a"', [{"a": 1}]),
+    ],
+)
+def test_reader_raises_on_invalid_json_after_the_valid_items(
+    raw: bytes,
+    valid_items: list,
+) -> None:
+    items = []
+
+    with pytest.raises(json.JSONDecodeError):
+        items.extend(JsonArrayReader(io.BytesIO(raw), chunk_size=2))
+
+    assert items == valid_items
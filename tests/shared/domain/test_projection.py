@@ -0,0 +1,92 @@
+from datetime import datetime
+
+import pytest
+
+from temporal_context_mcp.context_management.application.dto import (
+    TemporalContextResultDto,
+)
+from temporal_context_mcp.context_management.domain import TemporalContext
+from temporal_context_mcp.shared import ContextType, TimePattern, get_projection
+
+RESULT = TemporalContextResultDto(
+    id="work_hours",
+    name="Work Schedule",
+    time_pattern=TimePattern(days_of_week=[1, 2, 3, 4, 5], hour_range=(9, 17)),
+    recommendation={"response_style": "professional", "detail_level": "high"},
+    version=7,
+)
+
+
+def test_projection_should_only_dump_the_selected_fields() -> None:
+    projection = get_projection(
+        TemporalContextResultDto,
+        ["id", "time_pattern.hour_range", "recommendation.response_style"],
+    )
+
+    assert projection.dump(RESULT).model_dump() == {
+        "id": "work_hours",
+        "time_pattern": {"hour_range": [9, 17]},
+        "recommendation": {"response_style": "professional"},
+    }
+
+
+def test_projection_should_prefer_a_whole_field_over_paths_into_it() -> None:
+    projection = get_projection(
+        TemporalContextResultDto,
+        ["recommendation.detail_level", "recommendation"],
+    )
+
+    assert projection.dump(RESULT).model_dump() == {
+        "recommendation": RESULT.recommendation,
+    }
+
+
+def test_compact_projection_should_only_leave_out_nulls_and_empty_values() -> None:
+    projection = get_projection(TemporalContextResultDto, compact=True)
+
+    assert projection.dump(RESULT).model_dump() == {
+        "id": "work_hours",
+        "name": "Work Schedule",
+        "context_type": "focus_time",
+        "time_pattern": {"days_of_week": [1, 2, 3, 4, 5], "hour_range": [9, 17]},
+        "priority": 1,
+        "recommendation": RESULT.recommendation,
+        "version": 7,
+    }
+
+
+def test_projection_should_take_the_fields_an_entity_lacks_as_extras() -> None:
+    context = TemporalContext(
+        id="focus_morning",
+        name="Morning Focus",
+        context_type=ContextType.FOCUS_TIME,
+        time_pattern=TimePattern(hour_range=(8, 11)),
+        created_at=datetime(2026, 1, 1),
+    )
+    projection = get_projection(
+        TemporalContextResultDto,
+        ["id", "context_type", "recommendation", "version"],
+        compact=True,
+    )
+
+    assert projection.dump(
+        context,
+        recommendation={"response_style": "concise", "avoid_topics": [], "x": None},
+        version=None,
+    ).model_dump() == {
+        "id": "focus_morning",
+        "context_type": "focus_time",
+        "recommendation": {"response_style": "concise"},
+    }
+
+
+def test_projection_should_be_built_once_per_field_set() -> None:
+    assert get_projection(TemporalContextResultDto, ["id", "name"]) is get_projection(
+        TemporalContextResultDto,
+        ["name", "id"],
+    )
+
+
+def test_projection_should_reject_unknown_fields() -> None:
+    with pytest.raises(ValueError, match=r"time_pattern\.minutes"):
+        get_projection(TemporalContextResultDto, ["time_pattern.minutes"])
@@ -0,0 +1,41 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from temporal_context_mcp.shared import SingleFlight
+
+
+def test_run_coalesces_concurrent_calls_with_the_same_key() -> None:
+    single_flight = SingleFlight()
+    started = threading.Event()
+    executions = []
+
+    def resolve() -> str:
+        executions.append(1)
+        started.set()
+        time.sleep(0.1)
+        return "work_hours"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(single_flight.run, "current", resolve)
+        started.wait()
+        followers = [
+            executor.submit(single_flight.run, "current", resolve) for _ in range(7)
+        ]
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert results == ["work_hours"] * 8
+    assert len(executions) == 1
+
+
+def test_run_shares_exceptions_and_releases_the_key() -> None:
+    single_flight = SingleFlight()
+
+    def fail() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        single_flight.run("current", fail)
+    assert single_flight.run("current", lambda: 1) == 1
@@ -0,0 +1,47 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from temporal_context_mcp import load_test
+from temporal_context_mcp.core import settings
+
+
+def test_parse_mix_reads_weights_and_rejects_unknown_tools() -> None:
+    assert load_test.parse_mix("get_current_context=3, list_contexts") == {
+        "get_current_context": 3.0,
+        "list_contexts": 1.0,
+    }
+    with pytest.raises(ValueError, match="Unknown tool"):
+        load_test.parse_mix("drop_everything=1")
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert load_test.percentile(values, 50) == 50.0
+    assert load_test.percentile(values, 99) == 99.0
+    assert load_test.percentile([7.0], 95) == 7.0
+    assert load_test.percentile([], 95) == 0.0
+
+
+def test_run_load_test_drives_the_server_with_concurrent_agents(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+
+    report = asyncio.run(
+        load_test.run_load_test(
+            agents=2,
+            duration_seconds=0.3,
+            mix={"get_current_context": 2, "save_contexts_bulk": 1},
+            seed=1,
+        ),
+    )
+
+    assert report.total.calls > 0
+    assert report.total.errors == 0
+    assert sum(stats.calls for stats in report.operations) == report.total.calls
+    assert set(report.total.latency_ms) == {"p50", "p95", "p99"}
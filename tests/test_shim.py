@@ -0,0 +1,89 @@
+import os
+import socket
+import stat
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+import pytest
+
+from temporal_context_mcp import shim
+from temporal_context_mcp.core import Settings
+
+
+def test_shim_imports_only_the_standard_library() -> None:
+    code = (
+        "import sys, temporal_context_mcp.shim; "
+        "print(sorted({m.split('.')[0] for m in sys.modules} & "
+        "{'anyio', 'croniter', 'mcp', 'pydantic', 'pydantic_settings'}))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_connect_uses_a_running_daemon(tmp_path: Path) -> None:
+    socket_path = tmp_path / "daemon.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_path))
+        listener.listen()
+
+        with shim.connect(socket_path) as client:
+            connection, _ = listener.accept()
+            with connection:
+                client.sendall(b"{}\n")
+                assert connection.recv(16) == b"{}\n"
+
+
+def test_runtime_dir_is_private(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.delenv("DAEMON_SOCKET_PATH", raising=False)
+
+    socket_path = shim.get_socket_path()
+    socket_path.parent.chmod(0o755)
+    shim.get_socket_path()
+
+    assert socket_path == tmp_path / "temporal-context-mcp" / "daemon.sock"
+    assert stat.S_IMODE(socket_path.parent.stat().st_mode) == 0o700
+
+
+def test_connect_refuses_a_socket_of_another_user(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    socket_path = tmp_path / "daemon.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_path))
+        listener.listen()
+        monkeypatch.setattr(shim.os, "getuid", lambda: os.stat(socket_path).st_uid + 1)
+        monkeypatch.setattr(
+            shim,
+            "_start_daemon",
+            lambda _: pytest.fail("started a daemon next to a foreign socket"),
+        )
+
+        with pytest.raises(PermissionError, match="owned by the current user"):
+            shim.connect(socket_path)
+
+
+def test_socket_path_is_read_like_the_settings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DAEMON_SOCKET_PATH", raising=False)
+    (tmp_path / ".env").write_text(
+        'DATA_DIR="data"\nDAEMON_SOCKET_PATH="/run/custom/daemon.sock"\n',
+        encoding="utf-8",
+    )
+
+    assert shim.get_socket_path() == Path(Settings().daemon_socket_path)
+    assert shim.get_socket_path() == Path("/run/custom/daemon.sock")